@@ -2,6 +2,7 @@
 Base agent interface for mobile automation.
 """
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from typing import Any
@@ -40,6 +41,14 @@ class BaseAgent(ABC):
         """Generate the next action based on current observation."""
         raise NotImplementedError("predict method is not implemented")
 
+    async def predict_async(self, observation: dict[str, Any]) -> tuple[str, JSONAction]:
+        """Coroutine variant of `predict` used by the asyncio runner.
+
+        Runs `predict` in the event loop's default executor; agents with an async
+        LLM client can override it to avoid the worker thread.
+        """
+        return await asyncio.to_thread(self.predict, observation)
+
     def done(self) -> None:
         """finalize the agent for the current task."""
         logger.debug(f"finalizing the agent for the current task: {self.instruction}")
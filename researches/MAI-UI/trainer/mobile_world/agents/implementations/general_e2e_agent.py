@@ -5,7 +5,7 @@ from typing import Any
 from loguru import logger
 
 from mobile_world.agents.base import MCPAgent
-from mobile_world.agents.utils.helpers import pil_to_base64
+from mobile_world.agents.utils.helpers import EncodedImageCache, ImageEncodeConfig
 from mobile_world.agents.utils.prompts import GENERAL_E2E_PROMPT_TEMPLATE
 from mobile_world.runtime.utils.helpers import pretty_print_messages
 from mobile_world.runtime.utils.models import JSONAction
@@ -224,6 +224,7 @@ class GeneralE2EAgentMCP(MCPAgent):
         logger.debug(f"Agent base_url={self.llm_base_url} model={self.model_name}")
 
         self.history_n_images = self.runtime_conf.pop("history_n_images", 3)
+        self.image_cache = EncodedImageCache(ImageEncodeConfig.from_runtime_conf(self.runtime_conf))
         self.history_images = []
         self.history_responses = []
         self.actions = []
@@ -272,9 +273,9 @@ class GeneralE2EAgentMCP(MCPAgent):
                 and messages[reverse_i]["content"][0]["type"] == "image_url"
             ):
                 if num_images_used < self.history_n_images:
-                    encoded_string = pil_to_base64(messages[reverse_i]["content"][0]["image_url"])
+                    image = messages[reverse_i]["content"][0]["image_url"]
                     messages[reverse_i]["content"][0]["image_url"] = {
-                        "url": f"data:image/png;base64,{encoded_string}"
+                        "url": self.image_cache.data_url(image)
                     }
                     num_images_used += 1
                 else:
@@ -402,6 +403,7 @@ class GeneralE2EAgentMCP(MCPAgent):
     def reset(self):
         """Reset the agent for the next task."""
         self.history_images = []
+        self.image_cache.clear()
         self.history_responses = []
         self.actions = []
         logger.debug("Agent reset completed")
@@ -7,7 +7,7 @@ from loguru import logger
 from PIL import Image
 
 from mobile_world.agents.base import MCPAgent
-from mobile_world.agents.utils.helpers import pil_to_base64
+from mobile_world.agents.utils.helpers import EncodedImageCache, ImageEncodeConfig
 from mobile_world.agents.utils.prompts import MAI_MOBILE_SYS_PROMPT_ASK_USER_MCP
 from mobile_world.runtime.utils.helpers import pretty_print_messages
 from mobile_world.runtime.utils.models import (
@@ -152,6 +152,9 @@ class MAIUINaivigationAgent(MCPAgent):
         self.max_tokens = self.runtime_conf["max_tokens"]
         self.history_n = self.runtime_conf["history_n"]
 
+        # Encoded screenshots, so each history frame is encoded only once per episode
+        self.image_cache = EncodedImageCache(ImageEncodeConfig.from_runtime_conf(self.runtime_conf))
+
         # History tracking
         self.history_images: list[
             tuple[Any, Any, Any]
@@ -186,13 +189,12 @@ class MAIUINaivigationAgent(MCPAgent):
                 "content": [{"type": "text", "text": ask_user_response_res}],
             }
         else:
-            encoded_string = pil_to_base64(img_data)
             return {
                 "role": "user",
                 "content": [
                     {
                         "type": "image_url",
-                        "image_url": {"url": f"data:image/png;base64,{encoded_string}"},
+                        "image_url": {"url": self.image_cache.data_url(img_data)},
                     }
                 ],
             }
@@ -394,5 +396,6 @@ class MAIUINaivigationAgent(MCPAgent):
     def reset(self) -> None:
         """Reset the agent for the next task."""
         self.history_images = []
+        self.image_cache.clear()
         self.history_responses = []
         logger.debug("MAI UI agent reset completed")
@@ -6,7 +6,7 @@ from loguru import logger
 
 from mobile_world.agents.base import MCPAgent
 from mobile_world.agents.grounding import GROUNDING_MODELS
-from mobile_world.agents.utils.helpers import pil_to_base64
+from mobile_world.agents.utils.helpers import EncodedImageCache, ImageEncodeConfig
 from mobile_world.agents.utils.prompts import PLANNER_EXECUTOR_PROMPT_TEMPLATE
 from mobile_world.runtime.utils.helpers import pretty_print_messages
 from mobile_world.runtime.utils.models import JSONAction
@@ -173,6 +173,7 @@ class PlannerExecutorAgentMCP(MCPAgent):
             raise ValueError("Executor agent instance creation failed")
 
         self.history_n_images = self.runtime_conf.pop("history_n_images", 3)
+        self.image_cache = EncodedImageCache(ImageEncodeConfig.from_runtime_conf(self.runtime_conf))
         self.history_images = []
         self.history_responses = []
         self.actions = []
@@ -222,9 +223,9 @@ class PlannerExecutorAgentMCP(MCPAgent):
                 and messages[reverse_i]["content"][0]["type"] == "image_url"
             ):
                 if num_images_used < self.history_n_images:
-                    encoded_string = pil_to_base64(messages[reverse_i]["content"][0]["image_url"])
+                    image = messages[reverse_i]["content"][0]["image_url"]
                     messages[reverse_i]["content"][0]["image_url"] = {
-                        "url": f"data:image/png;base64,{encoded_string}"
+                        "url": self.image_cache.data_url(image)
                     }
                     num_images_used += 1
                 else:
@@ -403,6 +404,7 @@ class PlannerExecutorAgentMCP(MCPAgent):
     def reset(self):
         """Reset the agent for the next task."""
         self.history_images = []
+        self.image_cache.clear()
         self.history_responses = []
         self.actions = []
         self.plans = []
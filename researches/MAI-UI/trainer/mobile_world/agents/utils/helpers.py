@@ -3,8 +3,11 @@ Helper utilities for agent implementations.
 """
 
 import base64
+import hashlib
 import math
+from dataclasses import dataclass
 from io import BytesIO
+from typing import Any
 
 from PIL import Image
 
@@ -23,6 +26,108 @@ def pil_to_base64(image) -> str:
     return base64.b64encode(buffer.getvalue()).decode("utf-8")
 
 
+@dataclass
+class ImageEncodeConfig:
+    """How agent screenshots are encoded into data URLs for the LLM request.
+
+    Attributes:
+        format: PIL format name, one of PNG, JPEG or WEBP
+        quality: JPEG/WebP quality, ignored for PNG
+        resize: Downscale with `smart_resize` before encoding
+        min_pixels: Lower pixel bound passed to `smart_resize`
+        max_pixels: Upper pixel bound passed to `smart_resize`
+    """
+
+    format: str = "PNG"
+    quality: int = 90
+    resize: bool = False
+    min_pixels: int = MIN_PIXELS
+    max_pixels: int = MAX_PIXELS
+
+    @classmethod
+    def from_runtime_conf(cls, runtime_conf: dict[str, Any]) -> "ImageEncodeConfig":
+        """Pop the `image_*` keys out of an agent runtime_conf.
+
+        The keys are popped so that runtime_conf can still be forwarded to the
+        OpenAI client as sampling kwargs.
+        """
+        config = cls()
+        for key in ("format", "quality", "resize", "min_pixels", "max_pixels"):
+            conf_key = f"image_{key}"
+            if conf_key in runtime_conf:
+                setattr(config, key, runtime_conf.pop(conf_key))
+        config.format = config.format.upper()
+        if config.format == "JPG":
+            config.format = "JPEG"
+        if config.format not in ("PNG", "JPEG", "WEBP"):
+            raise ValueError(f"Unsupported image format: {config.format}")
+        return config
+
+
+def encode_image(image, config: ImageEncodeConfig) -> str:
+    """Encode a PIL image (or raw image bytes) into a base64 data URL."""
+    if not isinstance(image, Image.Image):
+        image = Image.open(BytesIO(image)).convert("RGB")
+    if config.resize:
+        height, width = smart_resize(
+            image.height,
+            image.width,
+            min_pixels=config.min_pixels,
+            max_pixels=config.max_pixels,
+        )
+        if (width, height) != image.size:
+            image = image.resize((width, height), Image.Resampling.BICUBIC)
+    buffer = BytesIO()
+    if config.format == "PNG":
+        image.save(buffer, format="PNG")
+    elif config.format == "JPEG":
+        image.convert("RGB").save(buffer, format="JPEG", quality=config.quality)
+    else:
+        image.save(buffer, format="WEBP", quality=config.quality)
+    encoded = base64.b64encode(buffer.getvalue()).decode("utf-8")
+    return f"data:image/{config.format.lower()};base64,{encoded}"
+
+
+class EncodedImageCache:
+    """Per-episode cache of encoded data URLs, so each frame is encoded exactly once.
+
+    PIL images are keyed by identity (the cache keeps a reference, so the id cannot
+    be recycled while the entry lives); raw bytes are keyed by content hash.
+    """
+
+    def __init__(self, config: ImageEncodeConfig | None = None):
+        self.config = config or ImageEncodeConfig()
+        self._entries: dict[Any, tuple[Any, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, image) -> Any:
+        if isinstance(image, bytes | bytearray):
+            return hashlib.blake2b(image, digest_size=16).hexdigest()
+        return id(image)
+
+    def data_url(self, image) -> str:
+        """Return the data URL for `image`, encoding it on first use."""
+        key = self._key(image)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        url = encode_image(image, self.config)
+        self._entries[key] = (image, url)
+        return url
+
+    def clear(self) -> None:
+        """Drop all cached encodings, called when the agent is reset."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def judge_scroll_direction(start_x: float, start_y: float, end_x: float, end_y: float) -> str:
     """Determine scroll direction from start to end coordinates."""
     delta_x = end_x - start_x
@@ -43,6 +43,7 @@ from mobile_world.core.api import (
     get_task_statistics,
     is_port_available,
     launch_container,
+    launch_container_configs,
     launch_containers,
     list_agents,
     list_apps,
@@ -86,6 +87,7 @@ __all__ = [
     "wait_for_container_ready",
     "build_container_config",
     "launch_container",
+    "launch_container_configs",
     "launch_containers",
     "list_containers",
     "get_container_info",
@@ -40,6 +40,7 @@ from mobile_world.core.api.env import (
     get_container_info,
     is_port_available,
     launch_container,
+    launch_container_configs,
     launch_containers,
     list_containers,
     remove_container,
@@ -105,6 +106,7 @@ __all__ = [
     "wait_for_container_ready",
     "build_container_config",
     "launch_container",
+    "launch_container_configs",
     "launch_containers",
     "list_containers",
     "get_container_info",
@@ -9,7 +9,10 @@ import os
 import shutil
 import socket
 import subprocess
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -35,6 +38,9 @@ from mobile_world.runtime.utils.models import (
     PrerequisiteCheckResults,
 )
 
+# Emulators cold-booting at the same time compete for KVM and disk IO
+DEFAULT_MAX_PARALLEL_LAUNCHES = 4
+
 
 def is_port_available(port: int, host: str = "0.0.0.0") -> bool:
     """Check if a port is available for binding.
@@ -148,24 +154,85 @@ def wait_for_container_ready(
     Returns:
         True if container becomes ready, False if timeout
     """
-    health_url = f"http://localhost:{backend_port}/health"
     start_time = time.time()
 
     while time.time() - start_time < timeout:
-        try:
-            response = requests.get(health_url, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("ok", False):
-                    return True
-        except (requests.ConnectionError, requests.Timeout, requests.RequestException):
-            pass
-
+        if _is_container_healthy(backend_port):
+            return True
         time.sleep(poll_interval)
 
     return False
 
 
+def _is_container_healthy(
+    backend_port: int, session: requests.Session | None = None, timeout: float = 5
+) -> bool:
+    """Check the health endpoint of a container once."""
+    try:
+        response = (session or requests).get(
+            f"http://localhost:{backend_port}/health", timeout=timeout
+        )
+        if response.status_code == 200:
+            return bool(response.json().get("ok", False))
+    except (requests.RequestException, ValueError):
+        pass
+    return False
+
+
+class _ReadinessPoller:
+    """Polls the health endpoints of all launching containers from a single thread.
+
+    Containers are registered with `wait()`, which blocks until the container reports
+    healthy or its own timeout expires. One pass over all registered containers is made
+    every `poll_interval` seconds over a shared HTTP session.
+    """
+
+    def __init__(self, poll_interval: float = 2.0):
+        self.poll_interval = poll_interval
+        self._pending: dict[str, tuple[int, float, threading.Event, list[bool]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._session = requests.Session()
+        self._thread: threading.Thread | None = None
+
+    def wait(self, name: str, backend_port: int, timeout: float) -> bool:
+        """Block until container `name` is healthy; False if `timeout` expires first."""
+        done, outcome = threading.Event(), [False]
+        with self._lock:
+            self._pending[name] = (backend_port, time.monotonic() + timeout, done, outcome)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="container-readiness", daemon=True
+                )
+                self._thread.start()
+        done.wait()
+        return outcome[0]
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self._lock:
+                pending = list(self._pending.items())
+            for name, (backend_port, deadline, done, outcome) in pending:
+                healthy = _is_container_healthy(backend_port, self._session, timeout=2)
+                if healthy or time.monotonic() >= deadline:
+                    outcome[0] = healthy
+                    with self._lock:
+                        self._pending.pop(name, None)
+                    done.set()
+            self._stop.wait(self.poll_interval)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            # release waiters that registered after the last pass
+            for _, _, done, _ in self._pending.values():
+                done.set()
+            self._pending.clear()
+        self._session.close()
+
+
 def build_container_config(
     name_prefix: str = DEFAULT_NAME_PREFIX,
     image: str = DEFAULT_IMAGE,
@@ -304,6 +371,8 @@ def launch_containers(
     launch_interval: int = 10,
     wait_ready: bool = True,
     ready_timeout: int = 600,
+    max_parallel: int = DEFAULT_MAX_PARALLEL_LAUNCHES,
+    max_retries: int = 1,
 ) -> list[LaunchResult]:
     """Launch multiple Docker containers.
 
@@ -319,9 +388,11 @@ def launch_containers(
         enable_vnc: Enable VNC
         env_file_path: Path to .env file
         dev_src_path: Path to src directory for dev mode
-        launch_interval: Seconds between launching containers
+        launch_interval: Minimum seconds between two `docker run` calls
         wait_ready: Wait for containers to become ready
         ready_timeout: Timeout for readiness check
+        max_parallel: Maximum number of containers booting at the same time
+        max_retries: Times a container that fails to launch or become ready is recreated
 
     Returns:
         List of LaunchResult objects
@@ -332,16 +403,16 @@ def launch_containers(
     if dev_mode and count > 1:
         raise ValueError("Dev mode only supports launching a single container")
 
-    port_sets = find_available_ports(backend_start_port, viewer_start_port, vnc_start_port, adb_start_port, count)
+    port_sets = find_available_ports(
+        backend_start_port, viewer_start_port, vnc_start_port, adb_start_port, count
+    )
 
     if len(port_sets) < count:
         logger.warning(f"Could only find {len(port_sets)} available port sets out of {count}")
 
     start_index = find_next_container_index(name_prefix, dev_mode)
-    results = []
-
-    for i, (backend, viewer, vnc, adb) in enumerate(port_sets):
-        config = ContainerConfig(
+    configs = [
+        ContainerConfig(
             name=f"{name_prefix}_{start_index + i}{'_dev' if dev_mode else ''}",
             backend_port=backend,
             viewer_port=viewer,
@@ -353,20 +424,167 @@ def launch_containers(
             env_file_path=env_file_path,
             dev_src_path=dev_src_path,
         )
+        for i, (backend, viewer, vnc, adb) in enumerate(port_sets)
+    ]
+
+    return launch_container_configs(
+        configs,
+        max_parallel=max_parallel,
+        launch_interval=launch_interval,
+        wait_ready=wait_ready,
+        ready_timeout=ready_timeout,
+        max_retries=max_retries,
+    )
 
-        result = launch_container(
-            config,
-            wait_ready=wait_ready,
-            ready_timeout=ready_timeout,
-        )
-        results.append(result)
 
-        if launch_interval > 0 and i < len(port_sets) - 1:
-            time.sleep(launch_interval)
+def launch_container_configs(
+    configs: list[ContainerConfig],
+    max_parallel: int = DEFAULT_MAX_PARALLEL_LAUNCHES,
+    launch_interval: float = 10,
+    wait_ready: bool = True,
+    ready_timeout: int = 600,
+    max_retries: int = 1,
+    poll_interval: float = 2.0,
+    on_progress: Callable[[str, LaunchResult], None] | None = None,
+) -> list[LaunchResult]:
+    """Launch containers concurrently and wait for them to become ready.
 
+    At most `max_parallel` containers are booting at any time; a slot is freed once a
+    container is ready (or has failed), so the emulators do not all cold-boot at once.
+    `docker run` calls are additionally spaced by `launch_interval` seconds. Readiness
+    of all booting containers is checked by one shared poller. A container that fails
+    to launch or does not become ready within `ready_timeout` is removed and launched
+    again, up to `max_retries` times, without touching the other containers.
+
+    Args:
+        configs: Container configurations
+        max_parallel: Maximum number of containers booting at the same time
+        launch_interval: Minimum seconds between two `docker run` calls
+        wait_ready: Wait for containers to become ready
+        ready_timeout: Timeout for readiness check of each attempt
+        max_retries: Times a failed container is recreated
+        poll_interval: Seconds between two health check passes
+        on_progress: Called with an event ("launching", "launched", "ready",
+            "retrying" or "failed") and the container's current result
+
+    Returns:
+        List of LaunchResult objects, in the order of `configs`
+    """
+    if not configs:
+        return []
+
+    poller = _ReadinessPoller(poll_interval)
+    stagger_lock = threading.Lock()
+    last_launch = [float("-inf")]
+    done = [0]
+    start_time = time.monotonic()
+
+    def notify(event: str, result: LaunchResult) -> None:
+        if on_progress is not None:
+            try:
+                on_progress(event, result)
+            except Exception:
+                logger.exception("Launch progress callback failed")
+
+    def launch_one(config: ContainerConfig) -> LaunchResult:
+        for attempt in range(1, max_retries + 2):
+            with stagger_lock:
+                delay = last_launch[0] + launch_interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                last_launch[0] = time.monotonic()
+
+            notify("launching", LaunchResult(**_ports_of(config), attempts=attempt))
+            attempt_start = time.monotonic()
+            result = launch_container(config, wait_ready=False)
+            result.attempts = attempt
+            result.launch_seconds = time.monotonic() - attempt_start
+
+            if result.success and not wait_ready:
+                notify("launched", result)
+                return result
+            if result.success:
+                notify("launched", result)
+                if poller.wait(config.name, config.backend_port, ready_timeout):
+                    result.ready = True
+                    result.ready_seconds = time.monotonic() - attempt_start
+                    notify("ready", result)
+                    return result
+                result.error_message = f"Not ready within {ready_timeout}s"
+                logger.warning(f"Container '{config.name}' did not become ready in time")
+
+            if attempt > max_retries:
+                break
+            logger.info(
+                f"Retrying container '{config.name}' (attempt {attempt + 1}/{max_retries + 1})"
+            )
+            notify("retrying", result)
+            try:
+                docker_rm(config.name, force=True)
+            except Exception:
+                logger.debug(f"No container '{config.name}' to remove before retrying")
+
+        notify("failed", result)
+        return result
+
+    def run(config: ContainerConfig) -> LaunchResult:
+        result = launch_one(config)
+        with stagger_lock:
+            done[0] += 1
+            finished = done[0]
+        logger.info(
+            f"[{finished}/{len(configs)}] Container '{config.name}' "
+            f"{'ready' if result.ready else 'launched' if result.success else 'failed'} "
+            f"after {time.monotonic() - start_time:.1f}s"
+        )
+        return result
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_parallel, len(configs))),
+            thread_name_prefix="container-launch",
+        ) as executor:
+            results = list(executor.map(run, configs))
+    finally:
+        poller.close()
+
+    _log_launch_summary(results, time.monotonic() - start_time)
     return results
 
 
+def _ports_of(config: ContainerConfig) -> dict:
+    return {
+        "name": config.name,
+        "backend_port": config.backend_port,
+        "viewer_port": config.viewer_port,
+        "vnc_port": config.vnc_port,
+        "adb_port": config.adb_port,
+    }
+
+
+def _log_launch_summary(results: list[LaunchResult], total_seconds: float) -> None:
+    """Log the launch and readiness latency of every container."""
+
+    def fmt(seconds: float | None) -> str:
+        return "-" if seconds is None else f"{seconds:.1f}s"
+
+    lines = []
+    for r in results:
+        line = (
+            f"  {r.name}: {'ready' if r.ready else 'launched' if r.success else 'failed'}, "
+            f"attempts={r.attempts}, docker run={fmt(r.launch_seconds)}, "
+            f"ready after={fmt(r.ready_seconds)}"
+        )
+        if r.error_message and not r.ready:
+            line += f", error: {r.error_message.strip()}"
+        lines.append(line)
+    ready = sum(r.ready for r in results)
+    logger.info(
+        f"Launched {sum(r.success for r in results)}/{len(results)} container(s), "
+        f"{ready} ready, in {total_seconds:.1f}s:\n" + "\n".join(lines)
+    )
+
+
 def list_containers(
     image_filter: str = DEFAULT_IMAGE,
     name_prefix: str | None = DEFAULT_NAME_PREFIX,
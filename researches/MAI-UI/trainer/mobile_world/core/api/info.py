@@ -105,13 +105,13 @@ def get_task_info(
     if task_registry is None:
         task_registry = get_task_registry(suite_family)
 
-    task = task_registry.get_task(task_name)
+    metadata = task_registry.get_metadata(task_name)
 
     return TaskInfo(
-        name=task.name,
-        goal=task.goal if task.goal else None,
-        tags=sorted(task.task_tags) if hasattr(task, "task_tags") and task.task_tags else [],
-        app_names=list(task.app_names) if hasattr(task, "app_names") and task.app_names else [],
+        name=metadata["name"],
+        goal=task_registry.get_goal(task_name) or None,
+        tags=metadata["tags"],
+        app_names=metadata["apps"],
     )
 
 
@@ -268,12 +268,10 @@ def list_apps(
     all_tasks = task_registry.list_tasks()
 
     for task_name in all_tasks:
-        task = task_registry.get_task(task_name)
-        if hasattr(task, "app_names") and task.app_names:
-            for app in task.app_names:
-                if app not in app_to_tasks:
-                    app_to_tasks[app] = []
-                app_to_tasks[app].append(task_name)
+        for app in task_registry.get_metadata(task_name)["apps"]:
+            if app not in app_to_tasks:
+                app_to_tasks[app] = []
+            app_to_tasks[app].append(task_name)
 
     # Apply filter
     app_names = list(app_to_tasks.keys())
@@ -288,12 +286,10 @@ def list_apps(
         cross_app_count = 0
 
         for task_name in task_names:
-            task = task_registry.get_task(task_name)
-            if hasattr(task, "app_names") and task.app_names:
-                if len(task.app_names) == 1:
-                    single_app_count += 1
-                else:
-                    cross_app_count += 1
+            if len(task_registry.get_metadata(task_name)["apps"]) == 1:
+                single_app_count += 1
+            else:
+                cross_app_count += 1
 
         apps.append(
             AppInfo(
@@ -0,0 +1,322 @@
+"""asyncio evaluation runner.
+
+Drives all environment backends from one event loop with `AsyncAndroidEnvClient`
+instead of one joblib thread per environment. Agent inference goes through
+`BaseAgent.predict_async` and is bounded by its own in-flight limit
+(`max_llm_concurrency`), independent of the number of environments. Trajectory
+writes run on a small shared I/O pool and overlap with the next action.
+
+Resume semantics match `runner.run_agent_with_evaluation`: tasks with a result
+file under `log_file_root` are skipped and their scores reported.
+"""
+
+import asyncio
+import functools
+import os
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+
+from mobile_world.agents.base import BaseAgent
+from mobile_world.agents.registry import create_agent
+from mobile_world.runtime.client import AsyncAndroidEnvClient, scan_finished_tasks
+from mobile_world.runtime.utils.docker import discover_backends
+from mobile_world.runtime.utils.models import ANSWER, ENV_FAIL, FINISHED, UNKNOWN
+from mobile_world.runtime.utils.trajectory_logger import TrajLogger
+
+
+async def _execute_single_task_async(
+    env: AsyncAndroidEnvClient,
+    agent: BaseAgent,
+    task_name: str,
+    max_step: int,
+    traj_logger: TrajLogger,
+    llm_semaphore: asyncio.Semaphore,
+    io_executor: ThreadPoolExecutor,
+) -> tuple[int, float]:
+    """Execute a single task and return the number of steps and score."""
+    loop = asyncio.get_running_loop()
+    task_goal = await env.get_task_goal(task_type=task_name)
+    logger.debug(f"task_goal: {task_goal}")
+
+    step = 0
+    obs = await env.initialize_task(task_name=task_name)
+    agent.initialize(task_goal)
+    phase_totals: dict[str, float] = defaultdict(float)
+    pending_log: asyncio.Future | None = None
+
+    try:
+        while True:
+            step += 1
+
+            predict_start = time.perf_counter()
+            async with llm_semaphore:
+                prediction, action = await agent.predict_async(
+                    {
+                        "screenshot": obs.screenshot,
+                        "tool_call": obs.tool_call,
+                        "ask_user_response": obs.ask_user_response,
+                    }
+                )
+            step_timings = {
+                **(obs.timings or {}),
+                "predict": time.perf_counter() - predict_start,
+            }
+            for phase, seconds in step_timings.items():
+                if phase != "stabilize_frames":
+                    phase_totals[phase] += seconds
+
+            # keep trajectory records in step order, but let writing overlap the action
+            if pending_log is not None:
+                await pending_log
+            pending_log = loop.run_in_executor(
+                io_executor,
+                functools.partial(
+                    traj_logger.log_traj,
+                    task_name,
+                    task_goal,
+                    step,
+                    prediction,
+                    action.model_dump(exclude_none=True),
+                    obs,
+                    agent.get_total_token_usage(),
+                    timings=step_timings,
+                ),
+            )
+            if prediction is None:
+                logger.warning(f"Agent prediction failed in step {step}")
+                break
+
+            if action.action_type in [ENV_FAIL, FINISHED, UNKNOWN]:
+                logger.debug(f"task terminated in step {step} with action {action.action_type}")
+                break
+            logger.debug(f"execution action {action}")
+            obs = await env.execute_action(action)
+            if action.action_type in [ANSWER]:
+                break
+
+            if step >= max_step:
+                logger.debug("task steps reach max step, terminate")
+                break
+    finally:
+        if pending_log is not None:
+            await pending_log
+
+    logger.info(
+        "Phase totals over {} steps: {}",
+        step,
+        ", ".join(f"{phase}={seconds:.2f}s" for phase, seconds in phase_totals.items()),
+    )
+
+    score, reason = await env.get_task_score(task_type=task_name)
+    logger.debug(f"task_score: {score}, reason: {reason}")
+    await loop.run_in_executor(io_executor, functools.partial(traj_logger.log_score, score, reason))
+
+    res = await env.tear_down_task(task_type=task_name)
+    agent.done()
+    logger.debug(f"tear_down_task response: {res}")
+    return step, score
+
+
+async def _process_task_async(
+    task_name: str,
+    env_queue: asyncio.Queue,
+    agent_type: str,
+    model_name: str,
+    llm_base_url: str,
+    api_key: str | None,
+    log_file_root: str,
+    max_step: int,
+    llm_semaphore: asyncio.Semaphore,
+    io_executor: ThreadPoolExecutor,
+    retry_on_device_unhealthy: int = 2,
+    **kwargs,
+) -> dict | None:
+    """Run one task on the next free environment; returns None on failure."""
+    env, container_name = await env_queue.get()
+
+    # per-task log file, filtered on the task_name bound via logger.contextualize
+    task_log_file = os.path.join(log_file_root, task_name, "task.log")
+    os.makedirs(os.path.dirname(task_log_file), exist_ok=True)
+    traj_logger = TrajLogger(log_file_root, task_name)
+    handler_id = logger.add(
+        task_log_file,
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | container: {extra[container_name]} | {message}",
+        level="DEBUG",
+        enqueue=True,
+        filter=lambda record: record["extra"].get("task_name") == task_name,
+    )
+
+    try:
+        with logger.contextualize(task_name=task_name, container_name=container_name):
+            logger.info("Processing task '{}' on environment {}", task_name, env.base_url)
+            agent = create_agent(agent_type, model_name, llm_base_url, api_key, env=env, **kwargs)
+
+            task_start_time = time.time()
+            while True:
+                try:
+                    task_steps, task_score = await _execute_single_task_async(
+                        env,
+                        agent,
+                        task_name,
+                        max_step,
+                        traj_logger=traj_logger,
+                        llm_semaphore=llm_semaphore,
+                        io_executor=io_executor,
+                    )
+                    break
+                except Exception as e:
+                    if "Device is not healthy" in str(e) and retry_on_device_unhealthy > 0:
+                        logger.warning("Device is not healthy, retrying...")
+                        await asyncio.sleep(20)
+                        retry_on_device_unhealthy -= 1
+                        traj_logger.reset_traj()
+                        continue
+                    logger.exception(f"Error executing task {task_name}")
+                    return None
+
+            logger.info(
+                "Task '{}' completed on {}: score={}, steps={}, duration={:.1f}s",
+                task_name,
+                env.base_url,
+                task_score,
+                task_steps,
+                time.time() - task_start_time,
+            )
+            return {"task_name": task_name, "score": task_score}
+    finally:
+        traj_logger.close()
+        logger.remove(handler_id)
+        env_queue.put_nowait((env, container_name))
+
+
+async def _init_env_async(
+    env_url: str,
+    device: str,
+    step_wait_time: float,
+    suite_family: str,
+    screenshot_format: str = "png",
+) -> AsyncAndroidEnvClient:
+    env = AsyncAndroidEnvClient(
+        env_url, device, step_wait_time=step_wait_time, screenshot_format=screenshot_format
+    )
+    await env.switch_suite_family(suite_family)
+    return env
+
+
+async def run_agent_with_evaluation_async(
+    agent_type: str,
+    model_name: str,
+    llm_base_url: str,
+    log_file_root: str,
+    tasks: list[str],
+    max_step: int = -1,
+    aw_urls: list[str] | None = None,
+    api_key: str | None = None,
+    device: str = "emulator-5554",
+    step_wait_time: float = 1.0,
+    screenshot_format: str = "png",
+    suite_family: str = "mobile_world",
+    env_name_prefix: str = "mobile_world_env",
+    env_image: str = "mobile_world",
+    dry_run: bool = False,
+    enable_mcp: bool = False,
+    max_concurrency: int | None = None,
+    max_llm_concurrency: int = 16,
+    io_workers: int = 8,
+    shuffle_tasks: bool = False,
+    **kwargs,
+) -> tuple[list[dict], list[str]]:
+    """asyncio counterpart of `runner.run_agent_with_evaluation`.
+
+    Args:
+        max_concurrency: Maximum number of environments driven at once
+        max_llm_concurrency: Maximum number of in-flight agent predictions
+        io_workers: Threads shared by all tasks for trajectory writes
+        Other arguments as in `runner.run_agent_with_evaluation`. MCP is not supported.
+
+    Returns:
+        (results of finished tasks, names of tasks without a result)
+    """
+    if enable_mcp:
+        raise ValueError("The asyncio runner does not support MCP; use run_agent_with_evaluation")
+
+    container_names = None
+    if not aw_urls:
+        logger.info("No backend URLs specified, auto-discovering from containers...")
+        aw_urls, container_names = discover_backends(image_filter=env_image, prefix=env_name_prefix)
+        logger.info("Container names: {}", container_names)
+        if not aw_urls:
+            logger.error("No backend URLs found. Please start containers or specify --aw-host")
+            return [], []
+
+    num_envs = min(max_concurrency or len(aw_urls), len(aw_urls))
+    logger.info("Using {} of {} backend URL(s): {}", num_envs, len(aw_urls), aw_urls)
+
+    envs = await asyncio.gather(
+        *(
+            _init_env_async(url, device, step_wait_time, suite_family, screenshot_format)
+            for url in aw_urls[:num_envs]
+        )
+    )
+
+    try:
+        task_list = tasks if len(tasks) != 0 else await envs[0].get_suite_task_list()
+        logger.info("Task list: {} ({} tasks)", task_list, len(task_list))
+
+        finished_task_list, finished_scores = scan_finished_tasks(log_file_root, task_list)
+        logger.info(
+            "Finished task list: {} ({} tasks)", finished_task_list, len(finished_task_list)
+        )
+        task_list = [task for task in task_list if task not in finished_task_list]
+        logger.info("Remaining tasks to execute: {} ({} tasks)", task_list, len(task_list))
+
+        env_queue: asyncio.Queue = asyncio.Queue()
+        for i, env in enumerate(envs):
+            env_queue.put_nowait((env, container_names[i] if container_names else None))
+
+        if shuffle_tasks:
+            random.shuffle(task_list)
+
+        if dry_run:
+            logger.info("Dry run mode, skipping task execution")
+            task_results = []
+        else:
+            loop = asyncio.get_running_loop()
+            # predict_async runs sync agents in the default executor; size it to the LLM limit
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=max_llm_concurrency))
+            llm_semaphore = asyncio.Semaphore(max_llm_concurrency)
+            with ThreadPoolExecutor(io_workers, thread_name_prefix="traj-io") as io_executor:
+                task_results = await asyncio.gather(
+                    *(
+                        _process_task_async(
+                            task_name=task_name,
+                            env_queue=env_queue,
+                            agent_type=agent_type,
+                            model_name=model_name,
+                            llm_base_url=llm_base_url,
+                            api_key=api_key,
+                            log_file_root=log_file_root,
+                            max_step=max_step,
+                            llm_semaphore=llm_semaphore,
+                            io_executor=io_executor,
+                            **kwargs,
+                        )
+                        for task_name in task_list
+                    )
+                )
+    finally:
+        await asyncio.gather(*(env.close() for env in envs))
+
+    task_list_with_no_results = [
+        task_name for task_name, task_result in zip(task_list, task_results) if task_result is None
+    ]
+    logger.info(f"Task with no results count: {len(task_list_with_no_results)}")
+    success_task_results = [task_result for task_result in task_results if task_result is not None]
+    for finished_task_name, finished_score in zip(finished_task_list, finished_scores):
+        success_task_results.append({"task_name": finished_task_name, "score": finished_score})
+
+    return success_task_results, task_list_with_no_results
@@ -0,0 +1,241 @@
+"""Warm standby environments for the runner.
+
+`EnvPool` keeps `spares` extra containers booted and initialized next to the ones
+the tasks run on. When an environment reports an unhealthy device, the runner swaps
+in a spare with `replace()` and re-runs the interrupted task on it, instead of waiting
+for the broken emulator to recover. The broken container is removed and a fresh one
+launched in the background to refill the pool.
+
+Spares are launched with `launch_containers`, one launch at a time so concurrent
+recycles do not pick the same container index or ports.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from statistics import mean
+
+from loguru import logger
+
+from mobile_world.core.api.env import launch_containers, remove_container
+from mobile_world.runtime.client import AndroidEnvClient
+
+EnvEntry = tuple[AndroidEnvClient, str | None]
+
+
+class EnvPool:
+    """Spare environments plus the bookkeeping for the utilization report.
+
+    Args:
+        env_factory: creates an initialized client for a backend URL
+        num_active: number of environments tasks run on, for the utilization report
+        spares: number of warm spare containers to keep
+        replace_timeout: seconds `replace()` waits for a spare that is still booting
+        **launch_kwargs: arguments for `launch_containers` (name prefix, image, ...)
+    """
+
+    def __init__(
+        self,
+        env_factory: Callable[[str], AndroidEnvClient],
+        num_active: int,
+        spares: int = 1,
+        replace_timeout: float = 60.0,
+        **launch_kwargs,
+    ):
+        self.env_factory = env_factory
+        self.num_active = num_active
+        self.target_spares = spares
+        self.replace_timeout = replace_timeout
+        self.launch_kwargs = launch_kwargs
+        self._spares: deque[EnvEntry] = deque()
+        self._pending = 0  # spares being launched
+        self._cond = threading.Condition()
+        self._launcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="env-pool")
+        self._closed = False
+        self._start_time = time.monotonic()
+        self._busy_seconds = 0.0
+        self._swap_seconds: list[float] = []
+        self._recycle_seconds: list[float] = []
+        self._unreplaced = 0
+
+    def start(self) -> "EnvPool":
+        """Launch the spares in the background."""
+        with self._cond:
+            self._pending += self.target_spares
+        if self.target_spares:
+            self._submit_launch(self.target_spares)
+        return self
+
+    def _submit_launch(self, count: int, replacing: str | None = None) -> None:
+        """Queue a launch of `count` spares already counted in `_pending`."""
+        try:
+            future = self._launcher.submit(self._launch_spares, count, replacing)
+        except RuntimeError:  # the pool was closed meanwhile
+            self._launch_dropped(count)
+            return
+        # a launch cancelled by close() never runs the decrement in _launch_spares
+        future.add_done_callback(
+            lambda future: self._launch_dropped(count) if future.cancelled() else None
+        )
+
+    def _launch_dropped(self, count: int) -> None:
+        with self._cond:
+            self._pending -= count
+            self._cond.notify_all()
+
+    def _launch_spares(self, count: int, replacing: str | None = None) -> None:
+        start = time.monotonic()
+        added = 0
+        try:
+            if replacing is not None:
+                remove_container(replacing)
+            for result in launch_containers(count=count, **self.launch_kwargs):
+                if not result.ready:
+                    logger.warning(f"Spare container '{result.name}' is not ready, dropping it")
+                    if result.success:
+                        remove_container(result.name)
+                    continue
+                try:
+                    env = self.env_factory(f"http://localhost:{result.backend_port}")
+                except Exception:
+                    logger.exception(f"Failed to initialize spare container '{result.name}'")
+                    remove_container(result.name)
+                    continue
+                with self._cond:
+                    closed = self._closed
+                    if not closed:
+                        self._spares.append((env, result.name))
+                        self._cond.notify_all()
+                if closed:
+                    env.close()
+                    remove_container(result.name)
+                    continue
+                added += 1
+                logger.info(f"Spare environment '{result.name}' is ready ({env.base_url})")
+        except Exception:
+            logger.exception("Failed to launch spare environments")
+        finally:
+            with self._cond:
+                self._pending -= count
+                if replacing is not None and added:
+                    self._recycle_seconds.append(time.monotonic() - start)
+                self._cond.notify_all()
+
+    def _take_spare(self, deadline: float) -> EnvEntry | None:
+        with self._cond:
+            while not self._spares and self._pending and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._spares.popleft() if self._spares else None
+
+    def recycle(self, env: AndroidEnvClient, container_name: str | None) -> None:
+        """Drop a broken environment and launch a fresh spare in its place."""
+        env.close()
+        if container_name is None:
+            logger.warning(
+                f"Cannot recycle {env.base_url}: container unknown (backend URL given explicitly)"
+            )
+            return
+        with self._cond:
+            if self._closed:
+                return
+            self._pending += 1
+        self._submit_launch(1, container_name)
+
+    def replace(self, env: AndroidEnvClient, container_name: str | None) -> EnvEntry | None:
+        """Swap a broken environment for a healthy spare.
+
+        The broken environment is recycled in the background. Spares are checked with
+        `probe()`, and neither is asked for `/health`, as that would block on the server's
+        emulator restart.
+
+        Returns:
+            the spare's client and container name, or None if no healthy spare became
+            available within `replace_timeout`; `env` is kept in that case
+        """
+        start = time.monotonic()
+        deadline = start + self.replace_timeout
+        while (spare := self._take_spare(deadline)) is not None:
+            spare_env, spare_name = spare
+            if spare_env.probe():
+                break
+            logger.warning(f"Spare environment '{spare_name}' is unhealthy, recycling it")
+            self.recycle(spare_env, spare_name)
+        else:
+            with self._cond:
+                self._unreplaced += 1
+            logger.warning(f"No healthy spare environment available to replace {env.base_url}")
+            return None
+
+        seconds = time.monotonic() - start
+        with self._cond:
+            self._swap_seconds.append(seconds)
+        logger.info(
+            f"Replaced environment {container_name or env.base_url} with spare "
+            f"'{spare_name}' in {seconds:.1f}s"
+        )
+        self.recycle(env, container_name)
+        return spare
+
+    def record_busy(self, seconds: float) -> None:
+        """Record the time a task held an active environment."""
+        with self._cond:
+            self._busy_seconds += seconds
+
+    def report(self) -> dict:
+        """Utilization of the active environments and replacement latencies."""
+        with self._cond:
+            elapsed = time.monotonic() - self._start_time
+            capacity = elapsed * self.num_active
+            return {
+                "active": self.num_active,
+                "spares_ready": len(self._spares),
+                "spares_pending": self._pending,
+                "utilization": self._busy_seconds / capacity if capacity else 0.0,
+                "replacements": len(self._swap_seconds),
+                "unreplaced": self._unreplaced,
+                "mean_swap_seconds": mean(self._swap_seconds) if self._swap_seconds else None,
+                "mean_recycle_seconds": (
+                    mean(self._recycle_seconds) if self._recycle_seconds else None
+                ),
+            }
+
+    def log_report(self) -> None:
+        report = self.report()
+        logger.info(
+            "Env pool: utilization {:.0%} of {} env(s), {} replacement(s) "
+            "(mean swap {}, mean recycle {}), {} failure(s) without spare, "
+            "{} spare(s) ready",
+            report["utilization"],
+            report["active"],
+            report["replacements"],
+            _fmt_seconds(report["mean_swap_seconds"]),
+            _fmt_seconds(report["mean_recycle_seconds"]),
+            report["unreplaced"],
+            report["spares_ready"],
+        )
+
+    def close(self) -> None:
+        """Stop launching spares and remove the spare containers no task was moved to.
+
+        Spares share the active environments' name prefix, so leaving them up would make
+        the next run discover them as active environments. Spares swapped in by
+        `replace()` are active now and stay up.
+        """
+        with self._cond:
+            self._closed = True
+            spares = list(self._spares)
+            self._spares.clear()
+            self._cond.notify_all()
+        self._launcher.shutdown(wait=False, cancel_futures=True)
+        for env, name in spares:
+            env.close()
+            remove_container(name)
+
+
+def _fmt_seconds(seconds: float | None) -> str:
+    return "n/a" if seconds is None else f"{seconds:.1f}s"
@@ -0,0 +1,271 @@
+"""Incremental index of the task folders in a log root.
+
+Listing a log root used to read every task's trajectory several times, list its
+screenshot folders and look up its tags on each page load. `LogRootIndex` parses
+a task folder once into a `TaskSummary`, keyed by the modification times and
+sizes of the files the summary is built from, and on `refresh` re-parses only the
+folders whose signature changed. The summaries are also kept in a SQLite sidecar
+in the log root, so `mobile-world logs results` and a restarted viewer start from
+the last index instead of re-reading everything.
+
+Tags come from the task registry rather than the folder, so they are not stored in
+the summary but looked up from the registry's manifest when read.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+
+from loguru import logger
+
+from mobile_world.core.log_viewer.utils import (
+    count_ask_user_actions,
+    count_mcp_actions,
+    get_all_trajectory_steps,
+    get_latest_trajectory_action,
+    get_screenshots,
+    get_task_folders,
+    get_task_goal,
+    get_task_tags,
+    latest_log_time,
+    unfinished_status,
+)
+from mobile_world.runtime.client import parse_result_file
+from mobile_world.runtime.utils.trajectory_logger import (
+    LOG_FILE_NAME,
+    RECORDS_FILE_NAME,
+    load_traj_data,
+)
+
+SIDECAR_FILE_NAME = ".log_index.sqlite"
+# bump when TaskSummary changes, existing sidecars are then rebuilt
+INDEX_VERSION = 2
+MAX_CACHED_LOG_ROOTS = 8
+
+# paths (relative to the task folder) whose changes invalidate a summary; the
+# folder itself changes when files such as result.txt or a new .log are created
+_SIGNATURE_PATHS = (
+    "",
+    LOG_FILE_NAME,
+    RECORDS_FILE_NAME,
+    "result.txt",
+    "screenshots",
+    "marked_screenshots",
+)
+
+
+@dataclass
+class TaskSummary:
+    """What the index page and the stats need to know about one task folder."""
+
+    name: str
+    finished: bool = False
+    score: float | None = None
+    reason: str | None = None
+    step_count: int = 0
+    ask_user_count: int = 0
+    mcp_count: int = 0
+    goal: str = "N/A"
+    latest_screenshot: tuple[str, str] | None = None
+    latest_action: dict | None = None
+    log_files: list[str] = field(default_factory=list)
+    latest_log_time: float = 0.0
+
+    @property
+    def tags(self) -> list[str]:
+        """Current registry tags of the task; folders without steps have none."""
+        return get_task_tags(self.name) if self.step_count else []
+
+    @property
+    def status(self) -> str:
+        """Same as `get_task_status`: "Finished", "Running" or "Stale"."""
+        return "Finished" if self.finished else unfinished_status(self.latest_log_time)
+
+    @classmethod
+    def from_json(cls, text: str) -> "TaskSummary":
+        data = json.loads(text)
+        if data["latest_screenshot"] is not None:
+            data["latest_screenshot"] = tuple(data["latest_screenshot"])
+        return cls(**data)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+
+def folder_signature(task_folder: str) -> str:
+    """Modification times and sizes of the paths a task summary is built from."""
+    parts = []
+    for relative in _SIGNATURE_PATHS:
+        try:
+            st = os.stat(os.path.join(task_folder, relative))
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def summarize_task(log_root: str, task_name: str) -> TaskSummary:
+    """Parse a task folder into a `TaskSummary`, reading its trajectory once."""
+    task_folder = os.path.join(log_root, task_name)
+    try:
+        data = load_traj_data(task_folder)
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"Error parsing traj.json in {task_folder}: {e}")
+        data = {}
+    steps = get_all_trajectory_steps(task_folder, data)
+    summary = TaskSummary(
+        name=task_name,
+        step_count=len(steps),
+        ask_user_count=count_ask_user_actions(steps),
+        mcp_count=count_mcp_actions(steps),
+        goal=get_task_goal(task_folder, steps),
+        latest_action=get_latest_trajectory_action(task_folder, steps),
+    )
+    if not steps:
+        # not shown or counted anyway
+        return summary
+
+    screenshots = get_screenshots(task_folder)
+    if screenshots:
+        summary.latest_screenshot = (screenshots[-1][1], screenshots[-1][2])
+
+    result_file = os.path.join(task_folder, "result.txt")
+    if os.path.exists(result_file):
+        summary.finished = True
+        try:
+            summary.score, summary.reason = parse_result_file(result_file)
+        except Exception as e:
+            logger.warning(f"Error parsing result.txt in {task_folder}: {e}")
+    else:
+        summary.log_files = sorted(f for f in os.listdir(task_folder) if f.endswith(".log"))
+        summary.latest_log_time = latest_log_time(task_folder, summary.log_files)
+    return summary
+
+
+class LogRootIndex:
+    """Task summaries of one log root, updated incrementally.
+
+    Args:
+        log_root: directory containing one folder per task run
+        sidecar: keep the summaries in a SQLite file in the log root; disabled
+            automatically if the log root is not writable
+    """
+
+    def __init__(self, log_root: str, sidecar: bool = True):
+        self.log_root = log_root
+        self.sidecar_path = os.path.join(log_root, SIDECAR_FILE_NAME) if sidecar else None
+        self._entries: dict[str, tuple[str, TaskSummary]] = {}
+        self._sidecar_loaded = False
+        self._lock = threading.Lock()
+
+    def refresh(self) -> list[TaskSummary]:
+        """Re-parse changed task folders and return all summaries, sorted by name.
+
+        Unchanged folders of unfinished tasks only have their .log times updated,
+        so the running/stale status stays current.
+        """
+        with self._lock:
+            if not self._sidecar_loaded:
+                self._load_sidecar()
+                self._sidecar_loaded = True
+
+            task_names = get_task_folders(self.log_root)
+            changed: dict[str, tuple[str, TaskSummary]] = {}
+            for task_name in task_names:
+                task_folder = os.path.join(self.log_root, task_name)
+                signature = folder_signature(task_folder)
+                entry = self._entries.get(task_name)
+                if entry is not None and entry[0] == signature:
+                    summary = entry[1]
+                    if summary.log_files and not summary.finished:
+                        summary.latest_log_time = latest_log_time(task_folder, summary.log_files)
+                    continue
+                changed[task_name] = (signature, summarize_task(self.log_root, task_name))
+
+            removed = set(self._entries) - set(task_names)
+            for task_name in removed:
+                del self._entries[task_name]
+            self._entries.update(changed)
+            if changed or removed:
+                logger.debug(
+                    f"Indexed {self.log_root}: {len(changed)} task(s) parsed, "
+                    f"{len(removed)} removed, {len(task_names) - len(changed)} unchanged"
+                )
+                self._save_sidecar(changed, removed)
+            return [self._entries[task_name][1] for task_name in task_names]
+
+    # -- sidecar --------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.sidecar_path, timeout=5)
+        # a lost write only means re-parsing those folders
+        connection.execute("PRAGMA synchronous = OFF")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            connection.execute("DROP TABLE IF EXISTS tasks")
+            connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS tasks "
+            "(name TEXT PRIMARY KEY, signature TEXT NOT NULL, summary TEXT NOT NULL)"
+        )
+        return connection
+
+    def _disable_sidecar(self, error: Exception) -> None:
+        logger.debug(f"Not using log index sidecar {self.sidecar_path}: {error}")
+        self.sidecar_path = None
+
+    def _load_sidecar(self) -> None:
+        if self.sidecar_path is None or not os.path.exists(self.sidecar_path):
+            return
+        try:
+            connection = self._connect()
+            try:
+                rows = connection.execute("SELECT name, signature, summary FROM tasks").fetchall()
+            finally:
+                connection.close()
+            for task_name, signature, summary in rows:
+                self._entries[task_name] = (signature, TaskSummary.from_json(summary))
+        except (sqlite3.Error, OSError, json.JSONDecodeError, TypeError, KeyError) as e:
+            self._entries.clear()
+            self._disable_sidecar(e)
+
+    def _save_sidecar(self, changed: dict[str, tuple[str, TaskSummary]], removed: set[str]) -> None:
+        if self.sidecar_path is None:
+            return
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO tasks (name, signature, summary) VALUES (?, ?, ?)",
+                        [
+                            (task_name, signature, summary.to_json())
+                            for task_name, (signature, summary) in changed.items()
+                        ],
+                    )
+                    connection.executemany(
+                        "DELETE FROM tasks WHERE name = ?", [(name,) for name in removed]
+                    )
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as e:
+            self._disable_sidecar(e)
+
+
+@lru_cache(maxsize=MAX_CACHED_LOG_ROOTS)
+def _cached_index(log_root: str, sidecar: bool) -> LogRootIndex:
+    return LogRootIndex(log_root, sidecar=sidecar)
+
+
+def get_log_root_index(log_root: str, sidecar: bool = True) -> LogRootIndex:
+    """The in-process index of `log_root`, shared by all requests for it."""
+    return _cached_index(os.path.realpath(log_root), sidecar)
+
+
+def get_task_summaries(log_root: str) -> list[TaskSummary]:
+    """Refreshed summaries of all task folders in `log_root`, sorted by name."""
+    if not log_root or not os.path.exists(log_root):
+        return []
+    return get_log_root_index(log_root).refresh()
@@ -9,19 +9,13 @@ from fasthtml.common import *  # noqa: F403
 from loguru import logger
 from starlette.responses import FileResponse
 
+from mobile_world.core.log_viewer.index import get_task_summaries
 from mobile_world.core.log_viewer.styles import DARK_THEME_CSS, HTML_BODY_CSS
 from mobile_world.core.log_viewer.utils import (
     calculate_task_stats,
     get_all_tags,
-    get_all_trajectory_steps,
-    get_latest_screenshot,
-    get_latest_trajectory_action,
     get_log_root_state,
-    get_task_folders,
-    get_task_goal,
     get_task_info,
-    get_task_status,
-    get_task_tags,
 )
 
 
@@ -234,27 +228,25 @@ def register_routes(rt):
     def _process_tasks_for_display(
         log_root, status_filter, score_filter, tag_filter, search_query=""
     ):
-        task_folders = get_task_folders(log_root)
-        task_rows = []
-        filtered_count = 0
-        total_count = len(task_folders)
+        """Task summaries matching the filters, and the number of task folders."""
+        summaries = get_task_summaries(log_root)
+        tasks = []
+        total_count = len(summaries)
 
         # Normalize search query for case-insensitive matching
         search_query_lower = search_query.lower().strip() if search_query else ""
 
-        for task_name in task_folders:
-            task_folder = os.path.join(log_root, task_name)
-            trajectory_steps = get_all_trajectory_steps(task_folder)
-
-            if not trajectory_steps:
+        for summary in summaries:
+            task_name = summary.name
+            if not summary.step_count:
                 continue
 
             # Search filter (partial match on task name)
             if search_query_lower and search_query_lower not in task_name.lower():
                 continue
 
-            status, score, reason = get_task_status(task_folder)
-            task_tags = get_task_tags(task_name)
+            status, score = summary.status, summary.score
+            task_tags = summary.tags
 
             # Filtering
             if status_filter != "all":
@@ -278,70 +270,71 @@ def register_routes(rt):
                 if tag_filter not in task_tags:
                     continue
 
-            filtered_count += 1
-
-            # Data gathering for row
-            latest_screenshot = get_latest_screenshot(task_folder)
-            latest_action = get_latest_trajectory_action(task_folder)
-            task_goal = get_task_goal(task_folder)
-            score_display = f"{score:.2f}" if score is not None else "N/A"
-
-            screenshot_url = None
-            if latest_screenshot:
-                filename, subfolder = latest_screenshot
-                screenshot_url = f"/static/screenshots/{task_name}/{subfolder}/{filename.replace('.png', '')}?log_root={quote(log_root)}"
-
-            task_rows.append(
-                Tr(
-                    Td(
-                        Img(
-                            src=screenshot_url,
-                            cls="thumb",
-                            alt="Latest screenshot",
-                        )
-                        if screenshot_url
-                        else Span("No screenshot", style="color: #666;"),
-                        cls="col-screenshot",
-                    ),
-                    Td(
-                        A(
-                            task_name,
-                            href=f"/task/{task_name}?log_root={quote(log_root)}",
-                            target="_blank",
-                        ),
-                        cls="task-name-col",
-                    ),
-                    Td(_truncated_goal(task_goal, task_name), cls="col-goal"),
-                    Td(
-                        ", ".join(sorted(task_tags)) if task_tags else "-",
-                        cls="col-tags",
-                    ),
-                    Td(_status_badge(status), cls="col-status"),
-                    Td(score_display, cls="col-score"),
-                    Td(reason if reason else "", cls="col-reason"),
-                    Td(
-                        str(latest_action["step"]) if latest_action else "N/A",
-                        cls="col-step",
-                    ),
-                    Td(
-                        latest_action["action_type"] if latest_action else "N/A",
-                        cls="col-action",
-                    ),
-                    Td(
-                        latest_action["prediction"][:100] + "..."
-                        if latest_action
-                        and latest_action.get("prediction")
-                        and len(latest_action["prediction"]) > 100
-                        else (
-                            latest_action["prediction"]
-                            if latest_action and latest_action.get("prediction")
-                            else ""
-                        ),
-                        cls="col-prediction",
-                    ),
+            tasks.append(summary)
+        return tasks, total_count
+
+    def _task_row(log_root, summary):
+        task_name = summary.name
+        status, score, reason = summary.status, summary.score, summary.reason
+        task_tags = summary.tags
+        latest_screenshot = summary.latest_screenshot
+        latest_action = summary.latest_action
+        task_goal = summary.goal
+        score_display = f"{score:.2f}" if score is not None else "N/A"
+
+        screenshot_url = None
+        if latest_screenshot:
+            filename, subfolder = latest_screenshot
+            screenshot_url = f"/static/screenshots/{task_name}/{subfolder}/{filename.replace('.png', '')}?log_root={quote(log_root)}"
+
+        return Tr(
+            Td(
+                Img(
+                    src=screenshot_url,
+                    cls="thumb",
+                    alt="Latest screenshot",
                 )
-            )
-        return task_rows, filtered_count, total_count
+                if screenshot_url
+                else Span("No screenshot", style="color: #666;"),
+                cls="col-screenshot",
+            ),
+            Td(
+                A(
+                    task_name,
+                    href=f"/task/{task_name}?log_root={quote(log_root)}",
+                    target="_blank",
+                ),
+                cls="task-name-col",
+            ),
+            Td(_truncated_goal(task_goal, task_name), cls="col-goal"),
+            Td(
+                ", ".join(sorted(task_tags)) if task_tags else "-",
+                cls="col-tags",
+            ),
+            Td(_status_badge(status), cls="col-status"),
+            Td(score_display, cls="col-score"),
+            Td(reason if reason else "", cls="col-reason"),
+            Td(
+                str(latest_action["step"]) if latest_action else "N/A",
+                cls="col-step",
+            ),
+            Td(
+                latest_action["action_type"] if latest_action else "N/A",
+                cls="col-action",
+            ),
+            Td(
+                latest_action["prediction"][:100] + "..."
+                if latest_action
+                and latest_action.get("prediction")
+                and len(latest_action["prediction"]) > 100
+                else (
+                    latest_action["prediction"]
+                    if latest_action and latest_action.get("prediction")
+                    else ""
+                ),
+                cls="col-prediction",
+            ),
+        )
 
     @rt("/static/screenshots/{task_name}/{subfolder}/{filename}")
     async def serve_screenshot(task_name: str, subfolder: str, filename: str, request):
@@ -818,15 +811,16 @@ def register_routes(rt):
         total_pages = 1
 
         if log_root:
-            task_rows, filtered_count, total_count = _process_tasks_for_display(
+            tasks, total_count = _process_tasks_for_display(
                 log_root, status_filter, score_filter, tag_filter, search_query
             )
+            filtered_count = len(tasks)
             # Pagination
             total_pages = max(1, (filtered_count + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE)
             current_page = min(current_page, total_pages)
             start_idx = (current_page - 1) * ITEMS_PER_PAGE
             end_idx = start_idx + ITEMS_PER_PAGE
-            task_rows = task_rows[start_idx:end_idx]
+            task_rows = [_task_row(log_root, task) for task in tasks[start_idx:end_idx]]
 
         current_time = time.strftime("%Y-%m-%d %H:%M:%S")
 
@@ -1110,16 +1104,17 @@ def register_routes(rt):
             current_page = 1
 
         stats = calculate_task_stats(log_root)
-        task_rows, filtered_count, total_count = _process_tasks_for_display(
+        tasks, total_count = _process_tasks_for_display(
             log_root, status_filter, score_filter, tag_filter, search_query
         )
+        filtered_count = len(tasks)
 
         # Pagination
         total_pages = max(1, (filtered_count + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE)
         current_page = min(current_page, total_pages)
         start_idx = (current_page - 1) * ITEMS_PER_PAGE
         end_idx = start_idx + ITEMS_PER_PAGE
-        task_rows = task_rows[start_idx:end_idx]
+        task_rows = [_task_row(log_root, task) for task in tasks[start_idx:end_idx]]
 
         return Div(
             _build_stats_ui(stats) if stats["total"] > 0 else None,
@@ -10,18 +10,12 @@ from loguru import logger
 from PIL import Image
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
+from mobile_world.core.log_viewer.index import get_task_summaries
 from mobile_world.core.log_viewer.styles import DARK_THEME_CSS
 from mobile_world.core.log_viewer.utils import (
     calculate_task_stats,
-    get_all_trajectory_steps,
-    get_latest_screenshot,
-    get_latest_trajectory_action,
     get_screenshots,
-    get_task_folders,
-    get_task_goal,
     get_task_info,
-    get_task_status,
-    get_task_tags,
 )
 
 
@@ -107,27 +101,27 @@ def export_static_site(log_root: str, output_dir: str, max_workers: int = 8) ->
     os.makedirs(tasks_dir, exist_ok=True)
     os.makedirs(screenshots_dir, exist_ok=True)
 
-    task_folders = get_task_folders(log_root)
+    summaries = get_task_summaries(log_root)
     stats = calculate_task_stats(log_root)
 
-    logger.info(f"Exporting {len(task_folders)} tasks to {output_dir}")
+    logger.info(f"Exporting {len(summaries)} tasks to {output_dir}")
 
     # First pass: collect task data and prepare screenshot jobs
     task_data_list = []
     screenshot_jobs = []  # (task_name, task_folder) for parallel processing
 
-    for task_name in task_folders:
+    for summary in summaries:
+        task_name = summary.name
         task_folder = os.path.join(log_root, task_name)
-        trajectory_steps = get_all_trajectory_steps(task_folder)
 
-        if not trajectory_steps:
+        if not summary.step_count:
             continue
 
-        status, score, reason = get_task_status(task_folder)
-        task_tags = get_task_tags(task_name)
-        latest_screenshot = get_latest_screenshot(task_folder)
-        latest_action = get_latest_trajectory_action(task_folder)
-        task_goal = get_task_goal(task_folder)
+        status, score, reason = summary.status, summary.score, summary.reason
+        task_tags = summary.tags
+        latest_screenshot = summary.latest_screenshot
+        latest_action = summary.latest_action
+        task_goal = summary.goal
 
         # Queue screenshot processing
         screenshot_jobs.append((task_name, task_folder))
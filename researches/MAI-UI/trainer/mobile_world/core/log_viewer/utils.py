@@ -8,6 +8,10 @@ from loguru import logger
 
 from mobile_world.core.subcommands.info import get_task_registry
 from mobile_world.runtime.client import parse_result_file
+from mobile_world.runtime.utils.trajectory_logger import load_traj_data
+
+# Tasks without result.txt whose .log files are older than this are reported as stale
+STALE_AFTER_SECONDS = 600
 
 # Global state for log root (could be enhanced with proper session management)
 _log_root_state: dict[str, str] = {}
@@ -39,9 +43,7 @@ def get_task_tags(task_name: str) -> list[str]:
         return []
     try:
         if registry.has_task(task_name):
-            task = registry.get_task(task_name)
-            if hasattr(task, "task_tags"):
-                return task.task_tags
+            return registry.get_metadata(task_name)["tags"]
     except Exception:
         pass
     return []
@@ -74,13 +76,8 @@ def get_all_tags() -> list[str]:
     registry = get_registry()
     tags = set()
     if registry:
-        for t_name in registry.list_tasks():
-            try:
-                t = registry.get_task(t_name)
-                if hasattr(t, "task_tags") and t.task_tags:
-                    tags.update(t.task_tags)
-            except Exception:
-                pass
+        for metadata in registry.list_metadata():
+            tags.update(metadata["tags"])
     return sorted(list(tags))
 
 
@@ -158,15 +155,14 @@ def get_latest_screenshot(task_folder: str) -> tuple[str, str] | None:
     return None
 
 
-def get_all_trajectory_steps(task_folder: str) -> list[dict]:
-    """Get all trajectory steps from traj.json."""
-    traj_file = os.path.join(task_folder, "traj.json")
-    if not os.path.exists(traj_file):
-        return []
+def get_all_trajectory_steps(task_folder: str, data: dict | None = None) -> list[dict]:
+    """Get all trajectory steps from traj.json (or traj.jsonl while the task is running).
 
+    `data` is the already loaded trajectory data, to avoid reading it again.
+    """
     try:
-        with open(traj_file) as f:
-            data = json.load(f)
+        if data is None:
+            data = load_traj_data(task_folder)
 
         # Get the first key (usually "0") and its trajectory
         if data:
@@ -179,24 +175,21 @@ def get_all_trajectory_steps(task_folder: str) -> list[dict]:
     return []
 
 
-def get_task_goal(task_folder: str) -> str:
-    """Get task goal from traj.json."""
-    steps = get_all_trajectory_steps(task_folder)
+def get_task_goal(task_folder: str, steps: list[dict] | None = None) -> str:
+    """Get task goal from traj.json, or from already loaded trajectory `steps`."""
+    if steps is None:
+        steps = get_all_trajectory_steps(task_folder)
     if steps and len(steps) > 0:
         # task_goal is the same for all steps, get it from the first one
         return steps[0].get("task_goal", "N/A")
     return "N/A"
 
 
-def get_task_tools(task_folder: str) -> list[dict]:
-    """Get tools from traj.json if available."""
-    traj_file = os.path.join(task_folder, "traj.json")
-    if not os.path.exists(traj_file):
-        return []
-
+def get_task_tools(task_folder: str, data: dict | None = None) -> list[dict]:
+    """Get tools from traj.json (or already loaded `data`) if available."""
     try:
-        with open(traj_file) as f:
-            data = json.load(f)
+        if data is None:
+            data = load_traj_data(task_folder)
 
         if data:
             first_key = list(data.keys())[0]
@@ -207,15 +200,11 @@ def get_task_tools(task_folder: str) -> list[dict]:
     return []
 
 
-def get_task_token_usage(task_folder: str) -> dict[str, int] | None:
-    """Get token usage from traj.json if available."""
-    traj_file = os.path.join(task_folder, "traj.json")
-    if not os.path.exists(traj_file):
-        return None
-
+def get_task_token_usage(task_folder: str, data: dict | None = None) -> dict[str, int] | None:
+    """Get token usage from traj.json (or already loaded `data`) if available."""
     try:
-        with open(traj_file) as f:
-            data = json.load(f)
+        if data is None:
+            data = load_traj_data(task_folder)
 
         if data:
             # Check top-level token_usage first
@@ -230,9 +219,10 @@ def get_task_token_usage(task_folder: str) -> dict[str, int] | None:
     return None
 
 
-def get_latest_trajectory_action(task_folder: str) -> dict | None:
-    """Get the latest trajectory action from traj.json."""
-    steps = get_all_trajectory_steps(task_folder)
+def get_latest_trajectory_action(task_folder: str, steps: list[dict] | None = None) -> dict | None:
+    """Get the latest trajectory action from traj.json, or from already loaded `steps`."""
+    if steps is None:
+        steps = get_all_trajectory_steps(task_folder)
     if steps:
         latest = steps[-1]
         return {
@@ -260,24 +250,26 @@ def get_task_status(task_folder: str) -> tuple[str, float | None, str | None]:
             logger.warning(f"Error parsing result.txt in {task_folder}: {e}")
             return "Finished", None, None
 
-    # Check .log file modification time
     log_files = [f for f in os.listdir(task_folder) if f.endswith(".log")]
-    if log_files:
-        latest_log_time = 0.0
-        for log_file in log_files:
-            log_path = os.path.join(task_folder, log_file)
-            try:
-                mtime = os.path.getmtime(log_path)
-                latest_log_time = max(latest_log_time, mtime)
-            except OSError:
-                pass
+    return unfinished_status(latest_log_time(task_folder, log_files)), None, None
 
-        if latest_log_time > 0:
-            age_seconds = time.time() - latest_log_time
-            if age_seconds > 600:  # 10 minutes
-                return "Stale", None, None
 
-    return "Running", None, None
+def latest_log_time(task_folder: str, log_files: list[str]) -> float:
+    """Latest modification time of the given .log files of a task, 0.0 if none exists."""
+    latest = 0.0
+    for log_file in log_files:
+        try:
+            latest = max(latest, os.path.getmtime(os.path.join(task_folder, log_file)))
+        except OSError:
+            pass
+    return latest
+
+
+def unfinished_status(latest_log_time: float) -> str:
+    """Status of a task without result.txt, from the latest write to its .log files."""
+    if latest_log_time > 0 and time.time() - latest_log_time > STALE_AFTER_SECONDS:
+        return "Stale"
+    return "Running"
 
 
 def get_task_info(log_root: str, task_name: str) -> dict | None:
@@ -288,10 +280,15 @@ def get_task_info(log_root: str, task_name: str) -> dict | None:
 
     status, score, reason = get_task_status(task_folder)
     screenshots = get_screenshots(task_folder)
-    trajectory_steps = get_all_trajectory_steps(task_folder)
-    task_goal = get_task_goal(task_folder)
-    tools = get_task_tools(task_folder)
-    token_usage = get_task_token_usage(task_folder)
+    try:
+        data = load_traj_data(task_folder)
+    except json.JSONDecodeError as e:
+        logger.warning(f"Error parsing traj.json in {task_folder}: {e}")
+        data = {}
+    trajectory_steps = get_all_trajectory_steps(task_folder, data)
+    task_goal = get_task_goal(task_folder, trajectory_steps)
+    tools = get_task_tools(task_folder, data)
+    token_usage = get_task_token_usage(task_folder, data)
 
     return {
         "name": task_name,
@@ -310,6 +307,9 @@ def get_task_info(log_root: str, task_name: str) -> dict | None:
 def calculate_task_stats(log_root: str) -> dict:
     """Calculate statistics for all tasks in the log root.
 
+    Served from the log root's index (see `log_viewer.index`), which only
+    re-parses task folders that changed since the last call.
+
     Metrics:
     - SR (Success Rate): proportion of tasks successfully completed
     - Standard SR: success rate for standard GUI tasks
@@ -323,8 +323,10 @@ def calculate_task_stats(log_root: str) -> dict:
       where q_i = s_i / c_i if c_i > 0 else 0 for interaction tasks,
       and I_triggered = non-interaction tasks that triggered ask_user
     """
-    task_folders = get_task_folders(log_root)
-    if not task_folders:
+    from mobile_world.core.log_viewer.index import get_task_summaries
+
+    summaries = get_task_summaries(log_root)
+    if not summaries:
         return {
             "total": 0,
             "finished": 0,
@@ -377,25 +379,23 @@ def calculate_task_stats(log_root: str) -> dict:
     # Ave. MCP Calls: sum of MCP calls for MCP tasks
     total_mcp_calls = 0
 
-    for task_name in task_folders:
-        task_folder = os.path.join(log_root, task_name)
-        status, score, _ = get_task_status(task_folder)
-        trajectory_steps = get_all_trajectory_steps(task_folder)
-        step_count = len(trajectory_steps)
+    for summary in summaries:
+        status, score = summary.status, summary.score
+        step_count = summary.step_count
 
         # Skip tasks with empty steps for stats too
-        if not trajectory_steps:
+        if not step_count:
             continue
 
         # Get tags for this task
-        task_tags = get_task_tags(task_name)
+        task_tags = summary.tags
         has_mcp = "agent-mcp" in task_tags
         has_user_interaction = "agent-user-interaction" in task_tags
         is_standard = not has_mcp and not has_user_interaction
 
         # Count actions
-        c_i = count_ask_user_actions(trajectory_steps)
-        m_i = count_mcp_actions(trajectory_steps)
+        c_i = summary.ask_user_count
+        m_i = summary.mcp_count
 
         if status == "Finished":
             finished_count += 1
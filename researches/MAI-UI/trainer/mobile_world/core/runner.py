@@ -2,6 +2,10 @@ import os
 import random
 import threading
 import time
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
 from queue import Queue
 
 from dotenv import load_dotenv
@@ -10,6 +14,8 @@ from loguru import logger
 
 from mobile_world.agents.base import BaseAgent, MCPAgent
 from mobile_world.agents.registry import create_agent
+from mobile_world.core.env_pool import EnvPool
+from mobile_world.core.scheduler import Schedule, fetch_task_profiles, schedule_tasks
 from mobile_world.runtime.client import (
     AndroidEnvClient,
     AndroidMCPEnvClient,
@@ -18,7 +24,13 @@ from mobile_world.runtime.client import (
 from mobile_world.runtime.utils.docker import (
     discover_backends,
 )
-from mobile_world.runtime.utils.models import ANSWER, ENV_FAIL, FINISHED, UNKNOWN
+from mobile_world.runtime.utils.models import (
+    ANSWER,
+    DEFAULT_IMAGE,
+    ENV_FAIL,
+    FINISHED,
+    UNKNOWN,
+)
 from mobile_world.runtime.utils.trajectory_logger import TrajLogger
 
 load_dotenv()
@@ -31,6 +43,7 @@ def _execute_single_task(
     max_step: int,
     traj_logger: TrajLogger,
     enable_mcp: bool = False,
+    schedule: Schedule | None = None,
 ) -> tuple[int, float]:
     """Execute a single task and return the number of steps and score.
 
@@ -52,14 +65,22 @@ def _execute_single_task(
     logger.debug(f"task_goal: {task_goal}")
 
     step = 0
+    init_start = time.perf_counter()
     obs = env.initialize_task(task_name=task_name)
+    init_seconds = time.perf_counter() - init_start
+    logger.info(f"Task initialized in {init_seconds:.2f}s")
+    if schedule is not None:
+        schedule.record_init(task_name, init_seconds)
     agent.initialize(task_goal)
+    # wall-clock per phase: "action"/"observe" come from the env call that produced obs
+    phase_totals: dict[str, float] = defaultdict(float)
 
     while True:
         step += 1
 
         logger.debug(f"Screenshot captured in step {step}")
 
+        predict_start = time.perf_counter()
         prediction, action = agent.predict(
             {
                 "screenshot": obs.screenshot,
@@ -67,6 +88,13 @@ def _execute_single_task(
                 "ask_user_response": obs.ask_user_response,
             }
         )  # for backward compatibility
+        step_timings = {**(obs.timings or {}), "predict": time.perf_counter() - predict_start}
+        for phase, seconds in step_timings.items():
+            if phase != "stabilize_frames":
+                phase_totals[phase] += seconds
+        logger.debug(f"step {step} timings: {step_timings}")
+
+        # written by the logger's background thread while the action executes
         traj_logger.log_traj(
             task_name,
             task_goal,
@@ -75,6 +103,7 @@ def _execute_single_task(
             action.model_dump(exclude_none=True),
             obs,
             agent.get_total_token_usage(),
+            timings=step_timings,
         )
         if prediction is None:
             logger.warning(f"Agent prediction failed in step {step}")
@@ -100,6 +129,12 @@ def _execute_single_task(
             logger.debug("task steps reach max step, terminate")
             break
 
+    logger.info(
+        "Phase totals over {} steps: {}",
+        step,
+        ", ".join(f"{phase}={seconds:.2f}s" for phase, seconds in phase_totals.items()),
+    )
+
     score, reason = env.get_task_score(task_type=task_name)
     logger.debug(f"task_score: {score}, reason: {reason}")
     traj_logger.log_score(score=score, reason=reason)
@@ -122,6 +157,8 @@ def _process_task_on_env(
     max_step: int,
     retry_on_device_unhealthy: int = 2,
     enable_mcp: bool = False,
+    schedule: Schedule | None = None,
+    env_pool: EnvPool | None = None,
     **kwargs,
 ) -> dict:
     """Process a single task on a specific environment.
@@ -135,6 +172,9 @@ def _process_task_on_env(
         api_key: API key for LLM service
         log_file_root: Root directory for log files
         max_step: Maximum steps for task execution
+        schedule: Schedule the task belongs to, records its initialization time
+        env_pool: Spare environments; an env with an unhealthy device is swapped for a
+            spare and the task is re-run on it
         **kwargs: Additional kwargs for agent creation
 
     Returns:
@@ -144,7 +184,7 @@ def _process_task_on_env(
     thread_id = threading.current_thread().ident
     thread_log_file = os.path.join(log_file_root, task_name, f"thread_{thread_id}.log")
     os.makedirs(os.path.dirname(thread_log_file), exist_ok=True)
-    traj_logger = TrajLogger(log_file_root, task_name)
+    traj_logger = TrajLogger(log_file_root, task_name, background=True)
 
     def thread_filter(record):
         return record["extra"].get("thread_id") == thread_id
@@ -157,9 +197,13 @@ def _process_task_on_env(
         filter=thread_filter,
     )
     env, container_name = env_queue.get()
+    acquired_at = time.time()
 
     try:
-        with logger.contextualize(thread_id=thread_id, container_name=container_name):
+        with ExitStack() as log_context:
+            log_context.enter_context(
+                logger.contextualize(thread_id=thread_id, container_name=container_name)
+            )
             logger.info("Processing task '{}' on environment {}", task_name, env.base_url)
             if enable_mcp:
                 assert isinstance(env, AndroidMCPEnvClient), (
@@ -183,14 +227,36 @@ def _process_task_on_env(
                         max_step,
                         traj_logger=traj_logger,
                         enable_mcp=enable_mcp,
+                        schedule=schedule,
                     )
                     break
                 except Exception as e:
                     if "Device is not healthy" in str(e) and retry_on_device_unhealthy > 0:
-                        logger.warning("Device is not healthy, retrying...")
-                        time.sleep(20)
                         retry_on_device_unhealthy -= 1
                         traj_logger.reset_traj()
+                        spare = env_pool.replace(env, container_name) if env_pool else None
+                        if spare is None:
+                            logger.warning("Device is not healthy, retrying...")
+                            time.sleep(20)
+                            continue
+                        env, container_name = spare
+                        # the thread log names the container the task now runs on
+                        log_context.enter_context(
+                            logger.contextualize(container_name=container_name)
+                        )
+                        logger.warning(
+                            "Device is not healthy, re-running task on spare environment {}",
+                            env.base_url,
+                        )
+                        if enable_mcp:
+                            try:
+                                env.reset_tools(task_type=task_name)
+                            except Exception as e:
+                                logger.exception(f"Error resetting tools for task {task_name}: {e}")
+                                return None
+                        agent = create_agent(
+                            agent_type, model_name, llm_base_url, api_key, env=env, **kwargs
+                        )
                         continue
                     else:
                         logger.exception(f"Error executing task {task_name}")
@@ -214,19 +280,66 @@ def _process_task_on_env(
                 "score": task_score,
             }
     finally:
+        traj_logger.close()
         # Remove the thread-specific handler
         logger.remove(thread_handler_id)
+        if env_pool is not None:
+            env_pool.record_busy(time.time() - acquired_at)
         env_queue.put((env, container_name))
 
 
+def _run_scheduled(
+    envs: list[AndroidEnvClient],
+    container_names: list[str] | None,
+    task_list: list[str],
+    **task_kwargs,
+) -> list[dict | None]:
+    """Run `task_list` with a reset-aware schedule; results are in `task_list` order."""
+    plan = schedule_tasks(fetch_task_profiles(envs[0].get_task_list(), task_list), len(envs))
+
+    def run_env_tasks(env_index: int, task_names: list[str]) -> list[tuple[str, dict | None]]:
+        env_queue = Queue[tuple[AndroidEnvClient, str | None]](maxsize=1)
+        env_queue.put((envs[env_index], container_names[env_index] if container_names else None))
+        return [
+            (
+                task_name,
+                _process_task_on_env(
+                    task_name=task_name, env_queue=env_queue, schedule=plan, **task_kwargs
+                ),
+            )
+            for task_name in task_names
+        ]
+
+    env_results = Parallel(n_jobs=len(envs), backend="threading")(
+        delayed(run_env_tasks)(i, task_names)
+        for i, task_names in enumerate(plan.assignments)
+        if task_names
+    )
+    plan.log_report()
+    # a task listed several times runs several times; each run fills its own slot
+    positions: dict[str, deque[int]] = defaultdict(deque)
+    for index, task_name in enumerate(task_list):
+        positions[task_name].append(index)
+    ordered_results: list[dict | None] = [None] * len(task_list)
+    for results in env_results:
+        for task_name, result in results:
+            ordered_results[positions[task_name].popleft()] = result
+    return ordered_results
+
+
 def _init_env(
-    env_url: str, device: str, step_wait_time: float, suite_family: str, enable_mcp: bool
+    env_url: str,
+    device: str,
+    step_wait_time: float,
+    suite_family: str,
+    enable_mcp: bool,
+    screenshot_format: str = "png",
 ) -> AndroidEnvClient:
     """Initialize the environment."""
-    if enable_mcp:
-        env = AndroidMCPEnvClient(env_url, device, step_wait_time=step_wait_time)
-    else:
-        env = AndroidEnvClient(env_url, device, step_wait_time=step_wait_time)
+    env_cls = AndroidMCPEnvClient if enable_mcp else AndroidEnvClient
+    env = env_cls(
+        env_url, device, step_wait_time=step_wait_time, screenshot_format=screenshot_format
+    )
     env.switch_suite_family(suite_family)
     return env
 
@@ -242,6 +355,7 @@ def run_agent_with_evaluation(
     api_key: str | None = None,
     device: str = "emulator-5554",
     step_wait_time: float = 1.0,
+    screenshot_format: str = "png",
     suite_family: str = "mobile_world",
     env_name_prefix: str = "mobile_world_env",
     env_image: str = "mobile_world",
@@ -249,6 +363,9 @@ def run_agent_with_evaluation(
     enable_mcp: bool = False,
     max_concurrency: int | None = None,
     shuffle_tasks: bool = False,
+    schedule: bool = False,
+    spare_envs: int = 0,
+    spare_image: str = DEFAULT_IMAGE,
     **kwargs,
 ) -> list[dict]:
     """Run the agent and return the evaluation results.
@@ -264,7 +381,13 @@ def run_agent_with_evaluation(
         api_key: API key for LLM service
         device: Android device ID
         step_wait_time: Wait time after each step
+        screenshot_format: Binary screenshot format requested from the env servers
         suite_family: Suite family to use
+        schedule: Group tasks by their reset requirements and run each group back to back
+            on one environment (see `core.scheduler`) instead of first-free-environment order
+        spare_envs: Number of warm spare containers to launch; an env whose device turns
+            unhealthy is replaced by a spare and recycled (see `core.env_pool`)
+        spare_image: Docker image for the spare containers
         **kwargs: Additional kwargs for agent creation
 
     Returns:
@@ -286,7 +409,9 @@ def run_agent_with_evaluation(
         n_jobs=min(max_concurrency if max_concurrency is not None else len(aw_urls), len(aw_urls)),
         backend="threading",
     )(
-        delayed(_init_env)(env_url, device, step_wait_time, suite_family, enable_mcp)
+        delayed(_init_env)(
+            env_url, device, step_wait_time, suite_family, enable_mcp, screenshot_format
+        )
         for env_url in aw_urls
     )
 
@@ -314,14 +439,32 @@ def run_agent_with_evaluation(
 
     if shuffle_tasks:
         random.shuffle(task_list)
-    if not dry_run:
-        task_results = Parallel(
-            n_jobs=min(max_concurrency if max_concurrency is not None else num_envs, num_envs),
-            backend="threading",
-        )(
-            delayed(_process_task_on_env)(
-                task_name=task_name,
-                env_queue=env_queue,
+
+    env_pool = None
+    if spare_envs > 0 and not dry_run:
+        env_file = Path.cwd() / ".env"
+        env_pool = EnvPool(
+            partial(
+                _init_env,
+                device=device,
+                step_wait_time=step_wait_time,
+                suite_family=suite_family,
+                enable_mcp=enable_mcp,
+                screenshot_format=screenshot_format,
+            ),
+            num_active=min(max_concurrency or num_envs, num_envs),
+            spares=spare_envs,
+            name_prefix=env_name_prefix,
+            image=spare_image,
+            env_file_path=env_file if env_file.exists() else None,
+        ).start()
+
+    try:
+        if schedule and not dry_run:
+            task_results = _run_scheduled(
+                envs[: min(max_concurrency or num_envs, num_envs)],
+                container_names,
+                task_list,
                 agent_type=agent_type,
                 model_name=model_name,
                 llm_base_url=llm_base_url,
@@ -329,13 +472,36 @@ def run_agent_with_evaluation(
                 log_file_root=log_file_root,
                 max_step=max_step,
                 enable_mcp=enable_mcp,
+                env_pool=env_pool,
                 **kwargs,
             )
-            for task_name in task_list
-        )
-    else:
-        logger.info("Dry run mode, skipping task execution")
-        task_results = []
+        elif not dry_run:
+            task_results = Parallel(
+                n_jobs=min(max_concurrency if max_concurrency is not None else num_envs, num_envs),
+                backend="threading",
+            )(
+                delayed(_process_task_on_env)(
+                    task_name=task_name,
+                    env_queue=env_queue,
+                    agent_type=agent_type,
+                    model_name=model_name,
+                    llm_base_url=llm_base_url,
+                    api_key=api_key,
+                    log_file_root=log_file_root,
+                    max_step=max_step,
+                    enable_mcp=enable_mcp,
+                    env_pool=env_pool,
+                    **kwargs,
+                )
+                for task_name in task_list
+            )
+        else:
+            logger.info("Dry run mode, skipping task execution")
+            task_results = []
+    finally:
+        if env_pool is not None:
+            env_pool.log_report()
+            env_pool.close()
 
     task_list_with_no_results = [
         task_name for task_name, task_result in zip(task_list, task_results) if task_result is None
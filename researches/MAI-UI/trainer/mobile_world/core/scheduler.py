@@ -0,0 +1,216 @@
+"""Reset-aware task scheduling across environments.
+
+Tasks are grouped by their `BaseTask.requirements` (snapshot tag, app backends such
+as Mastodon/Mattermost/mall, time sync) and each group is run back to back on one
+environment, so a backend started for the first task of a group stays warm for the
+rest. Groups larger than an even share of the tasks are split so environments stay
+balanced.
+
+The projected saving compares the estimated cold backend starts of the schedule
+with those of the default round-robin order. The actual saving is derived from the
+measured `initialize_task` times of cold and warm transitions during the run.
+"""
+
+import math
+import threading
+from dataclasses import dataclass, field
+from statistics import mean
+
+from loguru import logger
+
+# Estimated seconds to bring a backend up when the previous task on the environment
+# did not use it. Only the relative order matters for the schedule itself.
+COLD_START_ESTIMATES = {
+    "mastodon": 60.0,
+    "mattermost": 30.0,
+    "mall": 0.5,
+}
+
+
+@dataclass(frozen=True)
+class TaskProfile:
+    """What initializing a task has to prepare."""
+
+    name: str
+    snapshot_tag: str | None = "init_state"
+    backends: tuple[str, ...] = ()
+    time_sync: bool = False
+
+    @property
+    def group_key(self) -> tuple:
+        return (self.snapshot_tag, self.backends, self.time_sync)
+
+    @classmethod
+    def from_metadata(cls, metadata: dict) -> "TaskProfile":
+        """Build a profile from a `/task/list` or `/task/metadata` entry."""
+        requirements = metadata.get("requirements") or {}
+        return cls(
+            name=metadata["name"],
+            snapshot_tag=requirements.get("snapshot_tag", "init_state"),
+            backends=tuple(requirements.get("backends", ())),
+            time_sync=requirements.get("time_sync", False),
+        )
+
+
+def cold_backends(previous: TaskProfile | None, profile: TaskProfile) -> list[str]:
+    """Backends `profile` needs that the previous task on the environment did not use."""
+    return [b for b in profile.backends if previous is None or b not in previous.backends]
+
+
+def sequence_cost(sequence: list[TaskProfile]) -> tuple[float, int]:
+    """Estimated cold-start seconds and number of cold transitions of one environment."""
+    seconds, transitions = 0.0, 0
+    previous = None
+    for profile in sequence:
+        cold = cold_backends(previous, profile)
+        if cold:
+            transitions += 1
+            seconds += sum(COLD_START_ESTIMATES.get(b, 0.0) for b in cold)
+        previous = profile
+    return seconds, transitions
+
+
+def _plan_cost(plan: list[list[TaskProfile]]) -> tuple[float, int]:
+    costs = [sequence_cost(sequence) for sequence in plan]
+    return sum(c[0] for c in costs), sum(c[1] for c in costs)
+
+
+@dataclass
+class Schedule:
+    """Per-environment task order plus the bookkeeping for the savings report.
+
+    Attributes:
+        assignments: task names per environment, in execution order
+        projected_seconds / baseline_seconds: estimated cold-start time of this
+            schedule and of round-robin assignment in the original order
+        projected_cold / baseline_cold: number of cold transitions of each
+        cold_tasks: tasks scheduled right after a task without one of their backends
+        warm_tasks: tasks with backends that the previous task used as well
+    """
+
+    assignments: list[list[str]]
+    projected_seconds: float
+    baseline_seconds: float
+    projected_cold: int
+    baseline_cold: int
+    cold_tasks: set[str] = field(default_factory=set)
+    warm_tasks: set[str] = field(default_factory=set)
+    _init_times: dict[str, list[float]] = field(
+        default_factory=lambda: {"cold": [], "warm": []}, init=False, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def record_init(self, task_name: str, seconds: float) -> None:
+        """Record the measured `initialize_task` time of a task."""
+        if task_name in self.cold_tasks:
+            kind = "cold"
+        elif task_name in self.warm_tasks:
+            kind = "warm"
+        else:
+            return  # no backends, nothing to compare
+        with self._lock:
+            self._init_times[kind].append(seconds)
+
+    def report(self) -> dict:
+        """Projected and measured reset time saved compared to round-robin order."""
+        with self._lock:
+            cold, warm = list(self._init_times["cold"]), list(self._init_times["warm"])
+        report = {
+            "projected_saved_seconds": self.baseline_seconds - self.projected_seconds,
+            "cold_transitions": {"baseline": self.baseline_cold, "scheduled": self.projected_cold},
+            "mean_init_seconds": {
+                "cold": mean(cold) if cold else None,
+                "warm": mean(warm) if warm else None,
+            },
+            "actual_saved_seconds": None,
+        }
+        if cold and warm:
+            report["actual_saved_seconds"] = (mean(cold) - mean(warm)) * (
+                self.baseline_cold - self.projected_cold
+            )
+        return report
+
+    def log_report(self) -> None:
+        report = self.report()
+        actual = report["actual_saved_seconds"]
+        logger.info(
+            "Schedule saved reset time: projected {:.1f}s, actual {} "
+            "(cold transitions {} -> {}, mean init cold={} warm={})",
+            report["projected_saved_seconds"],
+            "n/a" if actual is None else f"{actual:.1f}s",
+            self.baseline_cold,
+            self.projected_cold,
+            report["mean_init_seconds"]["cold"],
+            report["mean_init_seconds"]["warm"],
+        )
+
+
+def schedule_tasks(profiles: list[TaskProfile], num_envs: int) -> Schedule:
+    """Assign tasks to `num_envs` environments, keeping tasks of a group together.
+
+    Groups are split into chunks of at most ceil(len(profiles) / num_envs) tasks and
+    the chunks are handed out largest first to the least loaded environment.
+    Chunks of the same group that land on one environment run back to back.
+    """
+    num_envs = max(1, num_envs)
+    groups: dict[tuple, list[TaskProfile]] = {}
+    for profile in profiles:
+        groups.setdefault(profile.group_key, []).append(profile)
+
+    chunk_size = max(1, math.ceil(len(profiles) / num_envs))
+    chunks = [
+        group[i : i + chunk_size]
+        for group in groups.values()
+        for i in range(0, len(group), chunk_size)
+    ]
+    # expensive groups first, so their chunks are not split further by balancing
+    chunks.sort(key=lambda c: (len(c), sequence_cost(c[:1])[0]), reverse=True)
+
+    plan: list[list[TaskProfile]] = [[] for _ in range(num_envs)]
+    for chunk in chunks:
+        target = min(range(num_envs), key=lambda i: len(plan[i]))
+        plan[target].extend(chunk)
+    for i, sequence in enumerate(plan):
+        # keep chunks of one group adjacent on an environment
+        order = {key: n for n, key in enumerate(dict.fromkeys(p.group_key for p in sequence))}
+        plan[i] = sorted(sequence, key=lambda p: order[p.group_key])
+
+    baseline = [profiles[i::num_envs] for i in range(num_envs)]
+    projected_seconds, projected_cold = _plan_cost(plan)
+    baseline_seconds, baseline_cold = _plan_cost(baseline)
+
+    cold_tasks, warm_tasks = set(), set()
+    for sequence in plan:
+        previous = None
+        for profile in sequence:
+            if cold_backends(previous, profile):
+                cold_tasks.add(profile.name)
+            elif profile.backends:
+                warm_tasks.add(profile.name)
+            previous = profile
+
+    schedule = Schedule(
+        assignments=[[p.name for p in sequence] for sequence in plan],
+        projected_seconds=projected_seconds,
+        baseline_seconds=baseline_seconds,
+        projected_cold=projected_cold,
+        baseline_cold=baseline_cold,
+        cold_tasks=cold_tasks,
+        warm_tasks=warm_tasks,
+    )
+    logger.info(
+        "Scheduled {} tasks in {} groups on {} environment(s): "
+        "projected cold-start time {:.1f}s vs {:.1f}s round-robin",
+        len(profiles),
+        len(groups),
+        num_envs,
+        projected_seconds,
+        baseline_seconds,
+    )
+    return schedule
+
+
+def fetch_task_profiles(task_list_metadata: list[dict], task_names: list[str]) -> list[TaskProfile]:
+    """Profiles of `task_names`, in order, from the entries returned by `/task/list`."""
+    by_name = {entry["name"]: entry for entry in task_list_metadata}
+    return [TaskProfile.from_metadata(by_name.get(name, {"name": name})) for name in task_names]
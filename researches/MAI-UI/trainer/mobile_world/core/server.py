@@ -3,6 +3,7 @@
 
 import asyncio
 import base64
+import json
 import threading
 import time
 from pathlib import Path
@@ -11,13 +12,16 @@ from typing import Any, Literal
 import uvicorn
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from loguru import logger
 
 from mobile_world.runtime.app_helpers.mall import get_config, write_callback_file
+from mobile_world.runtime.app_helpers.system import invalidate_device_snapshot
 from mobile_world.runtime.controller import AndroidController
+from mobile_world.runtime.utils.adb_transport import AdbTransportError
 from mobile_world.runtime.utils.constants import ARTIFACTS_ROOT, device_dir
 from mobile_world.runtime.utils.docker import restart_emulator_with_avd
+from mobile_world.runtime.utils.health import DeviceHealthMonitor
 from mobile_world.runtime.utils.helpers import AdbResponse
 from mobile_world.runtime.utils.models import (
     ANSWER,
@@ -37,11 +41,20 @@ from mobile_world.runtime.utils.models import (
     UNKNOWN,
     WAIT,
     InitRequest,
+    JSONAction,
     SmsRequest,
+    StepAndObserveRequest,
     StepRequest,
     TaskCallbackRequest,
     TaskOperationRequest,
 )
+from mobile_world.runtime.utils.screenshot import (
+    SCREENSHOT_MEDIA_TYPES,
+    ScreenshotFormat,
+    encode_screenshot,
+    needs_raw_capture,
+)
+from mobile_world.runtime.utils.stabilization import StabilizationResult
 from mobile_world.tasks.registry import TaskRegistry
 
 SUITE_FAMILY: str = "mobile_world"
@@ -63,10 +76,13 @@ def initialize_suite_family(suite_family: str) -> None:
     logger.info(f"Initializing suite_family: {suite_family}")
 
     task_registry = TaskRegistry()
-    logger.info(f"Loaded {len(task_registry.tasks)} mobile_world tasks")
+    logger.info(f"Loaded {len(task_registry.list_tasks())} mobile_world tasks")
 
 
 CONTROLLERS: dict[str, AndroidController] = {}
+HEALTH_MONITORS: dict[str, DeviceHealthMonitor] = {}
+# guards creating and clearing the controller and monitor of a device
+_controllers_lock = threading.Lock()
 
 # Lock and tracking for emulator restart to prevent concurrent restarts
 _restart_lock = threading.Lock()
@@ -75,15 +91,39 @@ RESTART_COOLDOWN_SECONDS = 300  # Minimum time between restart attempts
 
 
 def ensure_controller(req_device: str) -> AndroidController:
-    if req_device not in CONTROLLERS:
-        logger.info(f"[INIT] Device {req_device} not initialized, initializing...")
-        ctr = AndroidController(device=req_device)
-        CONTROLLERS[req_device] = ctr
-    if not CONTROLLERS[req_device].check_health(try_times=3):
+    with _controllers_lock:
+        # the monitor is registered last, so its presence means the device is set up
+        if req_device not in HEALTH_MONITORS:
+            logger.info(f"[INIT] Device {req_device} not initialized, initializing...")
+            ctr = AndroidController(device=req_device)
+            CONTROLLERS[req_device] = ctr
+            HEALTH_MONITORS[req_device] = DeviceHealthMonitor(ctr).start()
+        ctr = CONTROLLERS[req_device]
+        monitor = HEALTH_MONITORS[req_device]
+    # cached heartbeat result; probes synchronously only when stale or unhealthy
+    if not monitor.is_healthy(try_times=3):
         logger.error(f"[INIT] Device {req_device} is not healthy, restarting...")
         raise HTTPException(status_code=500, detail="Device is not healthy")
         # restart_emulator_with_avd(AVD_MAPPING[SUITE_FAMILY])
-    return CONTROLLERS[req_device]
+    return ctr
+
+
+def _invalidate_health(device: str) -> None:
+    """Make the next request re-check the device after an adb call failed."""
+    monitor = HEALTH_MONITORS.get(device)
+    if monitor is not None:
+        monitor.invalidate()
+
+
+def _clear_controllers() -> None:
+    """Stop the health monitors and close the pooled adb connections of all devices."""
+    with _controllers_lock:
+        for monitor in HEALTH_MONITORS.values():
+            monitor.stop()
+        for ctr in CONTROLLERS.values():
+            ctr.transport.close()
+        HEALTH_MONITORS.clear()
+        CONTROLLERS.clear()
 
 
 app = FastAPI(title="Mobile GUI Agent Benchmark Server", version="0.1.0")
@@ -111,8 +151,8 @@ def health():
     all_healthy = True
     unhealthy_devices = []
 
-    for device_id, controller in CONTROLLERS.items():
-        is_healthy = controller.check_health(try_times=2)
+    for device_id, monitor in list(HEALTH_MONITORS.items()):
+        is_healthy = monitor.is_healthy(try_times=2)
         device_status[device_id] = is_healthy
         if not is_healthy:
             all_healthy = False
@@ -161,9 +201,18 @@ def health():
         "ok": all_healthy,
         "devices": list(CONTROLLERS.keys()),
         "device_status": device_status,
+        "device_metrics": {
+            device_id: monitor.metrics() for device_id, monitor in list(HEALTH_MONITORS.items())
+        },
     }
 
 
+@app.get("/metrics")
+def metrics():
+    """Cached health state, last-check age and probe latency per device."""
+    return {device_id: monitor.metrics() for device_id, monitor in list(HEALTH_MONITORS.items())}
+
+
 def _init_controller(device: str) -> dict[str, Any]:
     """Helper function to initialize controller and return response."""
     logger.info(f"[INIT] Request: device={device}")
@@ -208,31 +257,133 @@ def get_state(device: str = Query(..., description="adb device ID")):
     return response
 
 
+def _wait_for_stable_screen(
+    ctr: AndroidController,
+    stable_frames: int,
+    timeout: float,
+    interval: float,
+    min_wait: float = 0.0,
+) -> StabilizationResult[bytes]:
+    """Poll raw framebuffer captures until `stable_frames` consecutive ones match."""
+    result = ctr.wait_for_stable_screen(
+        stable_frames=stable_frames, timeout=timeout, interval=interval, min_wait=min_wait
+    )
+    logger.info(
+        f"[SCREENSHOT] Stabilization: device={ctr.device}, stable={result.stable}, "
+        f"waited={result.waited:.3f}s, frames={result.frames}"
+    )
+    return result
+
+
+def _stabilization_info(result: StabilizationResult) -> dict[str, Any]:
+    return {"stable": result.stable, "waited": result.waited, "frames": result.frames}
+
+
+def _stabilization_headers(result: StabilizationResult) -> dict[str, str]:
+    return {
+        "X-Screenshot-Stable": str(result.stable).lower(),
+        "X-Screenshot-Stable-Wait": f"{result.waited:.3f}",
+        "X-Screenshot-Stable-Frames": str(result.frames),
+    }
+
+
+def _capture_screenshot_response(
+    ctr: AndroidController,
+    image_format: ScreenshotFormat,
+    quality: int,
+    save: bool,
+    prefix: str | None,
+    stabilization: StabilizationResult | None = None,
+) -> Response:
+    """Capture a screenshot in memory and return it as a binary response.
+
+    When the screen was just stabilized from raw captures, the last stable frame is
+    reused for raw-based formats instead of capturing again.
+    """
+    try:
+        raw = needs_raw_capture(image_format)
+        if stabilization is not None and raw:
+            data = stabilization.frame
+        else:
+            data = ctr.capture_screenshot(raw=raw)
+        body, headers = encode_screenshot(data, image_format, quality=quality)
+    except (AdbTransportError, ValueError) as e:
+        logger.error(f"[SCREENSHOT] Failed to capture screenshot for device {ctr.device}: {e}")
+        _invalidate_health(ctr.device)
+        raise HTTPException(status_code=500, detail=f"screencap failed: {e}")
+
+    if save:
+        ddir = device_dir(ARTIFACTS_ROOT, ctr.device) / "screens"
+        ddir.mkdir(parents=True, exist_ok=True)
+        name = prefix or time.strftime("%Y%m%d_%H%M%S")
+        path = ddir / f"{name}.{image_format}"
+        path.write_bytes(body)
+        headers["X-Screenshot-Path"] = str(path)
+    if stabilization is not None:
+        headers.update(_stabilization_headers(stabilization))
+
+    logger.info(
+        f"[SCREENSHOT] Success ({image_format}): device={ctr.device}, bytes={len(body)}, saved={save}"
+    )
+    return Response(content=body, media_type=SCREENSHOT_MEDIA_TYPES[image_format], headers=headers)
+
+
 @app.get("/screenshot")
 def get_screenshot(
     device: str = Query(...),
     prefix: str | None = Query(None),
     return_b64: bool = Query(False),
+    image_format: ScreenshotFormat | None = Query(
+        None, description="Return raw image bytes in this format instead of JSON"
+    ),
+    quality: int = Query(90, ge=1, le=100, description="WebP/JPEG quality"),
+    save: bool = Query(False, description="Also write the binary screenshot to the artifacts dir"),
+    stable: bool = Query(False, description="Wait until the screen stops changing first"),
+    stable_frames: int = Query(3, ge=2, description="Consecutive matching frames required"),
+    stable_timeout: float = Query(2.0, ge=0, description="Maximum seconds to wait for stability"),
+    stable_interval: float = Query(0.1, ge=0, description="Seconds between stability probes"),
+    stable_min_wait: float = Query(0.0, ge=0, description="Seconds before the first probe"),
 ):
-    logger.info(f"[SCREENSHOT] Request: device={device}, prefix={prefix}, return_b64={return_b64}")
+    logger.info(
+        f"[SCREENSHOT] Request: device={device}, prefix={prefix}, return_b64={return_b64}, "
+        f"image_format={image_format}, stable={stable}"
+    )
 
     ctr = ensure_controller(device)
+    stabilization = None
+    if stable:
+        try:
+            stabilization = _wait_for_stable_screen(
+                ctr, stable_frames, stable_timeout, stable_interval, stable_min_wait
+            )
+        except (AdbTransportError, ValueError) as e:
+            logger.error(f"[SCREENSHOT] Stabilization failed for device {device}: {e}")
+            _invalidate_health(device)
+            raise HTTPException(status_code=500, detail=f"screen stabilization failed: {e}")
+    if image_format is not None:
+        return _capture_screenshot_response(ctr, image_format, quality, save, prefix, stabilization)
+
     ddir = device_dir(ARTIFACTS_ROOT, device) / "screens"
     ddir.mkdir(parents=True, exist_ok=True)
     name = prefix or time.strftime("%Y%m%d_%H%M%S")
     result = ctr.get_screenshot(name, str(ddir), try_times=2)
     if not result.success:
         logger.error(f"[SCREENSHOT] Failed to capture screenshot for device {device}")
+        _invalidate_health(device)
         raise HTTPException(status_code=500, detail=f"screencap/pull failed: {result.error}")
 
     if return_b64:
         with open(result.output, "rb") as f:
             b = base64.b64encode(f.read()).decode("utf-8")
         response = {"device": device, "path": str(result.output), "b64_png": b}
+        if stabilization is not None:
+            response["stabilization"] = _stabilization_info(stabilization)
         logger.info(f"[SCREENSHOT] Success (b64): device={device}, path={result.output}")
         return response
     # Default return file path (can also be retrieved via /download)
     response = {"device": device, "path": str(result.output)}
+    if stabilization is not None:
+        response["stabilization"] = _stabilization_info(stabilization)
     logger.info(f"[SCREENSHOT] Success: {response}")
     return response
 
@@ -307,111 +458,121 @@ def simulate_sms(req: SmsRequest):
     return response
 
 
-@app.post("/step")
-def step(req: StepRequest):
-    logger.info(f"[STEP] Request: device={req.device}, action={req.action}")
+def _run_action(ctr: AndroidController, action: JSONAction) -> Any:
+    """Execute a single action on the device and return its result."""
+    action_type = action.action_type
+    ret = None
 
-    ctr = ensure_controller(req.device)
+    if action_type == CLICK:
+        x, y = int(action.x), int(action.y)
+        logger.info(f"[STEP] Executing click at ({x}, {y})")
+        ret = ctr.tap(x, y)
 
-    try:
-        action = req.action
-        action_type = action.action_type
-
-        if action_type == CLICK:
-            x, y = int(action.x), int(action.y)
-            logger.info(f"[STEP] Executing click at ({x}, {y})")
-            ret = ctr.tap(x, y)
+    elif action_type == SWIPE:
+        direction = action.direction or "up"
+        logger.info(f"[STEP] Executing swipe: x={action.x}, y={action.y}, direction={direction}")
+        ret = ctr.swipe(action.x, action.y, direction)
 
-        elif action_type == SWIPE:
-            direction = action.direction or "up"
-            logger.info(
-                f"[STEP] Executing swipe: x={action.x}, y={action.y}, direction={direction}"
-            )
-            ret = ctr.swipe(action.x, action.y, direction)
-
-        elif action_type == INPUT_TEXT:
-            text = action.text
-            logger.info(f"[STEP] Executing text input: '{text}'")
-            if text != "":
-                ret = ctr.text(text)
-            else:
-                logger.warning("[STEP] Text input is empty, skipping")
-
-        elif action_type == NAVIGATE_BACK:
-            logger.info("[STEP] Executing back button")
-            ret = ctr.back()
-
-        elif action_type == NAVIGATE_HOME:
-            logger.info("[STEP] Executing home button")
-            ret = ctr.home()
-
-        elif action_type == KEYBOARD_ENTER:
-            logger.info("[STEP] Executing enter key")
-            ret = ctr.enter()
-
-        elif action_type == LONG_PRESS:
-            x, y = int(action.x), int(action.y)
-            logger.info(f"[STEP] Executing long_press at ({x}, {y})")
-            ret = ctr.long_press(x, y, 1000)
-
-        elif action_type == DOUBLE_TAP:
-            x, y = int(action.x), int(action.y)
-            logger.info(f"[STEP] Executing double_tap at ({x}, {y})")
-            ret = ctr.double_tap(x, y)
-
-        elif action_type == DRAG:
-            start_x, start_y = int(action.start_x), int(action.start_y)
-            end_x, end_y = int(action.end_x), int(action.end_y)
-            logger.info(f"[STEP] Executing drag from ({start_x}, {start_y}) to ({end_x}, {end_y})")
-            ret = ctr.drag(start_x, start_y, end_x, end_y)
-
-        elif action_type == SCROLL:
-            # Map scroll to swipe for compatibility
-            # scroll direction is reversed compared to swipe
-            direction = "down" if action.direction == "up" else "up"
-            logger.info(
-                f"[STEP] Executing scroll: direction={action.direction}; equivalent to swipe {direction}"
-            )
-            ret = ctr.swipe(None, None, direction)
+    elif action_type == INPUT_TEXT:
+        text = action.text
+        logger.info(f"[STEP] Executing text input: '{text}'")
+        if text != "":
+            ret = ctr.text(text)
+        else:
+            logger.warning("[STEP] Text input is empty, skipping")
+
+    elif action_type == NAVIGATE_BACK:
+        logger.info("[STEP] Executing back button")
+        ret = ctr.back()
+
+    elif action_type == NAVIGATE_HOME:
+        logger.info("[STEP] Executing home button")
+        ret = ctr.home()
+
+    elif action_type == KEYBOARD_ENTER:
+        logger.info("[STEP] Executing enter key")
+        ret = ctr.enter()
+
+    elif action_type == LONG_PRESS:
+        x, y = int(action.x), int(action.y)
+        logger.info(f"[STEP] Executing long_press at ({x}, {y})")
+        ret = ctr.long_press(x, y, 1000)
+
+    elif action_type == DOUBLE_TAP:
+        x, y = int(action.x), int(action.y)
+        logger.info(f"[STEP] Executing double_tap at ({x}, {y})")
+        ret = ctr.double_tap(x, y)
+
+    elif action_type == DRAG:
+        start_x, start_y = int(action.start_x), int(action.start_y)
+        end_x, end_y = int(action.end_x), int(action.end_y)
+        logger.info(f"[STEP] Executing drag from ({start_x}, {start_y}) to ({end_x}, {end_y})")
+        ret = ctr.drag(start_x, start_y, end_x, end_y)
+
+    elif action_type == SCROLL:
+        # Map scroll to swipe for compatibility
+        # scroll direction is reversed compared to swipe
+        direction = "down" if action.direction == "up" else "up"
+        logger.info(
+            f"[STEP] Executing scroll: direction={action.direction}; equivalent to swipe {direction}"
+        )
+        ret = ctr.swipe(None, None, direction)
 
-        elif action_type == OPEN_APP:
-            app_name = action.app_name
-            logger.info(f"[STEP] Executing open_app: {app_name}")
-            ret = ctr.launch_app(app_name)
+    elif action_type == OPEN_APP:
+        app_name = action.app_name
+        logger.info(f"[STEP] Executing open_app: {app_name}")
+        ret = ctr.launch_app(app_name)
 
-        elif action_type == WAIT:
-            logger.info("[STEP] Executing wait for 1 second")
+    elif action_type == WAIT:
+        # returns early once the screen has settled, at most after 1 second
+        logger.info("[STEP] Executing wait for up to 1 second")
+        try:
+            result = _wait_for_stable_screen(ctr, stable_frames=3, timeout=1.0, interval=0.1)
+            ret = f"OK (waited {result.waited:.2f}s)"
+        except (AdbTransportError, ValueError) as e:
+            logger.warning(f"[STEP] Stability probe failed, sleeping instead: {e}")
             time.sleep(1.0)
             ret = "OK"
 
-        elif action_type == ANSWER:
-            text = action.text or ""
-            logger.info(f"[STEP] Executing answer: '{text}'")
-            ctr.answer(text)
-            ret = "OK"
+    elif action_type == ANSWER:
+        text = action.text or ""
+        logger.info(f"[STEP] Executing answer: '{text}'")
+        ctr.answer(text)
+        ret = "OK"
 
-        elif action_type == STATUS:
-            status = action.goal_status or "unknown"
-            logger.info(f"[STEP] Executing status: {status}")
-            ret = status
+    elif action_type == STATUS:
+        status = action.goal_status or "unknown"
+        logger.info(f"[STEP] Executing status: {status}")
+        ret = status
 
-        elif action_type == ASK_USER:
-            logger.info("[STEP] Executing ask_user")
-            agent_question = action.text
-            ret = ctr.ask_user(agent_question)
+    elif action_type == ASK_USER:
+        logger.info("[STEP] Executing ask_user")
+        agent_question = action.text
+        ret = ctr.ask_user(agent_question)
 
-        elif action_type == UNKNOWN:
-            logger.info("[STEP] Executing unknown action")
-            ret = "UNKNOWN_ACTION"
+    elif action_type == UNKNOWN:
+        logger.info("[STEP] Executing unknown action")
+        ret = "UNKNOWN_ACTION"
 
-        else:
-            logger.error(f"[STEP] Unknown action: {action_type}")
-            raise HTTPException(status_code=400, detail=f"unknown action: {action_type}")
+    else:
+        logger.error(f"[STEP] Unknown action: {action_type}")
+        raise HTTPException(status_code=400, detail=f"unknown action: {action_type}")
 
-        if isinstance(ret, AdbResponse):
-            ret = ret.output
-        else:
-            ret = ret if ret is not None else "OK"
+    if isinstance(ret, AdbResponse):
+        return ret.output
+    return ret if ret is not None else "OK"
+
+
+@app.post("/step")
+def step(req: StepRequest):
+    logger.info(f"[STEP] Request: device={req.device}, action={req.action}")
+
+    ctr = ensure_controller(req.device)
+
+    try:
+        action = req.action
+        action_type = action.action_type
+        ret = _run_action(ctr, action)
         response = {
             "device": req.device,
             "action": action,
@@ -424,7 +585,70 @@ def step(req: StepRequest):
         raise HTTPException(status_code=400, detail=f"missing param: {e}")
     except Exception as e:
         logger.error(f"[STEP] Error executing action {action_type}: {str(e)}")
+        _invalidate_health(req.device)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/step_and_observe")
+def step_and_observe(req: StepAndObserveRequest):
+    """Execute the requested actions in order, then return the next screenshot.
+
+    The body is the binary screenshot (as for `/screenshot?image_format=...`); the
+    per-action results are JSON-encoded in the `X-Step-Results` header. The device
+    health check runs once for the whole batch.
+    """
+    actions = req.all_actions()
+    logger.info(f"[STEP_AND_OBSERVE] Request: device={req.device}, actions={len(actions)}")
+    if not actions:
+        raise HTTPException(status_code=400, detail="no action given")
+
+    ctr = ensure_controller(req.device)
+
+    results = []
+    action_type = None
+    start = time.perf_counter()
+    try:
+        for action in actions:
+            action_type = action.action_type
+            results.append(_run_action(ctr, action))
+    except HTTPException:
+        raise
+    except KeyError as e:
+        logger.error(f"[STEP_AND_OBSERVE] Missing parameter: {e}")
+        raise HTTPException(status_code=400, detail=f"missing param: {e}")
+    except Exception as e:
+        logger.error(f"[STEP_AND_OBSERVE] Error executing action {action_type}: {str(e)}")
+        _invalidate_health(req.device)
         raise HTTPException(status_code=500, detail=str(e))
+    action_time = time.perf_counter() - start
+
+    stabilization = None
+    if req.stable:
+        try:
+            stabilization = _wait_for_stable_screen(
+                ctr, req.stable_frames, req.stable_timeout, req.stable_interval, req.stable_min_wait
+            )
+        except (AdbTransportError, ValueError) as e:
+            logger.error(f"[STEP_AND_OBSERVE] Stabilization failed for {req.device}: {e}")
+            _invalidate_health(req.device)
+            raise HTTPException(status_code=500, detail=f"screen stabilization failed: {e}")
+
+    response = _capture_screenshot_response(
+        ctr, req.image_format, req.quality, False, None, stabilization
+    )
+    response.headers["X-Step-Results"] = json.dumps(results, default=str)
+    response.headers["X-Step-Action-Time"] = f"{action_time:.3f}"
+    return response
+
+
+def _task_summary(entry: dict) -> dict:
+    """`/task/list` and `/task/metadata` fields of a task manifest entry."""
+    return {
+        "name": entry["name"],
+        "tags": entry["tags"],
+        "apps": entry["apps"],
+        "requirements": entry["requirements"],
+    }
 
 
 @app.get("/task/list")
@@ -437,15 +661,7 @@ def get_task_list():
 
     logger.info("[TASK_LIST] Getting available tasks")
 
-    task_list = []
-    for task_name, task in task_registry.tasks.items():
-        task_list.append(
-            {
-                "name": task_name,
-                "tags": list(task.task_tags) if hasattr(task, "task_tags") else [],
-                "apps": list(task.app_names) if hasattr(task, "app_names") else [],
-            }
-        )
+    task_list = [_task_summary(entry) for entry in task_registry.list_metadata()]
 
     logger.info(f"[TASK_LIST] Returning {len(task_list)} tasks")
     return JSONResponse(status_code=200, content=task_list)
@@ -460,8 +676,7 @@ def get_task_goal(task_name: str):
         )
 
     logger.info(f"[TASK_GOAL] Getting goal for task: {task_name}")
-    task = task_registry.get_task(task_name)
-    return JSONResponse(status_code=200, content=task.goal)
+    return JSONResponse(status_code=200, content=task_registry.get_goal(task_name))
 
 
 @app.get("/task/metadata")
@@ -472,12 +687,7 @@ def get_task_metadata(task_name: str):
             status_code=500, detail="Task registry not initialized. Server not properly configured."
         )
     logger.info(f"[TASK_METADATA] Getting metadata for task: {task_name}")
-    task = task_registry.get_task(task_name)
-    metadata = {
-        "name": task_name,
-        "tags": list(task.task_tags) if hasattr(task, "task_tags") else [],
-        "apps": list(task.app_names) if hasattr(task, "app_names") else [],
-    }
+    metadata = _task_summary(task_registry.get_metadata(task_name))
     return JSONResponse(status_code=200, content=metadata)
 
 
@@ -516,11 +726,8 @@ def eval_task(req: TaskOperationRequest):
     ctr = ensure_controller(req.req_device)
     logger.info(f"[TASK_IS_SUCCESSFUL] Checking if task is successful: {req.task_name}")
     task = task_registry.get_task(req.task_name)
-    ret = task.is_successful(ctr)
-    if isinstance(ret, tuple):
-        return JSONResponse(status_code=200, content={"score": ret[0], "reason": ret[1]})
-    else:
-        return JSONResponse(status_code=200, content={"score": ret})
+    report = task.evaluate(ctr)
+    return JSONResponse(status_code=200, content=report.to_response())
 
 
 @app.post("/task/tear_down")
@@ -535,6 +742,7 @@ def tear_down_task(req: TaskOperationRequest):
     ctr = ensure_controller(req.req_device)
     task = task_registry.get_task(req.task_name)
     task.tear_down(ctr)
+    invalidate_device_snapshot(ctr.device)
     global RUNNING_TASK
     RUNNING_TASK = None
     return JSONResponse(status_code=200, content="OK")
@@ -648,7 +856,7 @@ def switch_suite_family(target_family: str = Query(..., description="Target suit
         target_avd = AVD_MAPPING[target_family]
 
         logger.info("[SUITE_FAMILY_SWITCH] Clearing controller registry")
-        CONTROLLERS.clear()
+        _clear_controllers()
 
         logger.info(f"[SUITE_FAMILY_SWITCH] Restarting emulator with AVD {target_avd}")
         device_id = restart_emulator_with_avd(target_avd)
@@ -662,11 +870,7 @@ def switch_suite_family(target_family: str = Query(..., description="Target suit
             "switched": True,
             "emulator_device_id": device_id,
             "avd_name": target_avd,
-            "num_tasks": (
-                len(task_registry.tasks)
-                if hasattr(task_registry, "tasks")
-                else len(task_registry.list_tasks())
-            ),
+            "num_tasks": len(task_registry.list_tasks()),
         }
 
         logger.info(f"[SUITE_FAMILY_SWITCH] Success: {response}")
@@ -3,34 +3,34 @@
 import argparse
 import json
 import sys
-import time
 from collections.abc import Callable
 from pathlib import Path
 
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
 from dotenv import dotenv_values
 from mobile_world.core.api.env import (
     DEFAULT_IMAGE,
+    DEFAULT_MAX_PARALLEL_LAUNCHES,
     DEFAULT_NAME_PREFIX,
     ContainerConfig,
+    LaunchResult,
     check_image_status,
     check_prerequisites,
     find_available_ports,
     find_next_container_index,
     get_container_info,
     kill_server_in_container,
-    launch_container,
+    launch_container_configs,
     list_containers,
     pull_image,
     remove_containers,
     resolve_container_name,
     restart_server_in_container,
-    wait_for_container_ready,
 )
 from mobile_world.runtime.utils.docker import (
     build_run_command,
@@ -182,7 +182,24 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
         dest="launch_interval",
         type=int,
         default=10,
-        help="Seconds to wait between launching each container (default: 10)",
+        help="Minimum seconds between two container launches (default: 10)",
+    )
+    launch_parser.add_argument(
+        "--max-parallel",
+        "--max_parallel",
+        dest="max_parallel",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL_LAUNCHES,
+        help="Maximum number of containers booting at the same time "
+        f"(default: {DEFAULT_MAX_PARALLEL_LAUNCHES})",
+    )
+    launch_parser.add_argument(
+        "--max-retries",
+        "--max_retries",
+        dest="max_retries",
+        type=int,
+        default=1,
+        help="Times a container that fails to launch or become ready is recreated (default: 1)",
     )
 
     # Destroy subcommand
@@ -281,46 +298,6 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
     )
 
 
-def _wait_for_container_ready_with_progress(
-    backend_port: int, timeout: int = 120, start_time: float | None = None
-) -> bool:
-    """Wait for container to be ready with progress display."""
-    start_time = start_time or time.time()
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(
-            f"[cyan]Waiting for container on port {backend_port}...[/cyan]",
-            total=timeout,
-        )
-
-        while time.time() - start_time < timeout:
-            elapsed = time.time() - start_time
-            progress.update(task, completed=elapsed)
-
-            if wait_for_container_ready(backend_port, timeout=1, poll_interval=1):
-                progress.update(
-                    task,
-                    description=f"[green]✓ Ready![/green] (took {elapsed:.1f}s)",
-                    completed=timeout,
-                )
-                return True
-
-        progress.update(
-            task,
-            description="[red]✗ Timeout waiting for container[/red]",
-            completed=timeout,
-        )
-
-    return False
-
-
 def _launch_containers(args: argparse.Namespace) -> None:
     """Launch Docker containers."""
     count = args.count
@@ -543,90 +520,60 @@ def _launch_containers(args: argparse.Namespace) -> None:
         )
         return
 
-    # Launch containers
-    launch_interval = args.launch_interval
-    launched = []
-
+    # Launch containers concurrently; each gets one progress row
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        TimeElapsedColumn(),
         console=console,
     ) as progress:
-        for idx, config in enumerate(container_configs):
-            task = progress.add_task(
-                f"[cyan]Launching {config.name}...[/cyan]",
-                total=None,
-            )
-
-            result = launch_container(config, wait_ready=False)
+        rows = {
+            config.name: progress.add_task(f"[dim]{config.name} queued[/dim]", total=None)
+            for config in container_configs
+        }
+        descriptions = {
+            "launching": "[cyan]Launching {name}...[/cyan]",
+            "launched": "[cyan]{name} launched, waiting for readiness...[/cyan]",
+            "ready": "[green]✓ {name} ready[/green] (took {ready_seconds:.1f}s)",
+            "retrying": "[yellow]⟳ {name} failed, recreating...[/yellow]",
+            "failed": "[red]✗ {name} failed[/red]",
+        }
 
-            if result.success:
-                progress.update(
-                    task,
-                    description=f"[green]✓ {config.name} launched[/green]",
-                )
-                launched.append(
-                    {
-                        "name": config.name,
-                        "backend_port": config.backend_port,
-                        "viewer_port": config.viewer_port,
-                        "vnc_port": config.vnc_port,
-                        "adb_port": config.adb_port,
-                        "ready": False,
-                    }
-                )
-            else:
-                progress.update(
-                    task,
-                    description=f"[red]✗ {config.name} failed[/red]",
-                )
-                console.print(
-                    Panel(
-                        f"[red]Failed to launch container '{config.name}'[/red]",
-                        title="[red]✗ Launch Failed[/red]",
-                        border_style="red",
-                    )
-                )
+        def on_progress(event: str, result: LaunchResult) -> None:
+            description = descriptions[event].format(
+                name=result.name, ready_seconds=result.ready_seconds or 0.0
+            )
+            if result.attempts > 1:
+                description += f" [dim](attempt {result.attempts})[/dim]"
+            progress.update(rows[result.name], description=description)
+
+        results = launch_container_configs(
+            container_configs,
+            max_parallel=args.max_parallel,
+            launch_interval=args.launch_interval,
+            ready_timeout=600,
+            max_retries=args.max_retries,
+            on_progress=on_progress,
+        )
 
-            if launch_interval > 0 and idx < len(container_configs) - 1:
-                wait_task = progress.add_task(
-                    f"[yellow]Waiting {launch_interval}s before next launch...[/yellow]",
-                    total=launch_interval,
-                )
-                for _ in range(launch_interval):
-                    time.sleep(1)
-                    progress.advance(wait_task)
-                progress.update(
-                    wait_task,
-                    description="[dim]✓ Wait complete[/dim]",
+    for result in results:
+        if not result.success:
+            console.print(
+                Panel(
+                    f"[red]Failed to launch container '{result.name}'[/red]",
+                    title="[red]✗ Launch Failed[/red]",
+                    border_style="red",
                 )
-
-    # Wait for all containers to become ready
-    if launched:
-        console.print()
-        console.print(
-            Panel(
-                f"[cyan]Waiting for {len(launched)} container(s) to become ready...[/cyan]",
-                title="[bold cyan]⏳ Waiting for Readiness[/bold cyan]",
-                border_style="cyan",
             )
-        )
-        start_time = time.time()
-        for container in launched:
-            console.print(f"\n[dim]Checking container '{container['name']}'...[/dim]")
-            if _wait_for_container_ready_with_progress(
-                container["backend_port"], timeout=600, start_time=start_time
-            ):
-                container["ready"] = True
-                console.print(f"[green]✓ Container '{container['name']}' is ready[/green]")
-            else:
-                console.print(
-                    Panel(
-                        f"[yellow]Container '{container['name']}' did not become ready in time[/yellow]",
-                        title="[yellow]⚠ Warning[/yellow]",
-                        border_style="yellow",
-                    )
+        elif not result.ready:
+            console.print(
+                Panel(
+                    f"[yellow]Container '{result.name}' did not become ready in time[/yellow]",
+                    title="[yellow]⚠ Warning[/yellow]",
+                    border_style="yellow",
                 )
+            )
+    launched = [result.model_dump() for result in results if result.success]
 
     ready_count = sum(1 for c in launched if c.get("ready", False))
     console.print()
@@ -650,6 +597,8 @@ def _launch_containers(args: argparse.Namespace) -> None:
     if args.vnc or args.dev:
         table.add_column("VNC", justify="right", style="yellow")
     table.add_column("Status", justify="center")
+    table.add_column("Attempts", justify="right")
+    table.add_column("Ready After", justify="right")
 
     for container in launched:
         status = (
@@ -667,6 +616,9 @@ def _launch_containers(args: argparse.Namespace) -> None:
         if args.vnc or args.dev:
             row_data.append(str(container["vnc_port"]))
         row_data.append(status)
+        row_data.append(str(container["attempts"]))
+        ready_seconds = container["ready_seconds"]
+        row_data.append("-" if ready_seconds is None else f"{ready_seconds:.1f}s")
         table.add_row(*row_data)
 
     console.print(table)
@@ -13,6 +13,9 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from mobile_world.runtime.utils.models import DEFAULT_IMAGE
+
+from ..async_runner import run_agent_with_evaluation_async
 from ..runner import run_agent_with_evaluation
 
 
@@ -94,6 +97,14 @@ def _add_common_arguments(parser: argparse.ArgumentParser) -> None:
         default=1.0,
         help="Wait time in seconds after each step (default: 1.0)",
     )
+    parser.add_argument(
+        "--screenshot-format",
+        "--screenshot_format",
+        dest="screenshot_format",
+        choices=["png", "rgba", "webp", "jpeg"],
+        default="png",
+        help="Binary screenshot format streamed from the env server (default: png)",
+    )
     parser.add_argument(
         "--suite-family",
         "--suite_family",
@@ -175,6 +186,21 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
         default=None,
         help="Maximum number of concurrent tasks to run, Note: min(max_concurrency, number of tasks, number of docker envs)",
     )
+    eval_parser.add_argument(
+        "--async-runner",
+        "--async_runner",
+        dest="async_runner",
+        action="store_true",
+        help="Drive all environments from one asyncio event loop instead of a thread per env",
+    )
+    eval_parser.add_argument(
+        "--max-llm-concurrency",
+        "--max_llm_concurrency",
+        dest="max_llm_concurrency",
+        type=int,
+        default=16,
+        help="Maximum in-flight agent predictions with --async-runner (default: 16)",
+    )
     eval_parser.add_argument(
         "--shuffle-tasks",
         "--shuffle_tasks",
@@ -182,6 +208,29 @@ def configure_parser(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Shuffle the order of tasks before running",
     )
+    eval_parser.add_argument(
+        "--schedule-tasks",
+        "--schedule_tasks",
+        dest="schedule_tasks",
+        action="store_true",
+        help="Group tasks by snapshot/backends/time sync and run each group on one env",
+    )
+    eval_parser.add_argument(
+        "--spare-envs",
+        "--spare_envs",
+        dest="spare_envs",
+        type=int,
+        default=0,
+        help="Warm spare containers to launch; an env whose device becomes unhealthy is "
+        "swapped for a spare and recycled (default: 0)",
+    )
+    eval_parser.add_argument(
+        "--spare-image",
+        "--spare_image",
+        dest="spare_image",
+        default=DEFAULT_IMAGE,
+        help=f"Docker image for spare containers (default: {DEFAULT_IMAGE})",
+    )
 
 
 async def execute(args: argparse.Namespace) -> None:
@@ -201,7 +250,7 @@ async def execute(args: argparse.Namespace) -> None:
     # Parse aw_host URLs - if None, will auto-discover; if provided, split by comma
     aw_urls = None if args.aw_host is None else args.aw_host.split(",")
 
-    task_results, task_list_with_no_results = run_agent_with_evaluation(
+    runner_kwargs = dict(
         agent_type=args.agent_type,
         model_name=args.model_name,
         llm_base_url=args.llm_base_url,
@@ -215,6 +264,7 @@ async def execute(args: argparse.Namespace) -> None:
         executor_agent_class=args.executor_agent_class,
         device=args.device or "emulator-5554",
         step_wait_time=args.step_wait_time or 1.0,
+        screenshot_format=getattr(args, "screenshot_format", "png"),
         suite_family=args.suite_family or "mobile_world",
         env_name_prefix=args.env_name_prefix,
         env_image=args.env_image,
@@ -224,6 +274,21 @@ async def execute(args: argparse.Namespace) -> None:
         shuffle_tasks=args.shuffle_tasks,
         scale_factor=getattr(args, "scale_factor", 1000),
     )
+    if getattr(args, "async_runner", False):
+        if args.schedule_tasks:
+            logger.warning("--schedule-tasks is not supported with --async-runner, ignoring it")
+        if args.spare_envs:
+            logger.warning("--spare-envs is not supported with --async-runner, ignoring it")
+        task_results, task_list_with_no_results = await run_agent_with_evaluation_async(
+            max_llm_concurrency=args.max_llm_concurrency, **runner_kwargs
+        )
+    else:
+        task_results, task_list_with_no_results = run_agent_with_evaluation(
+            schedule=args.schedule_tasks,
+            spare_envs=args.spare_envs,
+            spare_image=args.spare_image,
+            **runner_kwargs,
+        )
     if run_all_tasks and task_results:
         total_duration = time.time() - start_time
 
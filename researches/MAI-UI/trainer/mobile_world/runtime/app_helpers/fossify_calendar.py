@@ -1,14 +1,14 @@
-import json
 import random
 from datetime import datetime
 
-from mobile_world.runtime.utils.helpers import execute_adb
+from mobile_world.runtime.utils.provisioning import ProvisionManifest, SqlRows, provision
+from mobile_world.runtime.utils.root_sql import root_sql_session
 
 # make sure the emulator is rootable and adb root
 db_path = "/data/user/0/org.fossify.calendar/databases/events.db"
 
 
-def insert_calendar_event(
+def calendar_event_row(
     title: str,
     start_time: int | datetime | str,
     end_time: int | datetime | str,
@@ -37,7 +37,7 @@ def insert_calendar_event(
     status: int = 1,
 ):
     """
-    Insert a new calendar event into the database.
+    Build the row of a calendar event for the events table.
 
     Args:
         title: Event title
@@ -51,7 +51,7 @@ def insert_calendar_event(
         ... (other fields with defaults)
 
     Returns:
-        bool: True if successful, False otherwise
+        dict: column values of the event
     """
     # Convert start_time to timestamp
     if isinstance(start_time, datetime):
@@ -77,46 +77,80 @@ def insert_calendar_event(
     import_id = f"mock{random.randint(1000, 9999)}"
     last_updated = int(datetime.now().timestamp() * 1000)
 
-    # Escape single quotes in strings
-    title = title.replace("'", "''")
-    location = location.replace("'", "''")
-    description = description.replace("'", "''")
-
-    # Build INSERT statement
-    insert_sql = f"""INSERT INTO events (
-        start_ts, end_ts, title, location, description,
-        reminder_1_minutes, reminder_2_minutes, reminder_3_minutes,
-        reminder_1_type, reminder_2_type, reminder_3_type,
-        repeat_interval, repeat_rule, repeat_limit,
-        repetition_exceptions, attendees, import_id, time_zone,
-        flags, event_type, parent_id, last_updated, source,
-        availability, access_level, color, type, status
-    ) VALUES (
-        {start_ts}, {end_ts}, '{title}', '{location}', '{description}',
-        {reminder_1_minutes}, {reminder_2_minutes}, {reminder_3_minutes},
-        {reminder_1_type}, {reminder_2_type}, {reminder_3_type},
-        {repeat_interval}, {repeat_rule}, {repeat_limit},
-        '{repetition_exceptions}', '{attendees}', '{import_id}', '{time_zone}',
-        {flags}, {event_type}, {parent_id}, {last_updated}, '{source}',
-        {availability}, {access_level}, {color}, {type_field}, {status}
-    );"""
-
-    cmd = f'adb shell "sqlite3 {db_path} \\"{insert_sql}\\""'
-    result = execute_adb(cmd, root_required=True)
+    return {
+        "start_ts": start_ts,
+        "end_ts": end_ts,
+        "title": title,
+        "location": location,
+        "description": description,
+        "reminder_1_minutes": reminder_1_minutes,
+        "reminder_2_minutes": reminder_2_minutes,
+        "reminder_3_minutes": reminder_3_minutes,
+        "reminder_1_type": reminder_1_type,
+        "reminder_2_type": reminder_2_type,
+        "reminder_3_type": reminder_3_type,
+        "repeat_interval": repeat_interval,
+        "repeat_rule": repeat_rule,
+        "repeat_limit": repeat_limit,
+        "repetition_exceptions": repetition_exceptions,
+        "attendees": attendees,
+        "import_id": import_id,
+        "time_zone": time_zone,
+        "flags": flags,
+        "event_type": event_type,
+        "parent_id": parent_id,
+        "last_updated": last_updated,
+        "source": source,
+        "availability": availability,
+        "access_level": access_level,
+        "color": color,
+        "type": type_field,
+        "status": status,
+    }
+
+
+def insert_calendar_events(events: list[dict]) -> bool:
+    """
+    Insert calendar events into the database in one transaction.
 
-    if not result.success:
-        raise RuntimeError(f"Failed to insert calendar event: {result.error}")
+    Args:
+        events: rows built with `calendar_event_row`
 
+    Returns:
+        bool: True if successful
+
+    Raises:
+        RuntimeError: If the events could not be inserted
+    """
+    result = provision(ProvisionManifest(sql=[SqlRows(db_path, "events", events)]))
+    if not result.success:
+        raise RuntimeError(f"Failed to insert calendar events: {result.error}")
     return True
 
 
+def insert_calendar_event(*args, **kwargs) -> bool:
+    """
+    Insert a new calendar event into the database.
+
+    Takes the arguments of `calendar_event_row`.
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return insert_calendar_events([calendar_event_row(*args, **kwargs)])
+
+
 def get_calendar_events(
     time_range: list[int, int] | list[datetime, datetime] | list[str, str] | None = None,
     format_timestamp: bool = False,
+    local: bool = False,
 ):
     """
     Get all calendar events from the database.
 
+    With `local=True` a copy of the database is pulled and queried on the host, which
+    is faster for large calendars.
+
     Sample output:
     [{'id': 1,
       'start_ts': 1759622400,
@@ -164,16 +198,13 @@ def get_calendar_events(
             end_time = int(datetime.strptime(time_range[1], "%Y-%m-%d %H:%M:%S").timestamp())
         else:
             raise ValueError(f"Invalid time range: {time_range}")
-        cmd = f'adb shell "sqlite3 -json {db_path} \\"select * from events where start_ts >= {start_time} and end_ts <= {end_time}\\""'
+        sql = f"select * from events where start_ts >= {start_time} and end_ts <= {end_time}"
     else:
-        cmd = f'adb shell "sqlite3 -json {db_path} \\"select * from events\\""'
-    result = execute_adb(cmd, root_required=True)
-    if not result.success:
-        raise RuntimeError(f"Failed to get calendar events: {result.error}")
+        sql = "select * from events"
     try:
-        events = json.loads(result.output)
-    except json.JSONDecodeError:
-        return []
+        events = root_sql_session().query(db_path, sql, local=local)
+    except RuntimeError as e:
+        raise RuntimeError(f"Failed to get calendar events: {e}") from e
 
     if format_timestamp:
         for event in events:
@@ -2,21 +2,25 @@ import json
 from pathlib import Path
 
 from mobile_world.runtime.utils.helpers import execute_adb
+from mobile_world.runtime.utils.provisioning import FileItem, ProvisionManifest, provision
 
 
 def initialize_inbox(state: str):
     remote = "/sdcard/Android/data/com.gmailclone/files/" + state + ".json"
     root = Path(__file__).resolve().parent
     local = root / "assets" / f"{state}.json"
-    execute_adb(f"push {local} {remote}")
+    provision(ProvisionManifest(files=[FileItem(local, remote)]))
 
 
 def initialize_attachments():
     remote = "/sdcard/Android/data/com.gmailclone/files/attachments"
     root = Path(__file__).resolve().parent
     attachments_dir = root / "attachments"
-    for file in attachments_dir.iterdir():
-        execute_adb(f"push {file} {remote}")
+    provision(
+        ProvisionManifest(
+            files=[FileItem(file, f"{remote}/{file.name}") for file in attachments_dir.iterdir()]
+        )
+    )
 
 
 def get_sent_email_info():
@@ -14,9 +14,12 @@ import requests
 import urllib3
 from loguru import logger
 from PIL import Image
-from psycopg2 import Error
+from psycopg2 import Error, sql
 
 from mobile_world.runtime.controller import AndroidController
+from mobile_world.runtime.utils import backend_snapshot
+from mobile_world.runtime.utils.backend_lifecycle import lifecycle
+from mobile_world.runtime.utils.db_pool import PostgresPool
 from mobile_world.runtime.utils.helpers import execute_adb
 
 MASTODON_DOCKER_DIR = "/app/mastodon-docker"  # for docker-in-docker development
@@ -34,6 +37,22 @@ MASTODON_HEALTH_URL = "https://localhost/api/v1/instance"  # need host header 10
 PUBLIC_SYSTEM_ROOT = "/opt/mastodon/public/system"  # media directory inside the container
 MEDIA_ROOT = "/app/mastodon-docker/data/media"  # for docker-in-docker development
 
+# "template": keep the stack running between tasks and reset its state from a template
+# database; "restart": always recreate the compose stack from MASTODON_STATUS_DIR
+MASTODON_RESET_MODE = os.getenv("MASTODON_RESET_MODE", "template")
+MASTODON_TEMPLATE_DATABASE = "mastodon_template"
+BACKEND_NAME = "mastodon"  # key in `backend_lifecycle.lifecycle`
+MASTODON_REDIS_SERVICE = "redis"  # compose service name of the redis cache
+MASTODON_REDIS_DUMP = "/data/dump.rdb"  # RDB file inside the redis container
+# redis dataset saved with the database template; removed with the stack on a full restart
+MASTODON_REDIS_TEMPLATE = os.path.join(MASTODON_DOCKER_DIR, "redis_template.rdb")
+MASTODON_READY_TIMEOUT = 120  # seconds to wait for the web app after a warm reset
+
+# timings of the most recent reset, see `reset_mastodon_state`
+last_reset_timings: dict[str, float] = {}
+# status dir of the stack the templates were saved from; None if unknown in this process
+_template_status_dir: str | None = None
+
 
 def copytree_with_ownership(src, dst):
     """Copy a directory tree from src to dst, preserving ownership."""
@@ -117,15 +136,153 @@ def get_mastodon_services_info() -> str | None:
         return f"Error: {str(e)}"
 
 
+def _db_conn_kwargs() -> dict:
+    return {
+        "host": MASTODON_DB_HOST,
+        "user": MASTODON_DB_USER,
+        "password": MASTODON_DB_PASSWORD,
+        "port": MASTODON_DB_PORT,
+    }
+
+
+def _wait_mastodon_ready(timeout: float, interval: float = 0.5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not _is_mastodon_ready():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+
+def _compose(*args: str) -> subprocess.CompletedProcess:
+    cmd = ["docker", "compose", *args]
+    return subprocess.run(cmd, cwd=MASTODON_DOCKER_DIR, capture_output=True, text=True, check=True)
+
+
+def _snapshot_redis() -> None:
+    """Save the redis dataset (timelines, caches) to `MASTODON_REDIS_TEMPLATE`."""
+    _compose("exec", "-T", MASTODON_REDIS_SERVICE, "redis-cli", "SAVE")
+    _compose("cp", f"{MASTODON_REDIS_SERVICE}:{MASTODON_REDIS_DUMP}", MASTODON_REDIS_TEMPLATE)
+
+
+def _restore_redis() -> None:
+    """Restart redis on the saved dataset, the same state a full restart starts it with."""
+    _compose("stop", MASTODON_REDIS_SERVICE)
+    _compose("cp", MASTODON_REDIS_TEMPLATE, f"{MASTODON_REDIS_SERVICE}:{MASTODON_REDIS_DUMP}")
+    _compose("start", MASTODON_REDIS_SERVICE)
+
+
+def snapshot_mastodon_state(mastodon_backend_status_dir=MASTODON_STATUS_DIR) -> bool:
+    """Save the current database and redis dataset as templates for `reset_mastodon_state`.
+
+    Args:
+        mastodon_backend_status_dir: backup directory the running stack was started from
+    """
+    global _template_status_dir
+    _template_status_dir = None
+    try:
+        elapsed = backend_snapshot.snapshot_database(
+            MASTODON_DB_DATABASE, MASTODON_TEMPLATE_DATABASE, **_db_conn_kwargs()
+        )
+        redis_start = time.perf_counter()
+        _snapshot_redis()
+        logger.info(
+            f"[MASTODON] Saved templates in {elapsed + time.perf_counter() - redis_start:.2f}s"
+        )
+    except Exception as e:
+        logger.warning(f"[MASTODON] Failed to save templates: {e}")
+        return False
+    _template_status_dir = mastodon_backend_status_dir
+    return True
+
+
+def reset_mastodon_state(mastodon_backend_status_dir=MASTODON_STATUS_DIR) -> bool:
+    """Reset a running Mastodon backend to its initial state without restarting it.
+
+    Recreates the database from the template database, restarts redis on the saved
+    dataset and restores the media directory from `mastodon_backend_status_dir`.
+    Timings of each phase are logged and kept in `last_reset_timings`.
+
+    The templates are only used if they were saved from a stack started from
+    `mastodon_backend_status_dir`; otherwise a full restart is needed.
+
+    Returns:
+        True if the backend is ready again, False if a full restart is needed
+    """
+    start = time.perf_counter()
+    if _template_status_dir is None or _template_status_dir != mastodon_backend_status_dir:
+        logger.info(
+            f"[MASTODON] No templates saved from {mastodon_backend_status_dir}, "
+            "warm reset unavailable"
+        )
+        return False
+    try:
+        conn_kwargs = _db_conn_kwargs()
+        if not backend_snapshot.database_exists(
+            MASTODON_TEMPLATE_DATABASE, **conn_kwargs
+        ) or not os.path.exists(MASTODON_REDIS_TEMPLATE):
+            logger.info("[MASTODON] Templates missing, warm reset unavailable")
+            return False
+        timings = {
+            "database": backend_snapshot.restore_database(
+                MASTODON_DB_DATABASE, MASTODON_TEMPLATE_DATABASE, **conn_kwargs
+            )
+        }
+        _reset_db_caches()
+
+        redis_start = time.perf_counter()
+        _restore_redis()
+        timings["redis"] = time.perf_counter() - redis_start
+
+        if mastodon_backend_status_dir:
+            media_backup = os.path.join(
+                mastodon_backend_status_dir, os.path.relpath(MEDIA_ROOT, MASTODON_DOCKER_DIR)
+            )
+            timings["media"] = backend_snapshot.restore_directory(media_backup, MEDIA_ROOT)
+
+        ready_start = time.perf_counter()
+        if not _wait_mastodon_ready(MASTODON_READY_TIMEOUT):
+            logger.warning("[MASTODON] Backend not ready after warm reset")
+            return False
+        timings["ready"] = time.perf_counter() - ready_start
+        timings["total"] = time.perf_counter() - start
+    except Exception as e:
+        logger.warning(f"[MASTODON] Warm reset failed: {e}")
+        return False
+
+    lifecycle.mark_running(BACKEND_NAME, mastodon_backend_status_dir)
+    last_reset_timings.clear()
+    last_reset_timings.update(timings)
+    logger.info(
+        "[MASTODON] Warm reset finished in {:.2f}s ({})",
+        timings["total"],
+        ", ".join(f"{phase}={seconds:.2f}s" for phase, seconds in timings.items()),
+    )
+    return True
+
+
 def start_mastodon_backend(mastodon_backend_status_dir=MASTODON_STATUS_DIR) -> bool:
-    """Start the Mastodon backend."""
+    """Start the Mastodon backend, or reset it in place if it is already running.
+
+    With `MASTODON_RESET_MODE=template` a running stack is reset by `reset_mastodon_state`;
+    the full restart from `mastodon_backend_status_dir` is used otherwise and as fallback.
+
+    Args:
+        mastodon_backend_status_dir: backup directory with the initial state
+    """
     status = get_mastodon_backend_status()
+    if status == "running" and MASTODON_RESET_MODE == "template":
+        if reset_mastodon_state(mastodon_backend_status_dir):
+            return True
+        logger.info("[MASTODON] Falling back to a full restart")
     if status in ["running", "partial"]:
         logger.info("Mastodon backend is already running, stop and reset it to default")
-        stop_mastodon_backend()
+        stop_mastodon_backend(force=True)
     shutil.rmtree(MASTODON_DOCKER_DIR, ignore_errors=True)
+    _reset_db_caches()
 
     try:
+        start = time.perf_counter()
         # copy the backend status directory to the docker directory
         if mastodon_backend_status_dir:
             copytree_with_ownership(mastodon_backend_status_dir, MASTODON_DOCKER_DIR)
@@ -137,22 +294,45 @@ def start_mastodon_backend(mastodon_backend_status_dir=MASTODON_STATUS_DIR) -> b
         # mastodon backend ready to use check
         while not _is_mastodon_ready():
             time.sleep(3)
-
+        logger.info(f"[MASTODON] Full restart finished in {time.perf_counter() - start:.2f}s")
+
+        # the state right after a fresh start is what later warm resets restore
+        if MASTODON_RESET_MODE == "template" and snapshot_mastodon_state(
+            mastodon_backend_status_dir
+        ):
+            _wait_mastodon_ready(MASTODON_READY_TIMEOUT)
+        lifecycle.mark_running(BACKEND_NAME, mastodon_backend_status_dir)
         return True
     except subprocess.CalledProcessError as e:
+        lifecycle.mark_unknown(BACKEND_NAME)
         logger.error(f"Failed to start Mastodon backend: {e}")
         logger.error(f"Error output: {e.stderr}")
         return False
     except Exception as e:
+        lifecycle.mark_unknown(BACKEND_NAME)
         logger.error(f"Unexpected error starting Mastodon backend: {e}")
         return False
 
 
-def stop_mastodon_backend() -> bool:
-    """Stop the Mastodon backend."""
+def stop_mastodon_backend(force: bool = False) -> bool:
+    """Stop the Mastodon backend.
+
+    Args:
+        force: also stop a healthy stack in `template` reset mode, where it is otherwise
+            kept running for the next `start_mastodon_backend` to reset in place
+    """
+    keep_running = MASTODON_RESET_MODE == "template" and not force
+    if lifecycle.is_stopped(BACKEND_NAME) or (keep_running and lifecycle.is_running(BACKEND_NAME)):
+        return True
     try:
         status = get_mastodon_backend_status()
         if status == "stopped":
+            lifecycle.mark_stopped(BACKEND_NAME)
+            return True
+        if status == "running" and keep_running:
+            logger.debug("[MASTODON] Keeping backend running for warm reset")
+            if lifecycle.state(BACKEND_NAME).running is None:
+                lifecycle.mark_running(BACKEND_NAME, None)
             return True
         # Change to mastodon docker directory and stop services
         cmd = ["docker", "compose", "down"]
@@ -163,12 +343,15 @@ def stop_mastodon_backend() -> bool:
         logger.debug(f"Docker compose output: {result.stdout}\n{result.stderr}")
 
         shutil.rmtree(MASTODON_DOCKER_DIR)
+        lifecycle.mark_stopped(BACKEND_NAME)
         return True
     except subprocess.CalledProcessError as e:
+        lifecycle.mark_unknown(BACKEND_NAME)
         logger.error(f"Failed to stop Mastodon backend: {e}")
         logger.error(f"Error output: {e.stderr}")
         return False
     except Exception as e:
+        lifecycle.mark_unknown(BACKEND_NAME)
         logger.error(f"Unexpected error stopping Mastodon backend: {e}")
         return False
 
@@ -178,7 +361,7 @@ def restart_mastodon_backend() -> bool:
     logger.info("Restarting Mastodon backend...")
 
     # Stop the backend first
-    if not stop_mastodon_backend():
+    if not stop_mastodon_backend(force=True):
         logger.error("Failed to stop Mastodon backend during restart")
         return False
 
@@ -246,26 +429,144 @@ def get_mastodon_table_schema(table_name: str) -> list[tuple]:
             connection.close()
 
 
+_db_pool = PostgresPool(
+    host=MASTODON_DB_HOST,
+    database=MASTODON_DB_DATABASE,
+    user=MASTODON_DB_USER,
+    password=MASTODON_DB_PASSWORD,
+    port=MASTODON_DB_PORT,
+)
+# username -> account id of local accounts; cleared whenever the database is reset
+_account_ids: dict[str, int] = {}
+
+
+def _reset_db_caches() -> None:
+    _db_pool.reset()
+    _account_ids.clear()
+
+
 def connect_to_postgres() -> tuple[
     psycopg2.extensions.connection | None, psycopg2.extensions.cursor | None
 ]:
-    """Connect to the PostgreSQL database."""
+    """Check out a pooled connection to the PostgreSQL database.
+
+    `connection.close()` returns the connection to the pool.
+    """
     try:
-        connection = psycopg2.connect(
-            host=MASTODON_DB_HOST,
-            database=MASTODON_DB_DATABASE,
-            user=MASTODON_DB_USER,
-            password=MASTODON_DB_PASSWORD,
-            port=MASTODON_DB_PORT,
-        )
+        connection = _db_pool.getconn()
         cursor = connection.cursor()
-        logger.info("Connected to PostgreSQL database successfully!")
+        logger.debug("Connected to PostgreSQL database successfully!")
         return connection, cursor
     except Error as e:
         logger.error(f"Error connecting to PostgreSQL database: {e}")
         return None, None
 
 
+def get_account_id(username: str) -> int | None:
+    """Get the account id of a local account, cached per username."""
+    if username in _account_ids:
+        return _account_ids[username]
+    conn, cur = connect_to_postgres()
+    if conn is None or cur is None:
+        return None
+    try:
+        cur.execute(
+            "SELECT id FROM accounts WHERE username = %s AND domain IS NULL LIMIT 1", (username,)
+        )
+        row = cur.fetchone()
+    except Exception as e:
+        logger.error(f"Error fetching account id for {username}: {e}")
+        return None
+    finally:
+        cur.close()
+        conn.close()
+    if row is None:
+        return None
+    _account_ids[username] = row[0]
+    return row[0]
+
+
+# snapshot section -> (table, column matched against the account id)
+SNAPSHOT_SECTIONS = {
+    "user": ("users", "account_id"),
+    "statuses": ("statuses", "account_id"),
+    "bookmarks": ("bookmarks", "account_id"),
+    "favourites": ("favourites", "account_id"),
+    "status_pins": ("status_pins", "account_id"),
+    "following": ("follows", "account_id"),
+    "followers": ("follows", "target_account_id"),
+    "blocks": ("blocks", "account_id"),
+    "mutes": ("mutes", "account_id"),
+    "lists": ("lists", "account_id"),
+    "tag_follows": ("tag_follows", "account_id"),
+    "featured_tags": ("featured_tags", "account_id"),
+    "custom_filters": ("custom_filters", "account_id"),
+}
+
+
+def get_verification_snapshot(
+    username: str, sections: list[str] | None = None, limit: int = 50
+) -> dict | None:
+    """
+    Fetch the rows a task check needs for one user in a single query.
+
+    Args:
+        username: The local username
+        sections: Names from `SNAPSHOT_SECTIONS` to fetch, all by default
+        limit: Maximum rows per section, newest first
+
+    Returns:
+        Dictionary with the user's "account" row and one list of rows per section,
+        or None if error/not found. Rows are column -> value dicts decoded from JSON,
+        so timestamps are ISO-8601 strings.
+        e.g.:
+            {
+                "account": {"id": 115338428522805842, "username": "test", ...},
+                "bookmarks": [{"id": 5, "status_id": 115384014916118822, ...}],
+                "following": []
+            }
+    """
+    sections = list(SNAPSHOT_SECTIONS) if sections is None else sections
+    unknown = set(sections) - set(SNAPSHOT_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown snapshot sections: {sorted(unknown)}")
+    account_id = get_account_id(username)
+    if account_id is None:
+        logger.warning(f"User with username {username} not found")
+        return None
+
+    fields = [
+        sql.SQL("'account', (SELECT row_to_json(a) FROM accounts a WHERE a.id = %(account_id)s)")
+    ]
+    for section in sections:
+        table, column = SNAPSHOT_SECTIONS[section]
+        fields.append(
+            sql.SQL(
+                "{section}, (SELECT COALESCE(json_agg(t), '[]'::json) FROM ("
+                "SELECT * FROM {table} WHERE {column} = %(account_id)s "
+                "ORDER BY created_at DESC LIMIT %(limit)s) t)"
+            ).format(
+                section=sql.Literal(section),
+                table=sql.Identifier(table),
+                column=sql.Identifier(column),
+            )
+        )
+    query = sql.SQL("SELECT json_build_object({})").format(sql.SQL(", ").join(fields))
+
+    conn, cur = connect_to_postgres()
+    if conn is None or cur is None:
+        return None
+    try:
+        cur.execute(query, {"account_id": account_id, "limit": limit})
+        return cur.fetchone()[0]
+    except Exception as e:
+        logger.error(f"Error fetching verification snapshot for {username}: {e}")
+        return None
+    finally:
+        cur.close()
+        conn.close()
+
+
 # ================================================
 # database size query related
 # ================================================
@@ -2,11 +2,17 @@ import json
 import os
 import shutil
 import subprocess
+import threading
 import time
 
-import psycopg2
+import requests
 from loguru import logger
 from psycopg2 import Error
+from requests.adapters import HTTPAdapter
+
+from mobile_world.runtime.utils import backend_snapshot
+from mobile_world.runtime.utils.backend_lifecycle import lifecycle
+from mobile_world.runtime.utils.db_pool import PostgresPool
 
 MATTERMOST_DOCKER_DIR = "/app/mattermost-docker"
 COMPOSE_FILES = ["-f", "docker-compose.yml", "-f", "docker-compose.without-nginx.yml"]
@@ -17,6 +23,21 @@ MATTERMOST_DB_PASSWORD = "mmuser_password"
 MATTERMOST_DB_PORT = "5433"
 
 MATTERMOST_STATUS_DIR = "/app/mattermost-docker-bk"
+MATTERMOST_SERVER_URL = "http://127.0.0.1:8065"
+MATTERMOST_DATA_DIR = "volumes/app/mattermost/data"  # relative to the docker directory
+
+# "template": keep the stack running between tasks and reset its state from a template
+# database; "restart": always recreate the compose stack from MATTERMOST_STATUS_DIR
+MATTERMOST_RESET_MODE = os.getenv("MATTERMOST_RESET_MODE", "template")
+MATTERMOST_TEMPLATE_DATABASE = "mattermost_template"
+BACKEND_NAME = "mattermost"  # key in `backend_lifecycle.lifecycle`
+MATTERMOST_SERVICE = "mattermost"  # compose service name of the app server
+MATTERMOST_READY_TIMEOUT = 120
+
+# timings of the most recent start or reset, see `start_mattermost_backend`
+last_reset_timings: dict[str, float] = {}
+# status dir of the stack the template was saved from; None if unknown in this process
+_template_status_dir: str | None = None
 SAM_HARRY_CHANNEL_ID = "m3d6byju9ig4dneosajg9hu1be"
 HARRY_ID = "p11jse4oa3biikeeefcuggns9o"
 PHOENIX_CHANNEL_ID = "6xntskboopfwxysbdebkzqyckh"
@@ -39,31 +60,114 @@ USERS = {
 DEFAULT_PASSWORD = "password"
 
 
+class MattermostAPIError(Exception):
+    """A Mattermost REST call returned an error status."""
+
+
+def _create_http_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# shared by all MattermostCLI instances, so setup calls reuse keep-alive connections
+_http = _create_http_session()
+# login_id -> session token; cleared whenever the database is reset
+_session_tokens: dict[str, str] = {}
+_session_lock = threading.Lock()
+
+
+def clear_session_cache() -> None:
+    """Forget cached session tokens, e.g. after the database was replaced."""
+    with _session_lock:
+        _session_tokens.clear()
+
+
 class MattermostCLI:
+    """Task setup operations on the Mattermost server.
+
+    Talks to the REST API over a pooled HTTP session instead of spawning
+    `docker exec ... mmctl` per call. Session tokens are cached per user, so logging
+    in again as a user seen before costs no request; a cached token is only checked
+    when a call with it is rejected with 401, and the user is then logged in again.
+    """
+
     def __init__(
-        self, container_id: str = "mattermost-docker", server_url: str = "http://127.0.0.1:8065"
+        self, container_id: str = "mattermost-docker", server_url: str = MATTERMOST_SERVER_URL
     ):
         self.container_id = container_id
         self.server_url = server_url
-        self.auth_name = "cli-session"
-
-    def _exec_in_container(self, command: str) -> tuple[int, str, str]:
-        """Execute a command inside the Mattermost container."""
-        full_command = [
-            "docker",
-            "exec",
-            "-i",
-            f"{self.container_id}-mattermost-1",
-            "bash",
-            "-c",
-            command,
-        ]
-        result = subprocess.run(full_command, capture_output=True, text=True)
-        return result.returncode, result.stdout, result.stderr
+        self._token: str | None = None
+        self._team_ids: dict[str, str] = {}
+        # token -> (username, password) it was obtained with, to log in again on a 401
+        self._credentials: dict[str, tuple[str, str]] = {}
+
+    def _api(
+        self, method: str, path: str, token: str | None = None, timeout: float = 10, **kwargs
+    ) -> requests.Response:
+        """Call `/api/v4{path}`, raising `MattermostAPIError` on an error status.
+
+        If a cached session token was rejected (401), the user is logged in again and
+        the call is repeated once with the new token.
+        """
+        token = self._token if token is None else token
+        response = self._request(method, path, token, timeout, **kwargs)
+        if response.status_code == 401 and token in self._credentials:
+            new_token = self._get_token(*self._credentials.pop(token), cached=False)
+            if new_token is not None:
+                if self._token == token:
+                    self._token = new_token
+                response = self._request(method, path, new_token, timeout, **kwargs)
+        if not response.ok:
+            raise MattermostAPIError(f"{method} {path}: {response.status_code} {response.text}")
+        return response
+
+    def _request(
+        self, method: str, path: str, token: str | None, timeout: float, **kwargs
+    ) -> requests.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        start = time.perf_counter()
+        response = _http.request(
+            method, f"{self.server_url}/api/v4{path}", headers=headers, timeout=timeout, **kwargs
+        )
+        logger.debug(
+            f"[MATTERMOST] {method} {path} -> {response.status_code} "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+        return response
+
+    def _get_token(self, username: str, password: str, cached: bool = True) -> str | None:
+        """Return a session token for `username`, logging in only if none is cached.
+
+        Args:
+            cached: use a cached token; False to always log in, e.g. after a 401
+        """
+        with _session_lock:
+            token = _session_tokens.get(username) if cached else None
+        if token is None:
+            try:
+                response = self._api(
+                    "POST",
+                    "/users/login",
+                    token="",
+                    json={"login_id": username, "password": password},
+                )
+            except (MattermostAPIError, requests.RequestException) as e:
+                logger.debug(f"Login request failed for {username}: {e}")
+                return None
+            token = response.headers.get("Token")
+            if not token:
+                return None
+            with _session_lock:
+                _session_tokens[username] = token
+        self._credentials[token] = (username, password)
+        return token
 
     def _login_attempt(self, username: str, password: str) -> bool:
         """
-        Attempt to login to Mattermost using mmctl.
+        Attempt to login to Mattermost.
 
         Args:
             username: The user's email/username
@@ -72,16 +176,22 @@ class MattermostCLI:
         Returns:
             bool: True if login successful, False otherwise
         """
-        command = f'''
-echo "{password}" > /tmp/mmctl_pass.txt && \
-mmctl auth login {self.server_url} \
-    --name {self.auth_name} \
-    --username {username} \
-    --password-file /tmp/mmctl_pass.txt && \
-rm -f /tmp/mmctl_pass.txt
-'''
-        returncode, stdout, stderr = self._exec_in_container(command)
-        return returncode == 0 and "stored" in stdout
+        self._token = self._get_token(username, password)
+        return self._token is not None
+
+    def _get_user(self, user: str, token: str | None = None) -> dict:
+        """Look up a user by email or username."""
+        path = f"/users/email/{user}" if "@" in user else f"/users/username/{user}"
+        return self._api("GET", path, token=token).json()
+
+    def _get_team_id(self, team: str) -> str:
+        if team not in self._team_ids:
+            self._team_ids[team] = self._api("GET", f"/teams/name/{team}").json()["id"]
+        return self._team_ids[team]
+
+    def _get_channel_id(self, team: str, channel: str) -> str:
+        team_id = self._get_team_id(team)
+        return self._api("GET", f"/teams/{team_id}/channels/name/{channel}").json()["id"]
 
     def _reset_user_password(self, target_username: str, new_password: str) -> bool:
         """
@@ -94,41 +204,28 @@ rm -f /tmp/mmctl_pass.txt
         Returns:
             bool: True if password reset successful, False otherwise
         """
-        admin_username = ADMIN_ACCOUNT["username"]
-        admin_password = ADMIN_ACCOUNT["password"]
-
-        # First login as admin
-        admin_auth_name = "admin-session"
-        login_command = f'''
-echo "{admin_password}" > /tmp/mmctl_pass.txt && \
-mmctl auth login {self.server_url} \
-    --name {admin_auth_name} \
-    --username {admin_username} \
-    --password-file /tmp/mmctl_pass.txt && \
-rm -f /tmp/mmctl_pass.txt
-'''
-        returncode, stdout, stderr = self._exec_in_container(login_command)
-        if returncode != 0 or "stored" not in stdout:
-            logger.error(f"Failed to login as admin: {stderr or stdout}")
+        admin_token = self._get_token(ADMIN_ACCOUNT["username"], ADMIN_ACCOUNT["password"])
+        if admin_token is None:
+            logger.error("Failed to login as admin")
             return False
 
-        # Reset the target user's password
-        reset_command = f'mmctl user change-password {target_username} --password "{new_password}"'
-        returncode, stdout, stderr = self._exec_in_container(reset_command)
-
-        # Cleanup admin session
-        self._exec_in_container(f"mmctl auth delete {admin_auth_name}")
-
-        if returncode == 0:
-            logger.info(f"Password reset successful for {target_username}")
-            return True
-        else:
-            logger.error(f"Failed to reset password: {stderr or stdout}")
+        try:
+            user_id = self._get_user(target_username, token=admin_token)["id"]
+            self._api(
+                "PUT",
+                f"/users/{user_id}/password",
+                token=admin_token,
+                json={"new_password": new_password},
+            )
+        except (MattermostAPIError, requests.RequestException) as e:
+            logger.error(f"Failed to reset password: {e}")
             return False
+        logger.info(f"Password reset successful for {target_username}")
+        return True
 
     def login(self, username: str, password: str | None = None) -> bool:
         """
-        Login to Mattermost using mmctl. If login fails, attempt to reset
+        Login to Mattermost. If login fails, attempt to reset
         the user's password using admin account and retry.
 
         Args:
@@ -159,10 +256,9 @@ rm -f /tmp/mmctl_pass.txt
         return False
 
     def logout(self) -> bool:
-        """Clean up authentication credentials."""
-        command = f"mmctl auth delete {self.auth_name}"
-        returncode, stdout, stderr = self._exec_in_container(command)
-        return returncode == 0
+        """Stop acting as the current user; the server session stays cached for reuse."""
+        self._token = None
+        return True
 
     def create_channel(
         self,
@@ -187,26 +283,24 @@ rm -f /tmp/mmctl_pass.txt
         Returns:
             bool: True if channel created successfully
         """
-        command = f'''mmctl channel create \
-    --team "{team}" \
-    --name "{channel_name}" \
-    --display-name "{display_name}"'''
-
-        if private:
-            command += " --private"
-        if purpose:
-            command += f' --purpose "{purpose}"'
-        if header:
-            command += f' --header "{header}"'
-
-        returncode, stdout, stderr = self._exec_in_container(command)
-
-        if returncode == 0 and "successfully created" in stdout:
-            logger.info(f"Channel '{channel_name}' created successfully")
-            return True
-        else:
-            logger.error(f"Failed to create channel: {stderr or stdout}")
+        try:
+            self._api(
+                "POST",
+                "/channels",
+                json={
+                    "team_id": self._get_team_id(team),
+                    "name": channel_name,
+                    "display_name": display_name,
+                    "type": "P" if private else "O",
+                    "purpose": purpose,
+                    "header": header,
+                },
+            )
+        except (MattermostAPIError, requests.RequestException) as e:
+            logger.error(f"Failed to create channel: {e}")
             return False
+        logger.info(f"Channel '{channel_name}' created successfully")
+        return True
 
     def send_message(self, team: str, channel: str, message: str, reply_to: str = None) -> bool:
         """
@@ -221,22 +315,18 @@ rm -f /tmp/mmctl_pass.txt
         Returns:
             bool: True if message sent successfully
         """
-        # Escape special characters in the message
-        escaped_message = message.replace('"', '\\"').replace("$", "\\$")
-
-        command = f'mmctl post create {team}:{channel} --message "{escaped_message}"'
-
+        payload = {"channel_id": None, "message": message}
         if reply_to:
-            command += f' --reply-to "{reply_to}"'
+            payload["root_id"] = reply_to
 
-        returncode, stdout, stderr = self._exec_in_container(command)
-
-        if returncode == 0:
-            logger.info(f"Message sent to {team}:{channel}")
-            return True
-        else:
-            logger.error(f"Failed to send message: {stderr or stdout}")
+        try:
+            payload["channel_id"] = self._get_channel_id(team, channel)
+            self._api("POST", "/posts", json=payload)
+        except (MattermostAPIError, requests.RequestException) as e:
+            logger.error(f"Failed to send message: {e}")
             return False
+        logger.info(f"Message sent to {team}:{channel}")
+        return True
 
     def add_users_to_channel(self, team: str, channel: str, users: list[str]) -> bool:
         """
@@ -250,17 +340,16 @@ rm -f /tmp/mmctl_pass.txt
         Returns:
             bool: True if users added successfully
         """
-        users_str = " ".join(users)
-        command = f"mmctl channel users add {team}:{channel} {users_str}"
-
-        returncode, stdout, stderr = self._exec_in_container(command)
-
-        if returncode == 0:
-            logger.info(f"Users added to {team}:{channel}")
-            return True
-        else:
-            logger.error(f"Failed to add users: {stderr or stdout}")
+        try:
+            channel_id = self._get_channel_id(team, channel)
+            for user in users:
+                user_id = self._get_user(user)["id"]
+                self._api("POST", f"/channels/{channel_id}/members", json={"user_id": user_id})
+        except (MattermostAPIError, requests.RequestException) as e:
+            logger.error(f"Failed to add users: {e}")
             return False
+        logger.info(f"Users added to {team}:{channel}")
+        return True
 
     def list_channels(self, team: str) -> list[str]:
         """
@@ -272,18 +361,12 @@ rm -f /tmp/mmctl_pass.txt
         Returns:
             list: List of channel names
         """
-        command = f"mmctl channel list {team}"
-
-        returncode, stdout, stderr = self._exec_in_container(command)
-
-        if returncode == 0:
-            # Parse channel list from output
-            lines = stdout.strip().split("\n")
-            channels = [
-                line.strip() for line in lines if line.strip() and not line.startswith("There are")
-            ]
-            return channels
-        return []
+        try:
+            team_id = self._get_team_id(team)
+            channels = self._api("GET", f"/teams/{team_id}/channels").json()
+        except (MattermostAPIError, requests.RequestException):
+            return []
+        return [channel["name"] for channel in channels]
 
 
 # Convenience function for quick operations
@@ -342,17 +425,21 @@ def copytree_with_ownership(src, dst):
     subprocess.run(["cp", "-rp", src, dst], check=True)
 
 
+_db_pool = PostgresPool(
+    host=MATTERMOST_DB_HOST,
+    database=MATTERMOST_DB_DATABASE,
+    user=MATTERMOST_DB_USER,
+    password=MATTERMOST_DB_PASSWORD,
+    port=MATTERMOST_DB_PORT,
+)
+
+
 def connect_to_postgres():
+    """Check out a pooled connection; `connection.close()` returns it to the pool."""
     try:
-        connection = psycopg2.connect(
-            host=MATTERMOST_DB_HOST,
-            database=MATTERMOST_DB_DATABASE,
-            user=MATTERMOST_DB_USER,
-            password=MATTERMOST_DB_PASSWORD,
-            port=MATTERMOST_DB_PORT,
-        )
+        connection = _db_pool.getconn()
         cursor = connection.cursor()
-        logger.info("Connected to PostgreSQL database successfully!")
+        logger.debug("Connected to PostgreSQL database successfully!")
         return connection, cursor
     except Error as e:
         logger.error(f"Error connecting to PostgreSQL database: {e}")
@@ -438,7 +525,7 @@ def get_file_info(file_id: str, return_path: bool = False):
     connection.close()
     if return_path:
         relative_path = file[6]
-        return os.path.join(MATTERMOST_DOCKER_DIR, "volumes/app/mattermost/data/", relative_path)
+        return os.path.join(MATTERMOST_DOCKER_DIR, MATTERMOST_DATA_DIR, relative_path)
     return file
 
 
@@ -475,40 +562,217 @@ def get_users_in_channel(channel_id: str):
     return members
 
 
+def _db_conn_kwargs() -> dict:
+    return {
+        "host": MATTERMOST_DB_HOST,
+        "user": MATTERMOST_DB_USER,
+        "password": MATTERMOST_DB_PASSWORD,
+        "port": MATTERMOST_DB_PORT,
+    }
+
+
+def is_mattermost_ready() -> bool:
+    """Check whether the Mattermost server answers API requests."""
+    try:
+        return _http.get(f"{MATTERMOST_SERVER_URL}/api/v4/system/ping", timeout=3).ok
+    except requests.RequestException:
+        return False
+
+
+def _wait_mattermost_ready(
+    timeout: float = MATTERMOST_READY_TIMEOUT, interval: float = 0.5
+) -> bool:
+    deadline = time.monotonic() + timeout
+    while not is_mattermost_ready():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+
+def _record_timings(kind: str, timings: dict[str, float]) -> None:
+    last_reset_timings.clear()
+    last_reset_timings.update(timings)
+    logger.info(
+        "[MATTERMOST] {} finished in {:.2f}s ({})",
+        kind,
+        timings["total"],
+        ", ".join(f"{phase}={seconds:.2f}s" for phase, seconds in timings.items()),
+    )
+
+
+def _refresh_server_state() -> None:
+    """Make the running server drop in-memory state read from the replaced database.
+
+    Invalidates all server caches through the admin API, and restarts only the app
+    container if that is not possible.
+    """
+    cli = MattermostCLI()
+    try:
+        if cli._login_attempt(ADMIN_ACCOUNT["username"], ADMIN_ACCOUNT["password"]):
+            cli._api("POST", "/caches/invalidate")
+            return
+    except (MattermostAPIError, requests.RequestException) as e:
+        logger.warning(f"[MATTERMOST] Cache invalidation failed: {e}")
+    logger.info("[MATTERMOST] Restarting the app container")
+    cmd = ["docker", "compose"] + COMPOSE_FILES + ["restart", MATTERMOST_SERVICE]
+    subprocess.run(cmd, cwd=MATTERMOST_DOCKER_DIR, capture_output=True, text=True, check=True)
+
+
+def snapshot_mattermost_state(mattermost_backend_status_dir=MATTERMOST_STATUS_DIR) -> bool:
+    """Save the current database as the template used by `reset_mattermost_state`.
+
+    Args:
+        mattermost_backend_status_dir: backup directory the running stack was started from
+    """
+    global _template_status_dir
+    _template_status_dir = None
+    try:
+        elapsed = backend_snapshot.snapshot_database(
+            MATTERMOST_DB_DATABASE, MATTERMOST_TEMPLATE_DATABASE, **_db_conn_kwargs()
+        )
+        logger.info(f"[MATTERMOST] Saved database template in {elapsed:.2f}s")
+    except Exception as e:
+        logger.warning(f"[MATTERMOST] Failed to save database template: {e}")
+        return False
+    _template_status_dir = mattermost_backend_status_dir
+    return True
+
+
+def reset_mattermost_state(mattermost_backend_status_dir=MATTERMOST_STATUS_DIR) -> bool:
+    """Reset a running Mattermost backend to its initial state without restarting it.
+
+    Recreates the database from the template database, restores the file store from
+    `mattermost_backend_status_dir` and invalidates the server caches. Timings of each
+    phase are logged and kept in `last_reset_timings`.
+
+    The template is only used if it was saved from a stack started from
+    `mattermost_backend_status_dir`; otherwise a full restart is needed.
+
+    Returns:
+        True if the backend is ready again, False if a full restart is needed
+    """
+    start = time.perf_counter()
+    if _template_status_dir is None or _template_status_dir != mattermost_backend_status_dir:
+        logger.info(
+            f"[MATTERMOST] No template saved from {mattermost_backend_status_dir}, "
+            "warm reset unavailable"
+        )
+        return False
+    try:
+        conn_kwargs = _db_conn_kwargs()
+        if not backend_snapshot.database_exists(MATTERMOST_TEMPLATE_DATABASE, **conn_kwargs):
+            logger.info("[MATTERMOST] No database template, warm reset unavailable")
+            return False
+        timings = {
+            "database": backend_snapshot.restore_database(
+                MATTERMOST_DB_DATABASE, MATTERMOST_TEMPLATE_DATABASE, **conn_kwargs
+            )
+        }
+        clear_session_cache()
+        _db_pool.reset()
+
+        timings["files"] = backend_snapshot.restore_directory(
+            os.path.join(mattermost_backend_status_dir, MATTERMOST_DATA_DIR),
+            os.path.join(MATTERMOST_DOCKER_DIR, MATTERMOST_DATA_DIR),
+        )
+
+        refresh_start = time.perf_counter()
+        _refresh_server_state()
+        if not _wait_mattermost_ready():
+            logger.warning("[MATTERMOST] Backend not ready after warm reset")
+            return False
+        timings["refresh"] = time.perf_counter() - refresh_start
+        timings["total"] = time.perf_counter() - start
+    except Exception as e:
+        logger.warning(f"[MATTERMOST] Warm reset failed: {e}")
+        return False
+
+    lifecycle.mark_running(BACKEND_NAME, mattermost_backend_status_dir)
+    _record_timings("Warm reset", timings)
+    return True
+
+
 def start_mattermost_backend(mattermost_backend_status_dir=MATTERMOST_STATUS_DIR):
-    """Start the Mattermost backend."""
+    """Start the Mattermost backend, or reset it in place if it is already running.
+
+    With `MATTERMOST_RESET_MODE=template` a running stack is reset by
+    `reset_mattermost_state`; the full restart from `mattermost_backend_status_dir` is
+    used otherwise and as fallback.
+
+    Args:
+        mattermost_backend_status_dir: backup directory with the initial state
+    """
     status = get_mattermost_backend_status()
-    if status == "running":
+    if status == "running" and MATTERMOST_RESET_MODE == "template":
+        if reset_mattermost_state(mattermost_backend_status_dir):
+            return True
+        logger.info("[MATTERMOST] Falling back to a full restart")
+    if status in ["running", "partial"]:
         logger.info("Mattermost backend is already running, stop and reset it to default")
-        stop_mattermost_backend()
+        stop_mattermost_backend(force=True)
     shutil.rmtree(MATTERMOST_DOCKER_DIR, ignore_errors=True)
+    clear_session_cache()
+    _db_pool.reset()
 
     try:
+        start = time.perf_counter()
         # mattermost backend requires 2000:2000 permission, need to preserve
         copytree_with_ownership(mattermost_backend_status_dir, MATTERMOST_DOCKER_DIR)
+        timings = {"copy": time.perf_counter() - start}
         # Change to mattermost docker directory and start services
         cmd = ["docker", "compose"] + COMPOSE_FILES + ["up", "-d"]
         result = subprocess.run(
             cmd, cwd=MATTERMOST_DOCKER_DIR, capture_output=True, text=True, check=True
         )
         logger.info("Mattermost backend started successfully")
-
         logger.debug(f"Docker compose output: {result.stdout}\n{result.stderr}")
+        timings["compose_up"] = time.perf_counter() - start - timings["copy"]
+
+        # callers use the API right away, so wait until it answers
+        ready_start = time.perf_counter()
+        if _wait_mattermost_ready():
+            timings["ready"] = time.perf_counter() - ready_start
+            if MATTERMOST_RESET_MODE == "template":
+                # the state right after a fresh start is what later warm resets restore
+                snapshot_mattermost_state(mattermost_backend_status_dir)
+                _wait_mattermost_ready()
+        else:
+            logger.warning("[MATTERMOST] Backend not ready after start, no database template saved")
+        timings["total"] = time.perf_counter() - start
+        _record_timings("Full restart", timings)
+        lifecycle.mark_running(BACKEND_NAME, mattermost_backend_status_dir)
         return True
     except subprocess.CalledProcessError as e:
+        lifecycle.mark_unknown(BACKEND_NAME)
         logger.error(f"Failed to start Mattermost backend: {e}")
         logger.error(f"Error output: {e.stderr}")
         return False
     except Exception as e:
+        lifecycle.mark_unknown(BACKEND_NAME)
         logger.error(f"Unexpected error starting Mattermost backend: {e}")
         return False
 
 
-def stop_mattermost_backend():
-    """Stop the Mattermost backend."""
+def stop_mattermost_backend(force: bool = False):
+    """Stop the Mattermost backend.
+
+    Args:
+        force: also stop a healthy stack in `template` reset mode, where it is otherwise
+            kept running for the next `start_mattermost_backend` to reset in place
+    """
+    keep_running = MATTERMOST_RESET_MODE == "template" and not force
+    if lifecycle.is_stopped(BACKEND_NAME) or (keep_running and lifecycle.is_running(BACKEND_NAME)):
+        return True
     try:
         status = get_mattermost_backend_status()
         if status == "stopped":
+            lifecycle.mark_stopped(BACKEND_NAME)
+            return True
+        if status == "running" and keep_running:
+            logger.debug("[MATTERMOST] Keeping backend running for warm reset")
+            if lifecycle.state(BACKEND_NAME).running is None:
+                lifecycle.mark_running(BACKEND_NAME, None)
             return True
         cmd = ["docker", "compose", "down"]
         result = subprocess.run(
@@ -518,12 +782,15 @@ def stop_mattermost_backend():
         logger.debug(f"Docker compose output: {result.stdout}\n{result.stderr}")
 
         shutil.rmtree(MATTERMOST_DOCKER_DIR)
+        lifecycle.mark_stopped(BACKEND_NAME)
         return True
     except subprocess.CalledProcessError as e:
+        lifecycle.mark_unknown(BACKEND_NAME)
         logger.error(f"Failed to stop Mattermost backend: {e}")
         logger.error(f"Error output: {e.stderr}")
         return False
     except Exception as e:
+        lifecycle.mark_unknown(BACKEND_NAME)
         logger.error(f"Unexpected error stopping Mattermost backend: {e}")
         return False
 
@@ -533,7 +800,7 @@ def restart_mattermost_backend():
     logger.info("Restarting Mattermost backend...")
 
     # Stop the backend first
-    if not stop_mattermost_backend():
+    if not stop_mattermost_backend(force=True):
         logger.error("Failed to stop Mattermost backend during restart")
         return False
 
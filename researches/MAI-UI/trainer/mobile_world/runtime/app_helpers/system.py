@@ -1,10 +1,150 @@
 import datetime
 import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 
 from loguru import logger
 
 from mobile_world.runtime.controller import AndroidController
-from mobile_world.runtime.utils.helpers import execute_adb, execute_root_sql
+from mobile_world.runtime.utils.helpers import execute_adb
+from mobile_world.runtime.utils.root_sql import root_sql_session
+
+CONTACTS_DATA_URI = "content://com.android.contacts/data"
+CONTACTS_URI = "content://com.android.contacts/contacts"
+SMS_SENT_URI = "content://sms/sent"
+SMS_INBOX_URI = "content://sms/inbox"
+MEDIA_IMAGES_URI = "content://media/external/images/media"
+
+PHONE_MIMETYPE = "vnd.android.cursor.item/phone_v2"
+EMAIL_MIMETYPE = "vnd.android.cursor.item/email_v2"
+POSTAL_MIMETYPE = "vnd.android.cursor.item/postal-address_v2"
+ORGANIZATION_MIMETYPE = "vnd.android.cursor.item/organization"
+
+_SMS_COLUMNS = ("_id", "thread_id", "address", "date", "read", "type", "body")
+
+# union of the columns the verifiers read from each provider: (projection, needs root)
+PROVIDER_PROJECTIONS: dict[str, tuple[tuple[str, ...], bool]] = {
+    CONTACTS_DATA_URI: (
+        (
+            "contact_id",
+            "raw_contact_id",
+            "mimetype",
+            "data1",
+            "data2",
+            "data3",
+            "data4",
+            "data7",
+            "data8",
+            "data9",
+            "data10",
+        ),
+        False,
+    ),
+    CONTACTS_URI: (("_id", "display_name", "starred"), False),
+    SMS_SENT_URI: (_SMS_COLUMNS, True),
+    SMS_INBOX_URI: (_SMS_COLUMNS, True),
+    MEDIA_IMAGES_URI: (("_id", "_data"), False),
+}
+
+_ROW_SPLIT = re.compile(r"\n(?=Row: \d+ )")
+
+
+@lru_cache(maxsize=None)
+def _row_parser(columns: tuple[str, ...]) -> re.Pattern:
+    """Parser of one `content query` row with the given projection.
+
+    Values may contain ", " and newlines; each value ends where the next known
+    column starts.
+    """
+    fields = ", ".join(f"{re.escape(column)}=(.*?)" for column in columns)
+    return re.compile(rf"Row: \d+ {fields}\Z", re.DOTALL)
+
+
+@dataclass
+class ProviderRow:
+    """One row of a content provider query; NULL values are None."""
+
+    values: dict[str, str | None]
+    raw: str
+
+    def __getitem__(self, column: str) -> str | None:
+        return self.values.get(column)
+
+
+def parse_provider_rows(output: str, columns: tuple[str, ...]) -> list[ProviderRow]:
+    """Parse the output of `content query --projection <columns>`."""
+    parser = _row_parser(columns)
+    rows = []
+    for raw in _ROW_SPLIT.split(output.strip()):
+        match = parser.match(raw.strip())
+        if match is None:
+            if raw.startswith("Row:"):
+                logger.debug(f"Unparsable content provider row: {raw[:200]}")
+            continue
+        values = {}
+        for column, value in zip(columns, match.groups()):
+            value = value.strip()
+            values[column] = None if not value or value.upper() == "NULL" else value
+        rows.append(ProviderRow(values, raw.strip()))
+    return rows
+
+
+class DeviceSnapshot:
+    """Content provider rows of one device, each URI fetched once and kept in memory.
+
+    Verifiers query the snapshot instead of running their own `content query`. It is
+    dropped with `invalidate_device_snapshot` when an episode starts and ends, so it
+    always reflects the state the agent left behind.
+    """
+
+    def __init__(self, device: str):
+        self.device = device
+        self._rows: dict[str, list[ProviderRow]] = {}
+        self._lock = threading.Lock()
+
+    def rows(self, uri: str) -> list[ProviderRow] | None:
+        """All rows of `uri` with its union projection, or None if the query failed."""
+        with self._lock:
+            if uri not in self._rows:
+                columns, root_required = PROVIDER_PROJECTIONS[uri]
+                result = execute_adb(
+                    f'adb -s {self.device} shell content query --uri "{uri}" '
+                    f'--projection "{":".join(columns)}"',
+                    output=False,
+                    root_required=root_required,
+                )
+                if not result.success or result.output is None:
+                    logger.warning(f"Failed to query {uri}: {result.error}")
+                    return None
+                self._rows[uri] = parse_provider_rows(result.output, columns)
+            return self._rows[uri]
+
+    def contact_data(self, mimetype: str | None = None) -> list[ProviderRow]:
+        """Rows of the contacts data table, optionally of one mimetype only."""
+        rows = self.rows(CONTACTS_DATA_URI) or []
+        return rows if mimetype is None else [r for r in rows if r["mimetype"] == mimetype]
+
+
+_snapshots: dict[str, DeviceSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def device_snapshot(controller: AndroidController) -> DeviceSnapshot:
+    """The content provider snapshot of the controller's device."""
+    with _snapshots_lock:
+        if controller.device not in _snapshots:
+            _snapshots[controller.device] = DeviceSnapshot(controller.device)
+        return _snapshots[controller.device]
+
+
+def invalidate_device_snapshot(device: str | None = None) -> None:
+    """Drop the snapshot of `device`, or of all devices."""
+    with _snapshots_lock:
+        if device is None:
+            _snapshots.clear()
+        else:
+            _snapshots.pop(device, None)
 
 
 def set_flight_mode(controller: AndroidController, is_open: bool):
@@ -117,42 +257,22 @@ def check_sms_via_adb(
         bool: True if matching SMS is found, False otherwise
     """
     try:
-        # Query SMS database using content provider
-        # Filter by sent messages (type=2)
-        query_cmd = f"adb -s {controller.device} shell content query --uri content://sms/sent"
-        result = execute_adb(query_cmd, output=False, root_required=True)
-        if not result.success or not result.output:
-            logger.warning(f"Failed to query SMS database: {result.error}")
+        rows = device_snapshot(controller).rows(SMS_SENT_URI)
+        if rows is None:
             return False
 
-        # Parse the result line by line
-        # Each line represents a row with format: Row: X address=Y, body=Z, ...
-        lines = result.output.strip().split("\nRow")
-
-        for line in lines:
-            if not line.strip():
-                continue
-
-            # Check if this line contains the expected content
-            content_match = False
-            phone_match = False
-
-            body_text_lower = ""
-            if "body=" in line:
-                # Extract body content
-                body_text_lower = line.split("body=")[-1].split(",")[0].strip().lower()
+        if not isinstance(content, list):
+            content = [str(content)]
 
-            if not isinstance(content, list):
-                content = [str(content)]
+        for row in rows:
+            body_text_lower = (row["body"] or "").lower()
+            line = row.raw.lower()
 
             content_match = all(
-                str(content_item).lower() in body_text_lower
-                or str(content_item).lower() in line.lower()
+                str(content_item).lower() in body_text_lower or str(content_item).lower() in line
                 for content_item in content
             )
-
-            if f"address={phone_number}" in line or phone_number in line:
-                phone_match = True
+            phone_match = row["address"] == phone_number or phone_number in row.raw
 
             if content_match and phone_match:
                 logger.info(f"Found matching SMS: phone={phone_number}, content found")
@@ -166,13 +286,27 @@ def check_sms_via_adb(
         return False
 
 
-def get_sms_list_via_adb(controller: AndroidController) -> list[dict]:
-    result = execute_adb(
-        f"adb -s {controller.device} shell content query --uri content://sms/inbox"
+def get_sms_list_via_adb(controller: AndroidController) -> list[str]:
+    """Raw `Row: ...` lines of the SMS inbox."""
+    rows = device_snapshot(controller).rows(SMS_INBOX_URI)
+    return [row.raw for row in rows or []]
+
+
+def count_received_sms(controller: AndroidController, sender: str) -> int:
+    """Number of SMS in the inbox from `sender`."""
+    rows = device_snapshot(controller).rows(SMS_INBOX_URI) or []
+    return sum(sender in (row["address"] or "") for row in rows)
+
+
+def are_images_indexed(controller: AndroidController, remote_paths: list[str]) -> bool:
+    """Whether the media scanner has added all `remote_paths` to the MediaStore."""
+    rows = device_snapshot(controller).rows(MEDIA_IMAGES_URI) or []
+    indexed = {row["_data"] for row in rows}
+    # /sdcard is a symlink; the MediaStore records the canonical storage path
+    return all(
+        path in indexed or path.replace("/sdcard/", "/storage/emulated/0/", 1) in indexed
+        for path in remote_paths
     )
-    if result.success:
-        return result.output.strip().split("\n")
-    return []
 
 
 def get_file_list(path: str) -> list[str]:
@@ -190,27 +324,22 @@ def check_alarm_via_adb(controller: AndroidController, hour: int, minute: int) -
     )
 
     try:
-        result = execute_root_sql(db_path, sql_query)
+        rows = root_sql_session(controller.device).query(db_path, sql_query)
 
-        if not result:
-            logger.info(f"No alarm found or query failed for {hour}:{minute:02d}")
-            return None
-
-        parts = result.strip().split("|")
-
-        if len(parts) < 6:
-            logger.warning(f"Unexpected query result format: {result}")
+        if not rows:
+            logger.info(f"No alarm found for {hour}:{minute:02d}")
             return None
 
+        row = rows[0]
         alarm_info = {
-            "hour": int(parts[0]),
-            "minutes": int(parts[1]),
-            "enabled": bool(int(parts[2])),
-            "daysofweek": int(parts[3]) if parts[3] else 0,
-            "vibrate": bool(int(parts[4])) if parts[4] else False,
-            "ringtone": parts[5] if len(parts) > 5 else "",
-            "label": parts[6] if len(parts) > 6 else "",
-            "blackout_end": parts[7] if len(parts) > 7 else "",
+            "hour": int(row["hour"]),
+            "minutes": int(row["minutes"]),
+            "enabled": bool(row["enabled"]),
+            "daysofweek": int(row["daysofweek"] or 0),
+            "vibrate": bool(row["vibrate"]),
+            "ringtone": row["ringtone"] or "",
+            "label": row["label"] or "",
+            "blackout_end": "" if row["blackout_end"] is None else str(row["blackout_end"]),
         }
 
         logger.info(f"Found alarm: {alarm_info}")
@@ -221,6 +350,25 @@ def check_alarm_via_adb(controller: AndroidController, hour: int, minute: int) -
         return None
 
 
+_PHONE_TYPE_LABELS = {1: "HOME", 2: "MOBILE", 3: "WORK", 7: "OTHER"}
+_EMAIL_TYPE_LABELS = {1: "HOME", 2: "WORK", 3: "OTHER"}
+_ADDRESS_COLUMNS = {
+    "full_address": "data1",
+    "street": "data4",
+    "city": "data7",
+    "state": "data8",
+    "postal_code": "data9",
+    "country": "data10",
+}
+
+
+def _type_label(type_value: str | None, labels: dict[int, str]) -> str:
+    try:
+        return labels.get(int(type_value), "")
+    except (ValueError, TypeError):
+        return ""
+
+
 def get_contacts_via_adb(
     controller: AndroidController, name: str | None = None, phone_number: str | None = None
 ) -> list[dict] | None:
@@ -260,206 +408,43 @@ def get_contacts_via_adb(
         }
     """
     try:
-        # Step 1: Query all contact data including phones, emails, addresses, and organizations
-        # Query phones with type and label information
-        phones_query_cmd = (
-            f"adb -s {controller.device} shell content query --uri "
-            f'"content://com.android.contacts/data" --projection "contact_id:mimetype:data1:data2:data3"'
-        )
-        phones_result = execute_adb(phones_query_cmd, output=False, root_required=False)
-
-        # Query emails with type and label information
-        emails_query_cmd = (
-            f"adb -s {controller.device} shell content query --uri "
-            f'"content://com.android.contacts/data" --projection "contact_id:mimetype:data1:data2:data3"'
-        )
-        emails_result = execute_adb(emails_query_cmd, output=False, root_required=False)
+        snapshot = device_snapshot(controller)
 
-        # Query addresses
-        addresses_query_cmd = (
-            f"adb -s {controller.device} shell content query --uri "
-            f'"content://com.android.contacts/data" --projection "contact_id:mimetype:data1:data4:data7:data8:data9:data10"'
-        )
-        addresses_result = execute_adb(addresses_query_cmd, output=False, root_required=False)
-
-        # Query organization (company) information
-        org_query_cmd = (
-            f"adb -s {controller.device} shell content query --uri "
-            f'"content://com.android.contacts/data" --projection "contact_id:mimetype:data1"'
-        )
-        org_result = execute_adb(org_query_cmd, output=False, root_required=False)
-
-        # Query contact names
-        names_query_cmd = (
-            f"adb -s {controller.device} shell content query --uri "
-            f'"content://com.android.contacts/contacts" --projection "_id:display_name"'
-        )
-        names_result = execute_adb(names_query_cmd, output=False, root_required=False)
-
-        # Step 2: Build maps for all contact data
         phones_map: dict[str, list[dict]] = {}
-        if phones_result.success and phones_result.output:
-            for line in phones_result.output.strip().split("\n"):
-                if not line.strip() or not line.startswith("Row:"):
-                    continue
-                if "phone_v2" in line or "vnd.android.cursor.item/phone_v2" in line:
-                    contact_id_match = re.search(r"contact_id=([^,]+)", line)
-                    if not contact_id_match:
-                        continue
-                    contact_id = contact_id_match.group(1).strip()
-
-                    phone_match = re.search(r"data1=([^,]+)", line)
-                    if not phone_match:
-                        continue
-                    phone_number_val = phone_match.group(1).strip()
-                    if not phone_number_val or phone_number_val.upper() == "NULL":
-                        continue
-
-                    label_match = re.search(r"data3=([^,]+)", line)
-                    label = ""
-                    if label_match:
-                        label_str = label_match.group(1).strip()
-                        if label_str and label_str.upper() != "NULL":
-                            label = label_str
-
-                    if not label:
-                        type_match = re.search(r"data2=([^,]+)", line)
-                        if type_match:
-                            type_str = type_match.group(1).strip()
-                            if type_str and type_str.upper() != "NULL":
-                                try:
-                                    type_num = int(type_str)
-                                    type_map = {1: "HOME", 2: "MOBILE", 3: "WORK", 7: "OTHER"}
-                                    label = type_map.get(type_num, "")
-                                except (ValueError, TypeError):
-                                    pass
-
-                    if contact_id not in phones_map:
-                        phones_map[contact_id] = []
-                    phones_map[contact_id].append({"number": phone_number_val, "label": label})
+        for row in snapshot.contact_data(PHONE_MIMETYPE):
+            if row["contact_id"] is None or row["data1"] is None:
+                continue
+            label = row["data3"] or _type_label(row["data2"], _PHONE_TYPE_LABELS)
+            phones_map.setdefault(row["contact_id"], []).append(
+                {"number": row["data1"], "label": label}
+            )
 
         emails_map: dict[str, list[dict]] = {}
-        if emails_result.success and emails_result.output:
-            for line in emails_result.output.strip().split("\n"):
-                if not line.strip() or not line.startswith("Row:"):
-                    continue
-                if "email_v2" in line or "vnd.android.cursor.item/email_v2" in line:
-                    contact_id_match = re.search(r"contact_id=([^,]+)", line)
-                    if not contact_id_match:
-                        continue
-                    contact_id = contact_id_match.group(1).strip()
-
-                    email_match = re.search(r"data1=([^,]+)", line)
-                    if not email_match:
-                        continue
-                    email_val = email_match.group(1).strip()
-                    if not email_val or email_val.upper() == "NULL":
-                        continue
-
-                    label_match = re.search(r"data3=([^,]+)", line)
-                    label = ""
-                    if label_match:
-                        label_str = label_match.group(1).strip()
-                        if label_str and label_str.upper() != "NULL":
-                            label = label_str
-
-                    if not label:
-                        type_match = re.search(r"data2=([^,]+)", line)
-                        if type_match:
-                            type_str = type_match.group(1).strip()
-                            if type_str and type_str.upper() != "NULL":
-                                try:
-                                    type_num = int(type_str)
-                                    type_map = {1: "HOME", 2: "WORK", 3: "OTHER"}
-                                    label = type_map.get(type_num, "")
-                                except (ValueError, TypeError):
-                                    pass
-
-                    if contact_id not in emails_map:
-                        emails_map[contact_id] = []
-                    emails_map[contact_id].append({"address": email_val, "label": label})
+        for row in snapshot.contact_data(EMAIL_MIMETYPE):
+            if row["contact_id"] is None or row["data1"] is None:
+                continue
+            label = row["data3"] or _type_label(row["data2"], _EMAIL_TYPE_LABELS)
+            emails_map.setdefault(row["contact_id"], []).append(
+                {"address": row["data1"], "label": label}
+            )
 
         addresses_map: dict[str, list[dict]] = {}
-        if addresses_result.success and addresses_result.output:
-            for line in addresses_result.output.strip().split("\n"):
-                if not line.strip() or not line.startswith("Row:"):
-                    continue
-                if (
-                    "postal-address_v2" in line
-                    or "vnd.android.cursor.item/postal-address_v2" in line
-                ):
-                    contact_id_match = re.search(r"contact_id=([^,]+)", line)
-                    if contact_id_match:
-                        contact_id = contact_id_match.group(1).strip()
-                        addr: dict[str, str] = {}
-
-                        match = re.search(r"data1=([^,]+)", line)
-                        if match:
-                            addr["full_address"] = match.group(1).strip()
-
-                        match = re.search(r"data4=([^,]+)", line)
-                        if match:
-                            street = match.group(1).strip()
-                            if street and street.upper() != "NULL":
-                                addr["street"] = street
-
-                        match = re.search(r"data7=([^,]+)", line)
-                        if match:
-                            city = match.group(1).strip()
-                            if city and city.upper() != "NULL":
-                                addr["city"] = city
-
-                        match = re.search(r"data8=([^,]+)", line)
-                        if match:
-                            state = match.group(1).strip()
-                            if state and state.upper() != "NULL":
-                                addr["state"] = state
-
-                        match = re.search(r"data9=([^,]+)", line)
-                        if match:
-                            postal = match.group(1).strip()
-                            if postal and postal.upper() != "NULL":
-                                addr["postal_code"] = postal
-
-                        match = re.search(r"data10=([^,]+)", line)
-                        if match:
-                            country = match.group(1).strip()
-                            if country and country.upper() != "NULL":
-                                addr["country"] = country
-
-                        if addr:
-                            if contact_id not in addresses_map:
-                                addresses_map[contact_id] = []
-                            addresses_map[contact_id].append(addr)
+        for row in snapshot.contact_data(POSTAL_MIMETYPE):
+            if row["contact_id"] is None:
+                continue
+            addr = {key: row[column] for key, column in _ADDRESS_COLUMNS.items() if row[column]}
+            if addr:
+                addresses_map.setdefault(row["contact_id"], []).append(addr)
 
         org_map: dict[str, str] = {}
-        if org_result.success and org_result.output:
-            for line in org_result.output.strip().split("\n"):
-                if not line.strip() or not line.startswith("Row:"):
-                    continue
-                if "organization" in line or "vnd.android.cursor.item/organization" in line:
-                    contact_id_match = re.search(r"contact_id=([^,]+)", line)
-                    if contact_id_match:
-                        contact_id = contact_id_match.group(1).strip()
-                        org_match = re.search(r"data1=([^,]+)", line)
-                        if org_match:
-                            org_val = org_match.group(1).strip()
-                            if org_val and org_val.upper() != "NULL":
-                                org_map[contact_id] = org_val
+        for row in snapshot.contact_data(ORGANIZATION_MIMETYPE):
+            if row["contact_id"] is not None and row["data1"] is not None:
+                org_map[row["contact_id"]] = row["data1"]
 
         names_map: dict[str, str] = {}
-        if names_result.success and names_result.output:
-            for line in names_result.output.strip().split("\n"):
-                if not line.strip() or not line.startswith("Row:"):
-                    continue
-                id_match = re.search(r"_id=([^,]+)", line)
-                if id_match:
-                    contact_id = id_match.group(1).strip()
-                    name_match = re.search(r"display_name=([^,]+)", line)
-                    if name_match:
-                        display_name = name_match.group(1).strip()
-                        if display_name and display_name.upper() != "NULL":
-                            names_map[contact_id] = display_name
+        for row in snapshot.rows(CONTACTS_URI) or []:
+            if row["_id"] is not None and row["display_name"] is not None:
+                names_map[row["_id"]] = row["display_name"]
 
         # Step 3: Build contacts list from all collected data
         all_contact_ids = set()
@@ -553,78 +538,38 @@ def check_contact_starred_via_adb(controller: AndroidController, phone_number: s
         bool: True if contact is starred, False otherwise
     """
     try:
-        # Step 1: Find the contact_id for the given phone number
-        # Query the phone numbers in contacts
-        phone_query_cmd = (
-            f"adb -s {controller.device} shell content query --uri "
-            f'"content://com.android.contacts/data" --projection "contact_id:data1:mimetype"'
-        )
-        phone_result = execute_adb(phone_query_cmd, output=False, root_required=False)
-
-        if not phone_result.success or not phone_result.output:
-            logger.warning(f"Failed to query phone numbers: {phone_result.error}")
+        snapshot = device_snapshot(controller)
+        if snapshot.rows(CONTACTS_DATA_URI) is None:
             return False
 
         # Find the contact_id that matches the phone number
+        normalized_input = "".join(filter(str.isdigit, phone_number))
         contact_id = None
-        for line in phone_result.output.strip().split("\n"):
-            if not line.strip() or not line.startswith("Row:"):
-                continue
-
-            # Check if this is a phone entry
-            if "phone_v2" not in line and "vnd.android.cursor.item/phone_v2" not in line:
-                continue
-
-            # Extract phone number from data1
-            phone_match = re.search(r"data1=([^,]+)", line)
-            if not phone_match:
-                continue
-
-            phone_in_db = phone_match.group(1).strip()
+        for row in snapshot.contact_data(PHONE_MIMETYPE):
             # Normalize phone numbers for comparison (remove spaces, dashes, etc.)
-            normalized_input = "".join(filter(str.isdigit, phone_number))
-            normalized_db = "".join(filter(str.isdigit, phone_in_db))
-
+            normalized_db = "".join(filter(str.isdigit, row["data1"] or ""))
             if (
                 normalized_input == normalized_db
                 or normalized_db.endswith(normalized_input)
                 or normalized_input.endswith(normalized_db)
-            ):
-                # Found matching phone number, get contact_id
-                contact_id_match = re.search(r"contact_id=([^,]+)", line)
-                if contact_id_match:
-                    contact_id = contact_id_match.group(1).strip()
-                    logger.info(f"Found contact_id={contact_id} for phone={phone_number}")
-                    break
+            ) and row["contact_id"]:
+                contact_id = row["contact_id"]
+                logger.info(f"Found contact_id={contact_id} for phone={phone_number}")
+                break
 
         if not contact_id:
             logger.warning(f"No contact found with phone number: {phone_number}")
             return False
 
-        # Step 2: Query the contacts table to check starred field
-        contact_query_cmd = (
-            f"adb -s {controller.device} shell content query --uri "
-            f'"content://com.android.contacts/contacts" --projection "_id:starred" '
-            f'--where "_id={contact_id}"'
-        )
-        contact_result = execute_adb(contact_query_cmd, output=False, root_required=False)
-
-        if not contact_result.success or not contact_result.output:
-            logger.warning(f"Failed to query contact starred status: {contact_result.error}")
+        contacts = snapshot.rows(CONTACTS_URI)
+        if contacts is None:
             return False
 
-        # Parse the starred field
-        for line in contact_result.output.strip().split("\n"):
-            if not line.strip() or not line.startswith("Row:"):
-                continue
-
-            # Look for starred field
-            starred_match = re.search(r"starred=([^,]+)", line)
-            if starred_match:
-                starred_value = starred_match.group(1).strip()
-                is_starred = starred_value == "1"
+        for row in contacts:
+            if row["_id"] == contact_id and row["starred"] is not None:
+                is_starred = row["starred"] == "1"
                 logger.info(
-                    f"Contact {contact_id} starred status: {is_starred} (value={starred_value})"
+                    f"Contact {contact_id} starred status: {is_starred} (value={row['starred']})"
                 )
                 return is_starred
 
@@ -655,59 +600,35 @@ def check_contact_via_adb(
         bool: True if matching contact is found with correct info, False otherwise
     """
     try:
-        # Query contacts database using content provider
-        # We need to check: display_name, phone number, and company (organization)
-        query_cmd = f"adb -s {controller.device} shell content query --uri content://com.android.contacts/data"
-        result = execute_adb(query_cmd, output=False, root_required=True)
-        if not result.success or not result.output:
-            logger.warning(f"Failed to query contacts database: {result.error}")
+        rows = device_snapshot(controller).rows(CONTACTS_DATA_URI)
+        if rows is None:
             return False
 
-        # Parse the result line by line
-        lines = result.output.strip().split("\n")
-
         # Track contact by raw_contact_id
         contact_info = {}  # raw_contact_id -> {name, phone, company}
 
-        for line in lines:
-            if not line.strip() or "Row:" not in line:
-                continue
-
-            # Parse fields from the line
-            fields = {}
-            # Split by comma, but be careful with values that might contain commas
-            parts = line.split(", ")
-            for part in parts:
-                if "=" in part:
-                    key_value = part.split("=", 1)
-                    if len(key_value) == 2:
-                        key = key_value[0].strip()
-                        value = key_value[1].strip()
-                        fields[key] = value
-
-            # Get raw_contact_id
-            raw_contact_id = fields.get("raw_contact_id")
+        for row in rows:
+            raw_contact_id = row["raw_contact_id"]
             if not raw_contact_id:
                 continue
 
-            # Initialize contact_info for this raw_contact_id if not exists
             if raw_contact_id not in contact_info:
                 contact_info[raw_contact_id] = {"name": None, "phone": None, "company": None}
 
             # Get mimetype to determine what kind of data this is
-            mimetype = fields.get("mimetype", "")
-            data1 = fields.get("data1", "")
+            mimetype = (row["mimetype"] or "").lower()
+            data1 = row["data1"]
 
             # Check for name (mimetype: vnd.android.cursor.item/name)
-            if "name" in mimetype.lower():
+            if "name" in mimetype:
                 contact_info[raw_contact_id]["name"] = data1
 
             # Check for phone (mimetype: vnd.android.cursor.item/phone_v2)
-            elif "phone" in mimetype.lower():
+            elif "phone" in mimetype:
                 contact_info[raw_contact_id]["phone"] = data1
 
             # Check for organization/company (mimetype: vnd.android.cursor.item/organization)
-            elif "organization" in mimetype.lower():
+            elif "organization" in mimetype:
                 contact_info[raw_contact_id]["company"] = data1
 
         # Now check if any contact matches our criteria
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import copy
 import json
@@ -6,42 +7,188 @@ import time
 from io import BytesIO
 
 import backoff
+import httpx
 import requests
 from loguru import logger
 from markdownify import markdownify
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from mobile_world.runtime.mcp_server import init_mcp_clients
 from mobile_world.runtime.utils.models import MCP, NAVIGATE_HOME, JSONAction, Observation, Response
+from mobile_world.runtime.utils.screenshot import ScreenshotFormat, decode_screenshot
 from mobile_world.runtime.utils.trajectory_logger import SCORE_FILE_NAME
-from mobile_world.tasks.registry import TaskRegistry
 
 TASK_META_DATA_PATH = "./new_task_metadata.json"
 DEFAULT_MAX_STEP = 15
 
+# Per-endpoint request timeouts in seconds; anything not listed uses DEFAULT_TIMEOUT
+DEFAULT_TIMEOUT = 60.0
+ENDPOINT_TIMEOUTS: dict[str, float] = {
+    "/suite_family/switch": 300.0,  # emulator restart
+    "/task/init": 300.0,
+    "/task/eval": 300.0,
+    "/task/tear_down": 300.0,
+    "/health": 30.0,
+    "/metrics": 5.0,
+}
+# Idempotent requests are retried on connection errors and these gateway statuses
+RETRY_STATUSES = (502, 503, 504)
+MAX_RETRIES = 3
+
+
+def endpoint_timeout(path: str) -> float:
+    return ENDPOINT_TIMEOUTS.get(path, DEFAULT_TIMEOUT)
+
+
+def create_session(pool_maxsize: int = 8, max_retries: int = MAX_RETRIES) -> requests.Session:
+    """Create a keep-alive `requests.Session` with a connection pool and retry policy.
+
+    Connection errors are retried for every method, since the request never reached
+    the server; gateway errors only for GET requests.
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=0,
+        status=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
-class AndroidEnvClient:
-    """Client for interacting with the new Android environment server (server.py)."""
+class _EnvClientBase:
+    """Configuration and request/response helpers shared by the sync and async clients."""
 
     def __init__(
         self,
         url: str = "http://localhost:8000",
         device: str = "emulator-5554",
         step_wait_time: float = 1.0,
+        screenshot_format: ScreenshotFormat = "png",
+        stabilize_interval: float = 0.1,
+        stabilize_frames: int = 3,
+        stabilize_min_wait: float = 0.2,
     ):
-        logger.info(
-            "Setting up Android environment using new server design - Initial setup may take"
-            " 5-10 minutes. Please wait..."
-        )
         self.base_url = url
         self.device = device
         self.step_wait_time = step_wait_time
-        self._task_metadata = {}
+        self.screenshot_format = screenshot_format
+        # step_wait_time is the upper bound; stabilization usually returns much earlier
+        self.stabilize_interval = stabilize_interval
+        self.stabilize_frames = stabilize_frames
+        self.stabilize_min_wait = stabilize_min_wait
+        self.last_timings: dict[str, float] = {}
         self._current_task_type = None
         self._initialized = False
-        self._task_registry = TaskRegistry()
         self.tools = []
 
+    def _screenshot_params(self, wait_to_stabilize: bool) -> dict:
+        params = {"device": self.device, "image_format": self.screenshot_format}
+        if wait_to_stabilize:
+            params.update(
+                stable=True,
+                stable_frames=self.stabilize_frames,
+                stable_timeout=self.step_wait_time,
+                stable_interval=self.stabilize_interval,
+                stable_min_wait=self.stabilize_min_wait,
+            )
+        return params
+
+    def _record_stabilization(self, headers) -> None:
+        if "X-Screenshot-Stable-Wait" in headers:
+            self.last_timings["stabilize"] = float(headers["X-Screenshot-Stable-Wait"])
+            self.last_timings["stabilize_frames"] = int(headers["X-Screenshot-Stable-Frames"])
+
+    def _step_payload(self, actions: list[JSONAction]) -> dict:
+        for action in actions:
+            logger.debug(f"Executing action: {action.model_dump_json(exclude_none=True)}")
+        return {
+            "device": self.device,
+            "actions": [action.model_dump() for action in actions],
+            "image_format": self.screenshot_format,
+            "stable": True,
+            "stable_frames": self.stabilize_frames,
+            "stable_timeout": self.step_wait_time,
+            "stable_interval": self.stabilize_interval,
+            "stable_min_wait": self.stabilize_min_wait,
+        }
+
+    def _parse_step_response(
+        self, actions: list[JSONAction], headers, content: bytes
+    ) -> Observation:
+        if "X-Step-Action-Time" in headers:
+            self.last_timings["action"] = float(headers["X-Step-Action-Time"])
+        self._record_stabilization(headers)
+        results = json.loads(headers.get("X-Step-Results", "[]"))
+        logger.debug(f"step_and_observe results: {results}")
+
+        ask_user_response = None
+        for action, result in zip(actions, results):
+            if action.action_type == "ask_user":
+                ask_user_response = result or ""
+                logger.debug(f"ask_user_response: {ask_user_response}")
+
+        return Observation(
+            screenshot=decode_screenshot(content, self.screenshot_format, headers),
+            ask_user_response=ask_user_response,
+            timings=dict(self.last_timings),
+        )
+
+    @staticmethod
+    def _filter_task_list(task_list: list[dict], enable_mcp: bool) -> list[str]:
+        if enable_mcp:
+            return [task["name"] for task in task_list]
+        # exclude agent-mcp tasks
+        return [task["name"] for task in task_list if "agent-mcp" not in task["tags"]]
+
+
+class AndroidEnvClient(_EnvClientBase):
+    """Client for interacting with the new Android environment server (server.py).
+
+    Requests go through a pooled keep-alive session; see `create_session` for the
+    retry policy and `ENDPOINT_TIMEOUTS` for timeouts.
+    """
+
+    def __init__(
+        self,
+        url: str = "http://localhost:8000",
+        device: str = "emulator-5554",
+        step_wait_time: float = 1.0,
+        screenshot_format: ScreenshotFormat = "png",
+        stabilize_interval: float = 0.1,
+        stabilize_frames: int = 3,
+        stabilize_min_wait: float = 0.2,
+        pool_maxsize: int = 8,
+    ):
+        logger.info(
+            "Setting up Android environment using new server design - Initial setup may take"
+            " 5-10 minutes. Please wait..."
+        )
+        super().__init__(
+            url,
+            device,
+            step_wait_time=step_wait_time,
+            screenshot_format=screenshot_format,
+            stabilize_interval=stabilize_interval,
+            stabilize_frames=stabilize_frames,
+            stabilize_min_wait=stabilize_min_wait,
+        )
+        self._session = create_session(pool_maxsize=pool_maxsize)
+        self._task_metadata = {}
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", endpoint_timeout(path))
+        return self._session.request(method, f"{self.base_url}{path}", **kwargs)
+
     def _ensure_initialized(self):
         """Ensure the device is initialized."""
         if not self._initialized:
@@ -49,7 +196,7 @@ class AndroidEnvClient:
             init_data = {
                 "device": self.device,
             }
-            response = requests.post(f"{self.base_url}/init", json=init_data)
+            response = self._request("POST", "/init", json=init_data)
             response.raise_for_status()
             self._initialized = True
 
@@ -70,10 +217,8 @@ class AndroidEnvClient:
         logger.info(f"Switching to suite_family: {target_family}")
 
         try:
-            response = requests.post(
-                f"{self.base_url}/suite_family/switch",
-                params={"target_family": target_family},
-                timeout=300,  # Allow time for emulator restart
+            response = self._request(
+                "POST", "/suite_family/switch", params={"target_family": target_family}
             )
             response.raise_for_status()
             result = response.json()
@@ -110,26 +255,25 @@ class AndroidEnvClient:
         ),
     )
     def get_screenshot(self, wait_to_stabilize: bool = False) -> Image.Image:
-        """Gets the current screenshot of the environment."""
-        self._ensure_initialized()
+        """Gets the current screenshot of the environment.
 
-        if wait_to_stabilize:
-            time.sleep(self.step_wait_time)
+        With `wait_to_stabilize`, the server polls frames until the screen stops
+        changing, waiting at most `step_wait_time`.
+        """
+        self._ensure_initialized()
 
-        response = requests.get(
-            f"{self.base_url}/screenshot",
-            params={"device": self.device, "return_b64": True},
+        start = time.perf_counter()
+        response = self._request(
+            "GET", "/screenshot", params=self._screenshot_params(wait_to_stabilize)
         )
-        # response.raise_for_status()
         if not response.ok:
             logger.error(f"Failed to get screenshot: {response.text}")
             raise RuntimeError(f"Failed to get screenshot: {response.text}")
+        self.last_timings["observe"] = time.perf_counter() - start
+        if wait_to_stabilize:
+            self._record_stabilization(response.headers)
 
-        # Convert base64 to numpy array
-        image_base64 = response.json()["b64_png"]
-        image = self._base64_to_pil(image_base64)
-
-        return image
+        return decode_screenshot(response.content, self.screenshot_format, response.headers)
 
     def get_observation(self, type="screenshot", wait_to_stabilize: bool = True) -> dict:
         """Gets the current observation of the environment."""
@@ -147,49 +291,53 @@ class AndroidEnvClient:
 
     def execute_action(self, action: JSONAction) -> Observation:
         """Executes an action in the environment."""
+        return self.step(action)
+
+    def step(self, actions: JSONAction | list[JSONAction]) -> Observation:
+        """Execute one action (or an ordered list) and return the next observation.
+
+        Uses the combined `/step_and_observe` endpoint, so the action, the wait for the
+        screen to settle and the screenshot take a single round trip. If the server
+        rejects the actions, the failure is logged and a fresh screenshot is returned,
+        as with separate `/step` and `/screenshot` calls.
+        """
         self._ensure_initialized()
 
-        logger.debug(f"Executing action: {action.model_dump_json(exclude_none=True)}")
+        actions = [actions] if isinstance(actions, JSONAction) else list(actions)
 
-        # Send JSONAction directly to server
-        step_data = {
-            "device": self.device,
-            "action": action.model_dump(),
-        }
+        self.last_timings = {}
+        start = time.perf_counter()
+        response = self._request("POST", "/step_and_observe", json=self._step_payload(actions))
+        if not response.ok:
+            logger.error(
+                f"step_and_observe failed ({response.status_code}): {response.text}, "
+                "falling back to a plain screenshot"
+            )
+            screenshot = self.get_screenshot(wait_to_stabilize=True)
+            return Observation(screenshot=screenshot, timings=dict(self.last_timings))
 
-        response = requests.post(f"{self.base_url}/step", json=step_data)
-        logger.debug(f"""execute_action response: {{
-            "status": {response.status_code},
-            "message": {response.text},
-        }}""")
+        self.last_timings["step"] = time.perf_counter() - start
+        return self._parse_step_response(actions, response.headers, response.content)
 
-        res = self.get_screenshot(wait_to_stabilize=True)
-        ask_user_response = None
-        if action.action_type == "ask_user" and response.text is not None:
-            message = json.loads(response.text)
-            ask_user_response = message.get("result", "")
-            logger.debug(f"ask_user_response: {ask_user_response}")
+    async def execute_action_async(self, action: JSONAction) -> Observation:
+        """Coroutine variant of `execute_action`, run in a worker thread."""
+        return await asyncio.to_thread(self.execute_action, action)
 
-        return Observation(
-            screenshot=res,
-            ask_user_response=ask_user_response,
-        )
+    async def get_screenshot_async(self, wait_to_stabilize: bool = False) -> Image.Image:
+        """Coroutine variant of `get_screenshot`, run in a worker thread."""
+        return await asyncio.to_thread(self.get_screenshot, wait_to_stabilize)
+
+    async def initialize_task_async(self, task_name: str) -> Observation:
+        """Coroutine variant of `initialize_task`, run in a worker thread."""
+        return await asyncio.to_thread(self.initialize_task, task_name)
 
     def get_suite_task_list(self, enable_mcp: bool = False) -> list[str]:
         """Gets the list of tasks in the suite."""
         self._ensure_initialized()
 
-        response = requests.get(f"{self.base_url}/task/list")
+        response = self._request("GET", "/task/list")
         response.raise_for_status()
-        task_list = response.json()
-        if enable_mcp:
-            task_list = [task["name"] for task in task_list]
-        else:
-            task_list = [
-                task["name"] for task in task_list if "agent-mcp" not in task["tags"]
-            ]  # exclude agent-mcp tasks
-
-        return task_list
+        return self._filter_task_list(response.json(), enable_mcp)
 
     def get_suite_task_length(self, task_type: str) -> int:
         """Gets the length of the suite of tasks."""
@@ -212,16 +360,18 @@ class AndroidEnvClient:
 
         try:
             init_data = {"task_name": task_name, "req_device": self.device}
-            response = requests.post(f"{self.base_url}/task/init", json=init_data, timeout=300)
+            response = self._request("POST", "/task/init", json=init_data)
             response.raise_for_status()
 
             self._current_task_type = task_name
 
             logger.debug(f"initialize_task response: Task {task_name} initialized")
+            self.last_timings = {}
             res = self.get_screenshot(wait_to_stabilize=True)
             return Observation(
                 screenshot=res,
                 ask_user_response=None,
+                timings=dict(self.last_timings),
             )
         except Exception as e:
             logger.error(f"Failed to initialize task {task_name}: {e}")
@@ -233,7 +383,7 @@ class AndroidEnvClient:
 
         try:
             tear_down_data = {"task_name": task_type, "req_device": self.device}
-            response = requests.post(f"{self.base_url}/task/tear_down", json=tear_down_data)
+            response = self._request("POST", "/task/tear_down", json=tear_down_data)
             response.raise_for_status()
 
             self._current_task_type = None
@@ -250,8 +400,9 @@ class AndroidEnvClient:
         self._ensure_initialized()
 
         try:
-            response = requests.get(
-                f"{self.base_url}/task/eval",
+            response = self._request(
+                "GET",
+                "/task/eval",
                 json={"task_name": task_type, "req_device": self.device},
             )
             response.raise_for_status()
@@ -267,7 +418,7 @@ class AndroidEnvClient:
         """Gets the goal of the current task."""
         self._ensure_initialized()
 
-        response = requests.get(f"{self.base_url}/task/goal", params={"task_name": task_type})
+        response = self._request("GET", "/task/goal", params={"task_name": task_type})
         response.raise_for_status()
         return response.json()
 
@@ -275,19 +426,19 @@ class AndroidEnvClient:
         """Gets the metadata of the current task."""
         self._ensure_initialized()
 
-        response = requests.get(f"{self.base_url}/task/metadata", params={"task_name": task_type})
+        response = self._request("GET", "/task/metadata", params={"task_name": task_type})
         response.raise_for_status()
         return response.json()
 
     def close(self) -> None:
         """Closes the environment."""
-        # The new server doesn't have a close endpoint, so this is a no-op
-        pass
+        # The new server doesn't have a close endpoint; only release pooled connections
+        self._session.close()
 
     def health(self) -> bool:
         """Checks the health of the environment."""
         try:
-            response = requests.get(f"{self.base_url}/health")
+            response = self._request("GET", "/health")
             response.raise_for_status()
             result = response.json()
             return result.get("ok", False)
@@ -295,11 +446,25 @@ class AndroidEnvClient:
             print(f"Environment is not healthy: {e}")
             return False
 
+    def probe(self) -> bool:
+        """Checks the server's cached heartbeat of the device.
+
+        Unlike `health()`, this never triggers an emulator restart on the server, so it
+        returns quickly for a broken environment.
+        """
+        try:
+            response = self._request("GET", "/metrics")
+            response.raise_for_status()
+            return bool(response.json().get(self.device, {}).get("healthy"))
+        except Exception as e:
+            logger.warning(f"Environment probe failed: {e}")
+            return False
+
     def get_task_complexity(self, task_type: str) -> float:
         """Gets the complexity of the current task."""
         self._ensure_initialized()
 
-        response = requests.get(f"{self.base_url}/task/complexity", params={"task_name": task_type})
+        response = self._request("GET", "/task/complexity", params={"task_name": task_type})
         response.raise_for_status()
         return float(response.json())
 
@@ -315,7 +480,7 @@ class AndroidEnvClient:
 
     def get_task_list(self) -> list[str]:
         """Get the list of tasks."""
-        response = requests.get(f"{self.base_url}/task/list")
+        response = self._request("GET", "/task/list")
         response.raise_for_status()
         return response.json()
 
@@ -366,19 +531,247 @@ class AndroidMCPEnvClient(AndroidEnvClient):
             action_name = action.action_name
             action_args = action.action_json
             client = self.tool_map[action_name]
+            self.last_timings = {}
+            start = time.perf_counter()
             result = client.call_tool_sync(action_name, action_args)
             result = self._truncate_tool_call(result)
+            self.last_timings["action"] = time.perf_counter() - start
 
             res = self.get_screenshot(wait_to_stabilize=True)
             return Observation(
                 screenshot=res,
                 ask_user_response=None,
                 tool_call=result,
+                timings=dict(self.last_timings),
             )
         else:
             return super().execute_action(action)
 
 
+class AsyncAndroidEnvClient(_EnvClientBase):
+    """asyncio client for the Android environment server.
+
+    Mirrors the task-execution API of `AndroidEnvClient` on a shared `httpx.AsyncClient`
+    so one event loop can drive many environments. MCP tool calls are not supported.
+    """
+
+    def __init__(
+        self,
+        url: str = "http://localhost:8000",
+        device: str = "emulator-5554",
+        step_wait_time: float = 1.0,
+        screenshot_format: ScreenshotFormat = "png",
+        stabilize_interval: float = 0.1,
+        stabilize_frames: int = 3,
+        stabilize_min_wait: float = 0.2,
+        max_connections: int = 8,
+        max_retries: int = MAX_RETRIES,
+    ):
+        super().__init__(
+            url,
+            device,
+            step_wait_time=step_wait_time,
+            screenshot_format=screenshot_format,
+            stabilize_interval=stabilize_interval,
+            stabilize_frames=stabilize_frames,
+            stabilize_min_wait=stabilize_min_wait,
+        )
+        self.max_retries = max_retries
+        self._client = httpx.AsyncClient(
+            base_url=url,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            # retries connection failures only, like the sync session
+            transport=httpx.AsyncHTTPTransport(retries=max_retries),
+        )
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        kwargs.setdefault("timeout", endpoint_timeout(path))
+        for attempt in range(self.max_retries + 1):
+            response = await self._client.request(method, path, **kwargs)
+            if (
+                method != "GET"
+                or response.status_code not in RETRY_STATUSES
+                or attempt == self.max_retries
+            ):
+                return response
+            await asyncio.sleep(0.5 * 2**attempt)
+        return response
+
+    async def _ensure_initialized(self) -> None:
+        if not self._initialized:
+            response = await self._request("POST", "/init", json={"device": self.device})
+            response.raise_for_status()
+            self._initialized = True
+
+    async def switch_suite_family(self, target_family: str) -> dict:
+        """Switch to a different suite family, restarting the emulator if needed."""
+        logger.info(f"Switching to suite_family: {target_family}")
+        try:
+            response = await self._request(
+                "POST", "/suite_family/switch", params={"target_family": target_family}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to switch suite family: {e}")
+            raise RuntimeError(f"Failed to switch to suite_family {target_family}: {e}")
+        result = response.json()
+        logger.info(f"Suite family switch result: {result}")
+        if result.get("switched"):
+            self._initialized = False
+        return result
+
+    async def reset(self, go_home: bool) -> Response:
+        """Resets the environment by going home if requested."""
+        await self._ensure_initialized()
+        if go_home:
+            await self.execute_action(JSONAction(action_type=NAVIGATE_HOME))
+        return Response(status="success", message="Environment reset")
+
+    @backoff.on_exception(
+        backoff.expo,
+        Exception,
+        max_tries=3,
+        on_backoff=lambda details: logger.warning(
+            f"Retrying get_screenshot after error (attempt {details['tries']}/3)"
+        ),
+    )
+    async def get_screenshot(self, wait_to_stabilize: bool = False) -> Image.Image:
+        """Gets the current screenshot, optionally after the screen has settled."""
+        await self._ensure_initialized()
+
+        start = time.perf_counter()
+        response = await self._request(
+            "GET", "/screenshot", params=self._screenshot_params(wait_to_stabilize)
+        )
+        if not response.is_success:
+            logger.error(f"Failed to get screenshot: {response.text}")
+            raise RuntimeError(f"Failed to get screenshot: {response.text}")
+        self.last_timings["observe"] = time.perf_counter() - start
+        if wait_to_stabilize:
+            self._record_stabilization(response.headers)
+        return decode_screenshot(response.content, self.screenshot_format, response.headers)
+
+    async def execute_action(self, action: JSONAction) -> Observation:
+        """Executes an action in the environment."""
+        return await self.step(action)
+
+    async def step(self, actions: JSONAction | list[JSONAction]) -> Observation:
+        """Execute one action (or an ordered list) and return the next observation."""
+        await self._ensure_initialized()
+
+        actions = [actions] if isinstance(actions, JSONAction) else list(actions)
+        self.last_timings = {}
+        start = time.perf_counter()
+        response = await self._request(
+            "POST", "/step_and_observe", json=self._step_payload(actions)
+        )
+        if not response.is_success:
+            logger.error(
+                f"step_and_observe failed ({response.status_code}): {response.text}, "
+                "falling back to a plain screenshot"
+            )
+            screenshot = await self.get_screenshot(wait_to_stabilize=True)
+            return Observation(screenshot=screenshot, timings=dict(self.last_timings))
+
+        self.last_timings["step"] = time.perf_counter() - start
+        return self._parse_step_response(actions, response.headers, response.content)
+
+    async def get_suite_task_list(self, enable_mcp: bool = False) -> list[str]:
+        """Gets the list of tasks in the suite."""
+        await self._ensure_initialized()
+        response = await self._request("GET", "/task/list")
+        response.raise_for_status()
+        return self._filter_task_list(response.json(), enable_mcp)
+
+    async def initialize_task(self, task_name: str) -> Observation:
+        """Initializes the task in the environment."""
+        await self._ensure_initialized()
+        try:
+            response = await self._request(
+                "POST", "/task/init", json={"task_name": task_name, "req_device": self.device}
+            )
+            response.raise_for_status()
+            self._current_task_type = task_name
+
+            logger.debug(f"initialize_task response: Task {task_name} initialized")
+            self.last_timings = {}
+            screenshot = await self.get_screenshot(wait_to_stabilize=True)
+            return Observation(screenshot=screenshot, timings=dict(self.last_timings))
+        except Exception as e:
+            logger.error(f"Failed to initialize task {task_name}: {e}")
+            raise RuntimeError(f"Failed to initialize task {task_name}: {e}")
+
+    async def tear_down_task(self, task_type: str) -> Response:
+        """Tears down the task in the environment."""
+        await self._ensure_initialized()
+        try:
+            response = await self._request(
+                "POST", "/task/tear_down", json={"task_name": task_type, "req_device": self.device}
+            )
+            response.raise_for_status()
+            self._current_task_type = None
+            return Response(status="success", message=f"Task {task_type} torn down")
+        except Exception as e:
+            logger.error(f"Failed to tear down task {task_type}: {e}")
+            return Response(
+                status="error", message=f"Failed to tear down task {task_type}: {str(e)}"
+            )
+
+    async def get_task_score(self, task_type: str) -> tuple[float, str]:
+        """Gets the score of the current task."""
+        await self._ensure_initialized()
+        try:
+            # httpx only sends a GET body through the generic request API
+            response = await self._request(
+                "GET", "/task/eval", json={"task_name": task_type, "req_device": self.device}
+            )
+            response.raise_for_status()
+            result = response.json()
+            score = float(result.get("score", 0.0))
+            reason = result.get("reason", f"No reason provided for {task_type}")
+            return score, reason
+        except Exception:
+            logger.exception(f"Failed to get task score for {task_type}")
+            raise RuntimeError(f"Failed to get task score for {task_type}")
+
+    async def get_task_goal(self, task_type: str) -> str:
+        """Gets the goal of the current task."""
+        await self._ensure_initialized()
+        response = await self._request("GET", "/task/goal", params={"task_name": task_type})
+        response.raise_for_status()
+        return response.json()
+
+    async def get_task_metadata(self, task_type: str) -> dict:
+        """Gets the metadata of the current task."""
+        await self._ensure_initialized()
+        response = await self._request("GET", "/task/metadata", params={"task_name": task_type})
+        response.raise_for_status()
+        return response.json()
+
+    async def health(self) -> bool:
+        """Checks the health of the environment."""
+        try:
+            response = await self._request("GET", "/health")
+            response.raise_for_status()
+            return response.json().get("ok", False)
+        except Exception as e:
+            logger.warning(f"Environment is not healthy: {e}")
+            return False
+
+    async def close(self) -> None:
+        """Release pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncAndroidEnvClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
 def parse_result_file(result_file: str) -> tuple[float, str | None]:
     """Parse the result file."""
     with open(result_file) as f:
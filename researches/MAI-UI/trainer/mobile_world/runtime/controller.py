@@ -6,20 +6,36 @@ from datetime import datetime
 
 from loguru import logger
 
+from mobile_world.runtime.utils.adb_transport import (
+    AdbTransport,
+    AdbTransportError,
+    create_adb_transport,
+)
 from mobile_world.runtime.utils.helpers import (
     AdbResponse,
     execute_adb,
     time_within_ten_secs,
 )
 from mobile_world.runtime.utils.models import APP_DICT, COMMON_APP_MAPPER
+from mobile_world.runtime.utils.provisioning import (
+    ProvisionManifest,
+    ProvisionResult,
+    provision,
+)
+from mobile_world.runtime.utils.screenshot import STABLE_SIGNATURE_TOLERANCE, screen_signature
+from mobile_world.runtime.utils.stabilization import StabilizationResult, wait_until_stable
 
 APP_LOWER_DICT = {k.lower(): v for k, v in APP_DICT.items()}
 APP_LOWER_DICT.update({app_name.lower(): package_name for package_name, app_name in COMMON_APP_MAPPER.items()})
 
 
 class AndroidController:
-    def __init__(self, device="emulator-5554"):
+    def __init__(self, device="emulator-5554", transport: AdbTransport | str | None = None):
         self.device = device
+        if isinstance(transport, AdbTransport):
+            self.transport = transport
+        else:
+            self.transport = create_adb_transport(device, transport)
         self.screenshot_dir = "/sdcard"
         self.xml_dir = "/sdcard"
         self.ac_xml_dir = "/sdcard/Android/data/com.example.android.xml_parser/files"
@@ -36,8 +52,7 @@ class AndroidController:
 
     def get_device_size(self):
         try:
-            command = f"adb -s {self.device} shell wm size"
-            result = execute_adb(command)
+            result = self.transport.shell("wm size")
             if not result.success:
                 raise RuntimeError("Failed to get device size for device")
             resolution = result.output.split(":")[1].strip()
@@ -55,10 +70,14 @@ class AndroidController:
 
         # try the stealth API first, otherwise screenshot
         # may trigger events in some apps
-        stealth_command = f"adb -s {self.device} exec-out screencap -p > {local_path}"
-        stealth_result = execute_adb(stealth_command)
-        if stealth_result.success:
+        stealth_command = f"adb -s {self.device} exec-out screencap -p"
+        try:
+            data = self.capture_screenshot()
+            with open(local_path, "wb") as f:
+                f.write(data)
             return AdbResponse(success=True, output=local_path, command=stealth_command)
+        except AdbTransportError as e:
+            logger.warning(f"{stealth_command} failed, falling back to screencap + pull: {e}")
 
         cap_command = f"adb -s {self.device} shell screencap -p {remote_path}"
         pull_command = f"adb -s {self.device} pull {remote_path} {local_path}"
@@ -82,6 +101,73 @@ class AndroidController:
                 return AdbResponse(success=True, output=local_path, command=pull_command)
         return cap_result
 
+    def capture_screenshot(self, raw: bool = False) -> bytes:
+        """
+        Capture the screen straight into memory with `exec-out screencap`.
+
+        Args:
+            raw: Return the uncompressed framebuffer (`screencap` without `-p`),
+                 which skips the on-device PNG encode
+
+        Returns:
+            PNG bytes, or the raw screencap payload when raw is True
+
+        Raises:
+            AdbTransportError: If the capture failed
+        """
+        command = "screencap" if raw else "screencap -p"
+        data = self.transport.exec_out(command)
+        if not data:
+            raise AdbTransportError(f"adb -s {self.device} exec-out {command} returned no data")
+        return data
+
+    def wait_for_stable_screen(
+        self,
+        stable_frames: int = 2,
+        timeout: float = 2.0,
+        interval: float = 0.1,
+        min_wait: float = 0.0,
+    ) -> StabilizationResult[bytes]:
+        """Poll raw framebuffer captures until `stable_frames` consecutive ones match."""
+        return wait_until_stable(
+            lambda: self.capture_screenshot(raw=True),
+            timeout=timeout,
+            interval=interval,
+            stable_frames=stable_frames,
+            min_wait=min_wait,
+            key=screen_signature,
+            tolerance=STABLE_SIGNATURE_TOLERANCE,
+        )
+
+    def _boot_completed(self) -> bool:
+        try:
+            result = self.transport.shell("getprop sys.boot_completed", output=False)
+        except AdbTransportError:
+            return False
+        return result.success and result.output.strip() == "1"
+
+    def wait_until_ready(self, timeout: float = 10.0, interval: float = 0.2) -> bool:
+        """Poll until the device reports boot completed and its screen has settled.
+
+        Used instead of fixed sleeps after a snapshot load; returns False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while not self._boot_completed():
+            if time.monotonic() >= deadline:
+                logger.warning(f"Device {self.device} not ready after {timeout}s")
+                return False
+            time.sleep(interval)
+        remaining = max(deadline - time.monotonic(), 0.0)
+        try:
+            result = self.wait_for_stable_screen(timeout=min(remaining, 3.0), interval=interval)
+        except AdbTransportError as e:
+            logger.warning(f"Screen readiness check failed on {self.device}: {e}")
+            return False
+        logger.debug(
+            f"Device {self.device} ready: stable={result.stable}, waited={result.waited:.2f}s"
+        )
+        return result.stable
+
     def get_xml(self, prefix, save_dir):
         remote_path = os.path.join(self.xml_dir, prefix + ".xml").replace(self.backslash, "/")
         local_path = os.path.join(save_dir, prefix + ".xml")
@@ -148,28 +234,23 @@ class AndroidController:
         return app
 
     def back(self) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input keyevent KEYCODE_BACK"
-        ret = execute_adb(adb_command)
+        ret = self.transport.shell("input keyevent KEYCODE_BACK")
         return ret
 
     def enter(self) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input keyevent KEYCODE_ENTER"
-        ret = execute_adb(adb_command)
+        ret = self.transport.shell("input keyevent KEYCODE_ENTER")
         return ret
 
     def home(self) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input keyevent KEYCODE_HOME"
-        ret = execute_adb(adb_command)
+        ret = self.transport.shell("input keyevent KEYCODE_HOME")
         return ret
 
     def app_switch(self) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input keyevent KEYCODE_APP_SWITCH"
-        ret = execute_adb(adb_command)
+        ret = self.transport.shell("input keyevent KEYCODE_APP_SWITCH")
         return ret
 
     def tap(self, x: int, y: int) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input tap {x} {y}"
-        ret = execute_adb(adb_command)
+        ret = self.transport.shell(f"input tap {x} {y}")
         return ret
 
     def double_tap(self, x: int, y: int) -> AdbResponse:
@@ -181,10 +262,7 @@ class AndroidController:
     def text(self, input_str: str) -> AdbResponse:
         chars = input_str
         charsb64 = str(base64.b64encode(chars.encode("utf-8")))[1:]
-        adb_command = (
-            f"adb -s {self.device} shell am broadcast -a ADB_INPUT_B64 --es msg {charsb64}"
-        )
-        ret = execute_adb(adb_command)
+        ret = self.transport.shell(f"am broadcast -a ADB_INPUT_B64 --es msg {charsb64}")
         return ret
 
     def simulate_sms(self, sender: str | None, message: str | None) -> AdbResponse:
@@ -200,13 +278,11 @@ class AndroidController:
         return ret
 
     def long_press(self, x: int, y: int, duration: int = 1000) -> AdbResponse:
-        adb_command = f"adb -s {self.device} shell input swipe {x} {y} {x} {y} {duration}"
-        ret = execute_adb(adb_command)
+        ret = self.transport.shell(f"input swipe {x} {y} {x} {y} {duration}")
         return ret
 
     def kill_package(self, package_name: str) -> AdbResponse:
-        command = f"adb -s {self.device} shell am force-stop {package_name}"
-        return execute_adb(command)
+        return self.transport.shell(f"am force-stop {package_name}")
 
     def swipe(
         self,
@@ -239,25 +315,24 @@ class AndroidController:
                 command=f"adb -s {self.device} shell input swipe",
             )
         duration = 400
-        adb_command = f"adb -s {self.device} shell input swipe {x} {y} {x + offset[0]} {y + offset[1]} {duration}"
-        ret = execute_adb(adb_command)
+        ret = self.transport.shell(
+            f"input swipe {x} {y} {x + offset[0]} {y + offset[1]} {duration}"
+        )
         return ret
 
     def drag(
         self, start_x: int, start_y: int, end_x: int, end_y: int, duration: int = 400
     ) -> AdbResponse:
-        adb_command = (
-            f"adb -s {self.device} shell input swipe {start_x} {start_y} {end_x} {end_y} {duration}"
-        )
-        ret = execute_adb(adb_command)
+        ret = self.transport.shell(f"input swipe {start_x} {start_y} {end_x} {end_y} {duration}")
         return ret
 
     def launch_app(self, app_name: str) -> AdbResponse:
         command = None
 
         if app_name.lower() in APP_LOWER_DICT:
-            command = f"adb -s {self.device} shell monkey -p {APP_LOWER_DICT[app_name.lower()]} -c android.intent.category.LAUNCHER 1"
-            ret = execute_adb(command)
+            package_name = APP_LOWER_DICT[app_name.lower()]
+            command = f"monkey -p {package_name} -c android.intent.category.LAUNCHER 1"
+            ret = self.transport.shell(command)
             if ret.success:
                 return ret
         logger.warning(
@@ -310,11 +385,11 @@ class AndroidController:
 
     def check_ac_survive(self):
         try:
-            time_command = f"adb -s {self.device} shell stat -c %y /sdcard/Android/data/com.example.android.xml_parser/files/ui.xml"
-            time_phone_command = f'adb -s {self.device} shell date +"%H:%M:%S"'
+            time_command = "stat -c %y /sdcard/Android/data/com.example.android.xml_parser/files/ui.xml"
+            time_phone_command = 'date +"%H:%M:%S"'
             result = time_within_ten_secs(
-                execute_adb(time_command),
-                execute_adb(time_phone_command),
+                self.transport.shell(time_command),
+                self.transport.shell(time_phone_command),
             )
         except Exception as e:
             print(e)
@@ -391,8 +466,8 @@ class AndroidController:
 
             if result.success and "OK" in result.output:
                 logger.info(f"Successfully loaded snapshot: {tag}")
-                # Wait a moment for the snapshot to fully load
-                time.sleep(3)
+                # Wait for the restored device to settle instead of a fixed delay
+                self.wait_until_ready()
                 return True
             else:
                 logger.error(
@@ -408,8 +483,7 @@ class AndroidController:
 
     def check_health(self, try_times: int = 0) -> bool:
         try:
-            adb_command = f"adb -s {self.device} shell getprop sys.boot_completed"
-            result = execute_adb(adb_command, output=False)
+            result = self.transport.shell("getprop sys.boot_completed", output=False)
 
             if not result.success or not result.output:
                 logger.error(f"Health check failed for device {self.device}: {result.error}")
@@ -486,8 +560,7 @@ class AndroidController:
         Returns:
             Result of the command execution
         """
-        remove_command = f"adb -s {self.device} shell rm {remote_path}"
-        result = execute_adb(remove_command)
+        result = self.transport.shell(f"rm {remote_path}")
 
         if result.success:
             logger.info(f"Successfully removed file: {remote_path}")
@@ -506,12 +579,9 @@ class AndroidController:
         Returns:
             Result of the command execution
         """
-        scan_command = (
-            f"adb -s {self.device} shell am broadcast "
-            f"-a android.intent.action.MEDIA_SCANNER_SCAN_FILE "
-            f"-d file://{file_path}"
+        result = self.transport.shell(
+            f"am broadcast -a android.intent.action.MEDIA_SCANNER_SCAN_FILE -d file://{file_path}"
         )
-        result = execute_adb(scan_command)
 
         if result.success:
             logger.info(f"Successfully triggered media scan for: {file_path}")
@@ -520,6 +590,20 @@ class AndroidController:
 
         return result
 
+    def provision(self, manifest: ProvisionManifest) -> ProvisionResult:
+        """
+        Apply files, SQL rows and settings to the device in batched transfers.
+
+        Files already on the device with the same content are skipped.
+
+        Args:
+            manifest: What to provision
+
+        Returns:
+            ProvisionResult, with `error` set if a step failed
+        """
+        return provision(manifest, self.device)
+
 
 if __name__ == "__main__":
     And = AndroidController("emulator-5554")
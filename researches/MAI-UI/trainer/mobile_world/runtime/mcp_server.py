@@ -3,14 +3,21 @@
 import asyncio
 import concurrent.futures
 import os
+import threading
+import time
 from collections.abc import Callable
 from threading import Lock
 from typing import Any
 
+import anyio
 import dotenv
+import httpx
 from fastmcp.client import Client
+from fastmcp.exceptions import ToolError
 from loguru import logger
 
+from mobile_world.runtime.utils.mcp_cache import MCPResultCache
+
 dotenv.load_dotenv()
 
 
@@ -45,12 +52,53 @@ MCP_CONFIG = {
         },
     }
 }
+# Concurrent calls per MCP server; servers not listed use DEFAULT_SERVER_CONCURRENCY
+DEFAULT_SERVER_CONCURRENCY = 4
+SERVER_CONCURRENCY: dict[str, int] = {}
+
+# Failures that may leave a session unusable; the session is reconnected after these.
+# fastmcp reports a session closed under it as RuntimeError.
+TRANSPORT_ERRORS = (
+    OSError,  # includes ConnectionError and TimeoutError
+    httpx.TransportError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    RuntimeError,
+)
+
 CLIENT = None
 client_lock = Lock()
 
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """The event loop thread that owns all MCP sessions, started on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="mcp-client-loop", daemon=True).start()
+        return _loop
+
 
 class SyncMCPClient:
-    """MCP client with sync interface. Uses persistent connection for stdio transports."""
+    """MCP client with a sync facade over persistent sessions.
+
+    Each configured server gets its own `fastmcp.Client`, connected once and kept open
+    on a shared background event loop. Calls from any thread (`*_sync`) or any other
+    event loop (the async methods) are run on that loop, so environments evaluated in
+    parallel do not serialize on one lock and do not reconnect for every call. At
+    most `max_concurrency` calls (or `server_concurrency[server]`) run per server.
+
+    With several servers, tool names are prefixed with `{server}_` as fastmcp's
+    composite client does.
+
+    Successful tool results are cached by `cache` (see `runtime.utils.mcp_cache`), so
+    the agent and the task evaluators share results and MCP tasks can be recorded
+    and replayed offline.
+    """
 
     def __init__(
         self,
@@ -59,6 +107,9 @@ class SyncMCPClient:
         max_retries: int = 5,
         retry_delay: float = 10,
         retry_backoff: float = 2,
+        max_concurrency: int = DEFAULT_SERVER_CONCURRENCY,
+        server_concurrency: dict[str, int] | None = None,
+        cache: MCPResultCache | None = None,
     ):
         self.url = url
         self.config = config
@@ -70,51 +121,183 @@ class SyncMCPClient:
 
         self.timeout = 120
 
-        self.client = Client(config) if config else None
+        self.servers: dict[str, dict] = dict(config["mcpServers"]) if config else {}
+        self.max_concurrency = max_concurrency
+        self.server_concurrency = {**SERVER_CONCURRENCY, **(server_concurrency or {})}
+        self.cache = cache if cache is not None else MCPResultCache()
+        # created on the background loop
+        self._clients: dict[str, Client] = {}
+        self._connect_locks: dict[str, asyncio.Lock] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._tools_lock = Lock()
 
-    async def list_tools(self) -> list[dict[str, Any]]:
-        if not self.client:
-            return []
+    # -- running on the background loop --------------------------------------------
+
+    def _submit(self, coro) -> concurrent.futures.Future:
+        loop = _background_loop()
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            coro.close()
+            raise RuntimeError("MCP client methods cannot be awaited on the MCP client loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def _semaphore(self, server: str) -> asyncio.Semaphore:
+        if server not in self._semaphores:
+            limit = self.server_concurrency.get(server, self.max_concurrency)
+            self._semaphores[server] = asyncio.Semaphore(max(1, limit))
+        return self._semaphores[server]
+
+    async def _session(self, server: str) -> Client:
+        """The connected client of `server`, connecting it if needed."""
+        lock = self._connect_locks.setdefault(server, asyncio.Lock())
+        async with lock:
+            client = self._clients.get(server)
+            if client is None or not client.is_connected():
+                client = Client({"mcpServers": {server: self.servers[server]}})
+                start = time.perf_counter()
+                await asyncio.wait_for(client.__aenter__(), timeout=self.timeout)
+                self._clients[server] = client
+                logger.info(
+                    f"Connected to MCP server {server} in {time.perf_counter() - start:.2f}s"
+                )
+            return client
+
+    async def _drop_session(self, server: str, client: Client) -> None:
+        """Close `client`, the session of `server`, so the next call reconnects.
+
+        A session another call has already replaced is left alone.
+        """
+        if self._clients.get(server) is client:
+            del self._clients[server]
+            try:
+                await client.__aexit__(None, None, None)
+            except Exception as e:
+                logger.debug(f"Error closing MCP session {server}: {e}")
+
+    def _prefix(self, server: str) -> str:
+        return f"{server}_" if len(self.servers) > 1 else ""
+
+    def _route(self, name: str) -> tuple[str, str]:
+        """Server and server-local tool name of a (prefixed) tool name."""
+        if len(self.servers) == 1:
+            return next(iter(self.servers)), name
+        matches = [s for s in self.servers if name.startswith(self._prefix(s))]
+        if not matches:
+            raise ValueError(f"No MCP server configured for tool {name}")
+        server = max(matches, key=len)
+        return server, name[len(self._prefix(server)) :]
+
+    async def _with_retries(self, server: str, description: str, func: Callable) -> Any:
         last_exception = None
         delay = self.retry_delay
         for attempt in range(self.max_retries):
+            client = None
             try:
-                async with self.client:
-                    tools_result = await asyncio.wait_for(
-                        self.client.list_tools(), timeout=self.timeout
-                    )
-                    result = [t.model_dump() for t in tools_result]
-                    if not result or len(result) == 0:
-                        raise ValueError("Empty tools list returned")
-                    logger.info(f"Successfully listed {len(result)} tools on attempt {attempt + 1}")
-                    return result
+                async with self._semaphore(server):
+                    client = await self._session(server)
+                    result = await func(client)
+                logger.info(f"Succeeded to {description} on attempt {attempt + 1}")
+                return result
+            except ToolError:
+                # the tool itself failed; the session is fine and a retry would fail again
+                raise
             except Exception as e:
                 last_exception = e
                 logger.warning(
-                    f"Failed to list tools (attempt {attempt + 1}/{self.max_retries}): {e}"
+                    f"Failed to {description} (attempt {attempt + 1}/{self.max_retries}): {e}"
                 )
+                if client is not None and isinstance(e, TRANSPORT_ERRORS):
+                    await self._drop_session(server, client)
             if attempt < self.max_retries - 1:
                 logger.info(f"Retrying in {delay} seconds...")
                 await asyncio.sleep(delay)
                 delay *= self.retry_backoff
-        error_msg = f"Failed to list tools after {self.max_retries} attempts: {last_exception}"
-        logger.error(error_msg)
-        return []
+        raise RuntimeError(
+            f"Failed to {description} after {self.max_retries} attempts: {last_exception}"
+        )
+
+    async def _list_server_tools(self, server: str) -> list[dict[str, Any]]:
+        async def list_tools(client: Client) -> list[dict[str, Any]]:
+            tools_result = await asyncio.wait_for(client.list_tools(), timeout=self.timeout)
+            result = [t.model_dump() for t in tools_result]
+            if not result:
+                raise ValueError("Empty tools list returned")
+            return result
 
-    def _run_async_func(self, func: Callable[..., Any]) -> Any:
+        if self.cache.replay:
+            tools = self.cache.recorded_tools(server)
+            if tools is None:
+                raise ValueError(f"No recorded tool list for MCP server {server}")
+        else:
+            tools = await self._with_retries(server, f"list tools of {server}", list_tools)
+            self.cache.record_tools(server, tools)
+        for tool in tools:
+            tool["name"] = self._prefix(server) + tool["name"]
+        return tools
+
+    async def _list_tools(self) -> list[dict[str, Any]]:
+        results = await asyncio.gather(
+            *(self._list_server_tools(server) for server in self.servers),
+            return_exceptions=True,
+        )
+        tools = []
+        for server, result in zip(self.servers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to list tools of MCP server {server}: {result}")
+            else:
+                tools.extend(result)
+        logger.info(f"Listed {len(tools)} tools from {len(self.servers)} MCP server(s)")
+        return tools
+
+    async def _call_tool(self, name: str, arguments: dict[str, Any] | None) -> dict[str, Any]:
         try:
-            asyncio.get_running_loop()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, func())
-                return future.result()
-        except RuntimeError:
-            return asyncio.run(func())
+            server, tool_name = self._route(name)
+        except ValueError as e:
+            logger.error(str(e))
+            return {"result": str(e)}
+
+        hit, result = self.cache.get(server, tool_name, arguments)
+        if hit:
+            logger.info(f"Using cached result of tool {name}")
+            return result
+        if self.cache.replay:
+            logger.error(f"No recorded result of tool {name} for arguments {arguments}")
+            return {"result": f"No recorded result of tool {name}"}
+
+        async def call_tool(client: Client) -> list[dict[str, Any]]:
+            result_content = await client.call_tool(tool_name, arguments, timeout=self.timeout)
+            # newer fastmcp versions wrap the content list in a CallToolResult
+            result_content = getattr(result_content, "content", result_content)
+            result = [t.model_dump() for t in result_content]
+            if not result:
+                raise ValueError(f"Empty result from tool {name}")
+            return result
+
+        try:
+            result = await self._with_retries(server, f"call tool {name}", call_tool)
+            self.cache.put(server, tool_name, arguments, result)
+            return result
+        except ToolError as e:
+            logger.error(f"Tool {name} failed: {e}")
+            return {"result": str(e)}
+        except RuntimeError as e:
+            logger.error(str(e))
+            return {"result": str(e)}
+
+    # -- public API ---------------------------------------------------------------
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        if not self.servers:
+            return []
+        return await asyncio.wrap_future(self._submit(self._list_tools()))
 
     def list_tools_sync(self) -> list[dict[str, Any]]:
-        with client_lock:
-            if self.tools is not None:
-                return self.tools
-            self.tools = self._run_async_func(self.list_tools)
+        with self._tools_lock:
+            if self.tools is None:
+                self.tools = self._submit(self._list_tools()).result() if self.servers else []
             return self.tools
 
     async def call_tool(
@@ -122,46 +305,29 @@ class SyncMCPClient:
         name: str,
         arguments: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        last_exception = None
-        delay = self.retry_delay
-
-        for attempt in range(self.max_retries):
-            try:
-                if self.client:
-                    async with self.client:
-                        result_content = await self.client.call_tool(
-                            name, arguments, timeout=self.timeout
-                        )
-                        result = [t.model_dump() for t in result_content]
-                        if not result or len(result) == 0:
-                            raise ValueError(f"Empty result from tool {name}")
-                        logger.info(f"Successfully called tool {name} on attempt {attempt + 1}")
-                        return result
-                else:
-                    raise ValueError("No client configured")
-
-            except Exception as e:
-                last_exception = e
-                logger.warning(
-                    f"Failed to call tool {name} (attempt {attempt + 1}/{self.max_retries}): {e}"
-                )
-                if attempt < self.max_retries - 1:
-                    logger.info(f"Retrying in {delay} seconds...")
-                    await asyncio.sleep(delay)
-                    delay *= self.retry_backoff
-        error_msg = (
-            f"Failed to call tool {name} after {self.max_retries} attempts: {last_exception}"
-        )
-        logger.error(error_msg)
-        return {"result": error_msg}
+        if not self.servers:
+            return {"result": "No client configured"}
+        return await asyncio.wrap_future(self._submit(self._call_tool(name, arguments)))
 
     def call_tool_sync(
         self,
         name: str,
         arguments: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        with client_lock:
-            return self._run_async_func(lambda: self.call_tool(name, arguments))
+        if not self.servers:
+            return {"result": "No client configured"}
+        return self._submit(self._call_tool(name, arguments)).result()
+
+    def close(self) -> None:
+        """Close all sessions."""
+        logger.info(f"MCP result cache: {self.cache.stats()}")
+
+        async def close_all():
+            for server, client in list(self._clients.items()):
+                await self._drop_session(server, client)
+
+        if self._clients:
+            self._submit(close_all()).result()
 
 
 def init_mcp_clients() -> SyncMCPClient:
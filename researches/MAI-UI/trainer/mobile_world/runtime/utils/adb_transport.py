@@ -0,0 +1,407 @@
+"""Pluggable ADB transports used by AndroidController.
+
+`execute_adb` forks an `adb` client (through `/bin/sh`) for every command. The
+socket transport instead talks to the adb server directly over its smart-socket
+protocol and keeps a small pool of long-lived `shell,v2` sessions per device,
+so simple `shell` commands (tap, swipe, keyevent, getprop...) cost one framed
+write/read on an already open connection. Binary `exec-out` commands such as
+`screencap -p` use a one-shot `exec:` service on a fresh socket.
+
+The subprocess transport keeps the original `execute_adb` behaviour and is used
+as the fallback whenever the adb server cannot be reached.
+
+Select the transport with the `ADB_TRANSPORT` environment variable
+(`socket` or `subprocess`, default `socket`). The adb server address follows the
+standard `ANDROID_ADB_SERVER_ADDRESS` / `ANDROID_ADB_SERVER_PORT` variables.
+"""
+
+import os
+import select
+import socket
+import struct
+import subprocess
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+
+from loguru import logger
+
+from mobile_world.runtime.utils.helpers import AdbResponse, execute_adb
+
+ADB_SERVER_HOST = os.getenv("ANDROID_ADB_SERVER_ADDRESS", "127.0.0.1")
+ADB_SERVER_PORT = int(os.getenv("ANDROID_ADB_SERVER_PORT", "5037"))
+ADB_TRANSPORT = os.getenv("ADB_TRANSPORT", "socket")
+
+# shell protocol v2 packet ids, see adb/shell_protocol.h
+SHELL_ID_STDIN = 0
+SHELL_ID_STDOUT = 1
+SHELL_ID_STDERR = 2
+SHELL_ID_EXIT = 3
+SHELL_ID_CLOSE_STDIN = 4
+
+
+class AdbTransportError(RuntimeError):
+    """Raised when the adb server rejects a request or the connection breaks."""
+
+
+class AdbTransport(ABC):
+    """Executes device-side commands for a single adb serial."""
+
+    name = "base"
+
+    def __init__(self, device: str):
+        self.device = device
+
+    @abstractmethod
+    def shell(self, command: str, output: bool = True) -> AdbResponse:
+        """Run `command` with the device shell, like `adb -s <device> shell <command>`."""
+
+    @abstractmethod
+    def exec_out(self, command: str) -> bytes:
+        """Run `command` and return its raw stdout, like `adb -s <device> exec-out <command>`.
+
+        Raises:
+            AdbTransportError: If the command could not be executed
+        """
+
+    def close(self) -> None:
+        """Release any connection held by the transport."""
+
+    def _command_str(self, command: str) -> str:
+        return f"adb -s {self.device} shell {command}"
+
+
+class SubprocessAdbTransport(AdbTransport):
+    """Transport that forks an adb client per command through `execute_adb`."""
+
+    name = "subprocess"
+
+    def shell(self, command: str, output: bool = True) -> AdbResponse:
+        return execute_adb(self._command_str(command), output=output)
+
+    def exec_out(self, command: str) -> bytes:
+        adb_command = f"adb -s {self.device} exec-out {command}"
+        result = subprocess.run(adb_command, shell=True, capture_output=True)
+        if result.returncode != 0:
+            raise AdbTransportError(
+                f"{adb_command} failed: {result.stderr.decode('utf-8', errors='replace')}"
+            )
+        return result.stdout
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise AdbTransportError("adb connection closed unexpectedly")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _send_request(sock: socket.socket, request: str) -> None:
+    """Send a smart-socket request and wait for OKAY."""
+    payload = request.encode("utf-8")
+    sock.sendall(b"%04x" % len(payload) + payload)
+    status = _recv_exact(sock, 4)
+    if status == b"OKAY":
+        return
+    if status == b"FAIL":
+        length = int(_recv_exact(sock, 4), 16)
+        message = _recv_exact(sock, length).decode("utf-8", errors="replace")
+        raise AdbTransportError(f"adb server refused '{request}': {message}")
+    raise AdbTransportError(f"unexpected adb server status {status!r} for '{request}'")
+
+
+def _read_packet(sock: socket.socket) -> tuple[int, bytes]:
+    packet_id, length = struct.unpack("<BI", _recv_exact(sock, 5))
+    return packet_id, _recv_exact(sock, length) if length else b""
+
+
+def _write_packet(sock: socket.socket, packet_id: int, data: bytes) -> None:
+    sock.sendall(struct.pack("<BI", packet_id, len(data)) + data)
+
+
+class _ShellSession:
+    """A long-lived interactive `shell,v2,raw:` session with framed commands.
+
+    Each command runs in a subshell with stdin from /dev/null, so it cannot read
+    the rest of the script, and is followed by a `printf` of a unique marker
+    carrying `$?`; the session reads stdout packets until that marker shows up.
+    `sent` tells whether the last command was fully written, and so may have run.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._pending = b""
+        self.created_at = time.time()
+        self.sent = False
+
+    def is_alive(self) -> bool:
+        """False if the peer closed (or wrote to) the session while it was idle."""
+        try:
+            readable, _, _ = select.select([self.sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def run(self, command: str) -> tuple[int, bytes, bytes]:
+        marker = f"__MW_END_{uuid.uuid4().hex}__"
+        # the newline before ")" keeps a trailing comment from swallowing it
+        script = f"( {command}\n) </dev/null\nprintf '\\n{marker}:%s\\n' \"$?\"\n"
+        self.sent = False
+        _write_packet(self.sock, SHELL_ID_STDIN, script.encode("utf-8"))
+        self.sent = True
+
+        stdout = bytearray(self._pending)
+        stderr = bytearray()
+        needle = f"\n{marker}:".encode()
+        while True:
+            idx = stdout.find(needle)
+            if idx >= 0:
+                end = stdout.find(b"\n", idx + len(needle))
+                if end >= 0:
+                    exit_code = int(stdout[idx + len(needle) : end] or b"0")
+                    self._pending = bytes(stdout[end + 1 :])
+                    return exit_code, bytes(stdout[:idx]), bytes(stderr)
+            packet_id, data = _read_packet(self.sock)
+            if packet_id == SHELL_ID_STDOUT:
+                stdout.extend(data)
+            elif packet_id == SHELL_ID_STDERR:
+                stderr.extend(data)
+            elif packet_id == SHELL_ID_EXIT:
+                raise AdbTransportError("device shell exited")
+
+    def close(self) -> None:
+        try:
+            _write_packet(self.sock, SHELL_ID_CLOSE_STDIN, b"")
+        except OSError:
+            pass
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class SocketAdbTransport(AdbTransport):
+    """Transport speaking the adb server protocol directly, with pooled shell sessions.
+
+    Args:
+        device: adb serial of the target device
+        host: adb server host
+        port: adb server port
+        pool_size: maximum number of concurrent long-lived shell sessions
+        timeout: socket timeout in seconds for a single command
+    """
+
+    name = "socket"
+
+    def __init__(
+        self,
+        device: str,
+        host: str = ADB_SERVER_HOST,
+        port: int = ADB_SERVER_PORT,
+        pool_size: int = 2,
+        timeout: float = 60.0,
+    ):
+        super().__init__(device)
+        self.host = host
+        self.port = port
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._idle: deque[_ShellSession] = deque()
+        self._open_sessions = 0
+        self._cond = threading.Condition()
+        self._fallback = SubprocessAdbTransport(device)
+        self._fallback_logged = False
+
+    def _connect(self) -> socket.socket:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            _send_request(sock, f"host:transport:{self.device}")
+        except Exception:
+            sock.close()
+            raise
+        return sock
+
+    def _acquire_session(self) -> _ShellSession:
+        with self._cond:
+            while True:
+                while not self._idle and self._open_sessions >= self.pool_size:
+                    self._cond.wait()
+                if not self._idle:
+                    break
+                session = self._idle.pop()
+                if session.is_alive():
+                    return session
+                # closed while idle (device or adb server restart), open a new one
+                self._open_sessions -= 1
+                session.close()
+            self._open_sessions += 1
+        try:
+            sock = self._connect()
+            _send_request(sock, "shell,v2,raw:")
+            return _ShellSession(sock)
+        except Exception:
+            with self._cond:
+                self._open_sessions -= 1
+                self._cond.notify()
+            raise
+
+    def _release_session(self, session: _ShellSession, broken: bool = False) -> None:
+        with self._cond:
+            if broken:
+                self._open_sessions -= 1
+                session.close()
+            else:
+                self._idle.append(session)
+            self._cond.notify()
+
+    def _run_oneshot(self, command: str) -> tuple[int, bytes, bytes]:
+        """Run a command on a fresh `shell,v2` socket."""
+        sock = self._connect()
+        try:
+            _send_request(sock, f"shell,v2,raw:{command}")
+            stdout, stderr = bytearray(), bytearray()
+            while True:
+                packet_id, data = _read_packet(sock)
+                if packet_id == SHELL_ID_STDOUT:
+                    stdout.extend(data)
+                elif packet_id == SHELL_ID_STDERR:
+                    stderr.extend(data)
+                elif packet_id == SHELL_ID_EXIT:
+                    return (data[0] if data else 0), bytes(stdout), bytes(stderr)
+        finally:
+            sock.close()
+
+    def _use_fallback(self, reason: Exception) -> bool:
+        """Return True when the adb server itself is unreachable."""
+        if not isinstance(reason, ConnectionRefusedError | FileNotFoundError | socket.gaierror):
+            return False
+        if not self._fallback_logged:
+            logger.warning(
+                f"adb server at {self.host}:{self.port} unreachable ({reason}), "
+                f"falling back to subprocess transport for {self.device}"
+            )
+            self._fallback_logged = True
+        return True
+
+    def shell(self, command: str, output: bool = True) -> AdbResponse:
+        adb_command = self._command_str(command)
+        try:
+            session = self._acquire_session()
+        except AdbTransportError as e:
+            # e.g. "device 'emulator-5554' not found"
+            if output:
+                logger.error(f"Command execution failed: {adb_command}")
+                logger.error(str(e))
+            return AdbResponse(success=False, error=str(e), return_code=1, command=adb_command)
+        except OSError as e:
+            if self._use_fallback(e):
+                return self._fallback.shell(command, output=output)
+            return AdbResponse(success=False, error=str(e), return_code=1, command=adb_command)
+
+        try:
+            exit_code, stdout, stderr = session.run(command)
+            self._release_session(session)
+        except TimeoutError as e:
+            # the command hung (or its quoting swallowed the marker); the session's
+            # shell is in an unknown state, drop it and do not run the command again
+            self._release_session(session, broken=True)
+            if output:
+                logger.error(f"Command execution timed out: {adb_command}")
+            return AdbResponse(success=False, error=str(e), return_code=1, command=adb_command)
+        except (OSError, AdbTransportError) as e:
+            # the long-lived session went stale (device restart, adb server restart...)
+            self._release_session(session, broken=True)
+            if session.sent:
+                # the command may have run already; running taps, text input or
+                # inserts again would repeat them, so report the failure instead
+                if output:
+                    logger.error(f"Command execution failed: {adb_command}")
+                    logger.error(f"Shell session broken after sending the command: {e}")
+                return AdbResponse(success=False, error=str(e), return_code=1, command=adb_command)
+            # nothing reached the device, retry once on a one-shot connection
+            logger.debug(f"Shell session for {self.device} broken ({e}), retrying one-shot")
+            try:
+                exit_code, stdout, stderr = self._run_oneshot(command)
+            except (OSError, AdbTransportError) as retry_error:
+                if output:
+                    logger.error(f"Command execution failed: {adb_command}")
+                    logger.error(str(retry_error))
+                return AdbResponse(
+                    success=False, error=str(retry_error), return_code=1, command=adb_command
+                )
+
+        stdout_str = stdout.decode("utf-8", errors="replace")
+        stderr_str = stderr.decode("utf-8", errors="replace")
+        if exit_code == 0:
+            return AdbResponse(
+                success=True, output=stdout_str.strip(), return_code=0, command=adb_command
+            )
+        if output:
+            logger.error(f"Command execution failed: {adb_command}")
+            logger.error(stderr_str)
+        return AdbResponse(
+            success=False,
+            output=stdout_str.strip(),
+            error=stderr_str or "Command execution failed",
+            return_code=exit_code,
+            command=adb_command,
+        )
+
+    def exec_out(self, command: str) -> bytes:
+        try:
+            sock = self._connect()
+        except OSError as e:
+            if self._use_fallback(e):
+                return self._fallback.exec_out(command)
+            raise AdbTransportError(str(e)) from e
+        try:
+            _send_request(sock, f"exec:{command}")
+            return _recv_all(sock)
+        except OSError as e:
+            raise AdbTransportError(str(e)) from e
+        finally:
+            sock.close()
+
+    def close(self) -> None:
+        with self._cond:
+            while self._idle:
+                self._idle.pop().close()
+                self._open_sessions -= 1
+            self._cond.notify_all()
+
+
+TRANSPORTS: dict[str, type[AdbTransport]] = {
+    SubprocessAdbTransport.name: SubprocessAdbTransport,
+    SocketAdbTransport.name: SocketAdbTransport,
+}
+
+
+def create_adb_transport(device: str, transport: str | None = None) -> AdbTransport:
+    """Create the configured ADB transport for `device`.
+
+    Args:
+        device: adb serial
+        transport: transport name, defaults to the `ADB_TRANSPORT` environment variable
+
+    Returns:
+        AdbTransport instance
+    """
+    transport = transport or ADB_TRANSPORT
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown adb transport: {transport}. Available: {list(TRANSPORTS)}")
+    return TRANSPORTS[transport](device)
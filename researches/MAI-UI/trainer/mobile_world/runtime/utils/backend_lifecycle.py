@@ -0,0 +1,68 @@
+"""In-process bookkeeping of the app backends (Mastodon, Mattermost).
+
+The app helpers record here whether their compose stack is up and which backup
+directory its state was last reset to. This lets them skip `docker compose ps` probes
+when the state is already known.
+
+The record only covers changes made through the app helpers in this process; a state
+of `None` means unknown and callers fall back to probing docker.
+"""
+
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class BackendState:
+    """Last known state of one backend.
+
+    Attributes:
+        running: whether the stack is up, None if unknown
+        snapshot: backup directory the state was last reset to
+    """
+
+    running: bool | None = None
+    snapshot: str | None = None
+
+
+class BackendLifecycle:
+    """Thread-safe registry of `BackendState` per backend name."""
+
+    def __init__(self):
+        self._states: dict[str, BackendState] = {}
+        self._lock = threading.Lock()
+
+    def state(self, name: str) -> BackendState:
+        with self._lock:
+            state = self._states.get(name, BackendState())
+            return BackendState(state.running, state.snapshot)
+
+    def mark_running(self, name: str, snapshot: str | None) -> None:
+        """Record that the backend is up with a fresh state from `snapshot`."""
+        with self._lock:
+            self._states[name] = BackendState(True, snapshot)
+
+    def mark_stopped(self, name: str) -> None:
+        with self._lock:
+            self._states[name] = BackendState(False, None)
+
+    def mark_unknown(self, name: str) -> None:
+        """Forget the state, e.g. after an operation on the backend failed."""
+        with self._lock:
+            self._states.pop(name, None)
+
+    def is_running(self, name: str) -> bool:
+        return self.state(name).running is True
+
+    def is_stopped(self, name: str) -> bool:
+        return self.state(name).running is False
+
+    def summary(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                name: {"running": s.running, "snapshot": s.snapshot}
+                for name, s in self._states.items()
+            }
+
+
+lifecycle = BackendLifecycle()
@@ -0,0 +1,142 @@
+"""Warm state reset helpers for the app backends (Mastodon, Mattermost).
+
+Instead of `docker compose down`, copying the whole backup tree and `up -d` again,
+a running backend is reset by recreating its database from a Postgres template
+database (`CREATE DATABASE ... TEMPLATE ...`, a file-level copy inside the server)
+and restoring bind-mounted data directories from the backup with copy-on-write
+copies where the filesystem supports them.
+"""
+
+import os
+import shutil
+import subprocess
+import time
+
+import psycopg2
+from loguru import logger
+from psycopg2 import sql
+
+MAINTENANCE_DATABASE = "postgres"
+
+
+def _connect_maintenance(**conn_kwargs) -> psycopg2.extensions.connection:
+    """Connect to the maintenance database, where databases can be dropped and created."""
+    connection = psycopg2.connect(database=MAINTENANCE_DATABASE, **conn_kwargs)
+    connection.autocommit = True
+    return connection
+
+
+def wait_for_postgres(timeout: float = 60.0, interval: float = 0.5, **conn_kwargs) -> bool:
+    """Poll until the Postgres server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _connect_maintenance(**conn_kwargs).close()
+            return True
+        except psycopg2.OperationalError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
+
+def database_exists(database: str, **conn_kwargs) -> bool:
+    connection = _connect_maintenance(**conn_kwargs)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (database,))
+            return cursor.fetchone() is not None
+    finally:
+        connection.close()
+
+
+def _terminate_connections(cursor, database: str) -> None:
+    cursor.execute(
+        "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+        "WHERE datname = %s AND pid <> pg_backend_pid()",
+        (database,),
+    )
+
+
+def _drop_database(cursor, database: str) -> None:
+    try:
+        # Postgres 13+: terminates remaining sessions atomically with the drop
+        cursor.execute(
+            sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(database))
+        )
+    except psycopg2.errors.SyntaxError:
+        _terminate_connections(cursor, database)
+        cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(database)))
+
+
+def _copy_database(source: str, target: str, retries: int = 5, **conn_kwargs) -> None:
+    """(Re)create `target` as a copy of `source`; `source` must have no other sessions."""
+    connection = _connect_maintenance(**conn_kwargs)
+    try:
+        with connection.cursor() as cursor:
+            _drop_database(cursor, target)
+            for attempt in range(retries):
+                # clients reconnecting to the source block the copy, so kick them and retry
+                _terminate_connections(cursor, source)
+                try:
+                    cursor.execute(
+                        sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+                            sql.Identifier(target), sql.Identifier(source)
+                        )
+                    )
+                    return
+                except psycopg2.errors.ObjectInUse:
+                    if attempt == retries - 1:
+                        raise
+                    time.sleep(0.2)
+    finally:
+        connection.close()
+
+
+def snapshot_database(database: str, template: str, **conn_kwargs) -> float:
+    """Save the current state of `database` as the template database `template`.
+
+    Returns:
+        seconds taken
+    """
+    start = time.perf_counter()
+    _copy_database(database, template, **conn_kwargs)
+    return time.perf_counter() - start
+
+
+def restore_database(database: str, template: str, **conn_kwargs) -> float:
+    """Replace `database` with a fresh copy of the template database `template`.
+
+    Sessions connected to `database` are terminated; clients reconnect to the new copy.
+
+    Returns:
+        seconds taken
+    """
+    start = time.perf_counter()
+    _copy_database(template, database, **conn_kwargs)
+    return time.perf_counter() - start
+
+
+def restore_directory(src: str, dst: str) -> float:
+    """Make the contents of `dst` match `src`, keeping `dst` itself in place.
+
+    `dst` is usually bind-mounted into a running container, so only its contents are
+    replaced. Files are copied with `--reflink=auto`: copy-on-write clones on
+    filesystems that support it, and plain copies elsewhere. Hardlinks are not used
+    because the app may modify restored files in place, which would also change the
+    backup.
+
+    Returns:
+        seconds taken
+    """
+    start = time.perf_counter()
+    os.makedirs(dst, exist_ok=True)
+    for entry in os.scandir(dst):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+    if os.path.isdir(src):
+        subprocess.run(["cp", "-a", "--reflink=auto", f"{src}/.", dst], check=True)
+    else:
+        logger.warning(f"Backup directory {src} does not exist, left {dst} empty")
+    return time.perf_counter() - start
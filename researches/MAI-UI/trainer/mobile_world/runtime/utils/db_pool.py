@@ -0,0 +1,152 @@
+"""Pooled Postgres connections for the app helper query functions.
+
+The helpers in `app_helpers.mastodon` and `app_helpers.mattermost` open a connection
+per query. `PostgresPool` hands out connections from a `ThreadedConnectionPool`
+instead, wrapped so that the helpers' existing `connection.close()` returns them to
+the pool. Connections idle for longer than `ping_after` seconds are checked with
+`SELECT 1` before reuse, so connections killed by a backend reset or restart are
+replaced transparently.
+"""
+
+import threading
+import time
+
+import psycopg2
+from loguru import logger
+from psycopg2 import pool
+
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = 8
+PING_AFTER = 5.0  # seconds a connection may idle before it is checked on checkout
+
+
+class PooledConnection:
+    """A pooled psycopg2 connection whose `close()` returns it to the pool."""
+
+    def __init__(
+        self,
+        connection: psycopg2.extensions.connection,
+        owner: "PostgresPool | None",
+        source: pool.ThreadedConnectionPool | None = None,
+    ):
+        self._connection = connection
+        self._owner = owner
+        self._source = source
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> int:
+        return 1 if self._connection is None else self._connection.closed
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        if self._owner is None:
+            connection.close()
+        else:
+            self._owner.putconn(connection, self._source)
+
+
+class PostgresPool:
+    """Lazily created, thread-safe connection pool for one database.
+
+    Args:
+        minconn: connections kept open
+        maxconn: maximum pooled connections; checkouts beyond it get a dedicated
+            connection that is closed on release
+        ping_after: idle seconds after which a connection is checked before reuse
+        **conn_kwargs: arguments for `psycopg2.connect`
+    """
+
+    def __init__(
+        self,
+        minconn: int = POOL_MIN_CONNECTIONS,
+        maxconn: int = POOL_MAX_CONNECTIONS,
+        ping_after: float = PING_AFTER,
+        **conn_kwargs,
+    ):
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.ping_after = ping_after
+        self.conn_kwargs = conn_kwargs
+        self._pool: pool.ThreadedConnectionPool | None = None
+        self._last_used: dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> pool.ThreadedConnectionPool:
+        with self._lock:
+            if self._pool is None:
+                self._pool = pool.ThreadedConnectionPool(
+                    self.minconn, self.maxconn, **self.conn_kwargs
+                )
+            return self._pool
+
+    def _is_alive(self, connection: psycopg2.extensions.connection) -> bool:
+        if connection.closed:
+            return False
+        last_used = self._last_used.get(id(connection))
+        if last_used is not None and time.monotonic() - last_used < self.ping_after:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self) -> PooledConnection:
+        """Check out a live connection; release it with `close()`."""
+        connection_pool = self._get_pool()
+        for _ in range(self.maxconn + 1):
+            try:
+                connection = connection_pool.getconn()
+            except pool.PoolError:
+                logger.debug("Connection pool exhausted, opening a dedicated connection")
+                return PooledConnection(psycopg2.connect(**self.conn_kwargs), None)
+            if self._is_alive(connection):
+                return PooledConnection(connection, self, connection_pool)
+            self._last_used.pop(id(connection), None)
+            connection_pool.putconn(connection, close=True)
+        raise psycopg2.OperationalError("No live connection available in the pool")
+
+    def putconn(
+        self, connection: psycopg2.extensions.connection, source: pool.ThreadedConnectionPool
+    ) -> None:
+        """Return a connection to `source`, the pool it was checked out from."""
+        with self._lock:
+            current = self._pool
+        if source is not current or source.closed:
+            # the pool was closed while the connection was checked out
+            connection.close()
+            return
+        if connection.closed:
+            self._last_used.pop(id(connection), None)
+        else:
+            self._last_used[id(connection)] = time.monotonic()
+        # the pool rolls back open transactions and drops broken connections
+        source.putconn(connection, close=bool(connection.closed))
+
+    def reset(self) -> None:
+        """Ping every pooled connection on its next checkout.
+
+        Used after the database was replaced and the server terminated its sessions.
+        """
+        self._last_used.clear()
+
+    def close(self) -> None:
+        """Close all connections of the pool."""
+        with self._lock:
+            connection_pool, self._pool = self._pool, None
+            self._last_used.clear()
+        if connection_pool is not None:
+            connection_pool.closeall()
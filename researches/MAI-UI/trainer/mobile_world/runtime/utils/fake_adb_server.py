@@ -0,0 +1,296 @@
+"""In-process stand-in for the adb server, for benchmarking ADB transports without an emulator.
+
+It implements the subset of the smart-socket protocol used by
+`mobile_world.runtime.utils.adb_transport`: `host:version`,
+`host:transport:<serial>`, one-shot and interactive `shell,v2,raw:` and `exec:`.
+Device-side commands are answered by a responder callable, and every command is
+recorded in `FakeAdbServer.commands`.
+
+Usage:
+    python -m mobile_world.runtime.utils.fake_adb_server --iterations 200
+"""
+
+import argparse
+import os
+import re
+import shutil
+import socketserver
+import struct
+import subprocess
+import threading
+import time
+import zlib
+from collections.abc import Callable
+
+from mobile_world.runtime.utils.adb_transport import (
+    SHELL_ID_CLOSE_STDIN,
+    SHELL_ID_EXIT,
+    SHELL_ID_STDERR,
+    SHELL_ID_STDIN,
+    SHELL_ID_STDOUT,
+    SocketAdbTransport,
+    SubprocessAdbTransport,
+)
+
+Responder = Callable[[str], tuple[bytes, bytes, int]]
+
+# a command framed by `_ShellSession.run`: subshell with stdin from /dev/null, then
+# a printf of the end marker with the command's exit status
+_FRAMED_COMMAND = re.compile(
+    rb"\( (?P<command>.*?)\n\) </dev/null\n"
+    rb"printf '\\n(?P<marker>__MW_END_[0-9a-f]+__):%s\\n' \"\$\?\"\n",
+    re.DOTALL,
+)
+
+
+def _png_bytes(width: int = 4, height: int = 8) -> bytes:
+    """Build a small solid-colour PNG without third-party dependencies."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    raw = b"".join(b"\x00" + b"\xff\xff\xff" * width for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+FAKE_SCREENSHOT = _png_bytes()
+
+
+def default_responder(command: str) -> tuple[bytes, bytes, int]:
+    """Answer the commands AndroidController issues with plausible output."""
+    command = command.strip()
+    if command == "getprop sys.boot_completed":
+        return b"1\n", b"", 0
+    if command == "wm size":
+        return b"Physical size: 1080x2400\n", b"", 0
+    if command.startswith("screencap"):
+        return FAKE_SCREENSHOT, b"", 0
+    if command.startswith("false"):
+        return b"", b"", 1
+    return b"", b"", 0
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "_ThreadingServer"
+
+    def _recv_exact(self, size: int) -> bytes:
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = self.request.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("client closed")
+            buf.extend(chunk)
+        return bytes(buf)
+
+    def _read_request(self) -> str:
+        length = int(self._recv_exact(4), 16)
+        return self._recv_exact(length).decode("utf-8")
+
+    def _fail(self, message: str) -> None:
+        payload = message.encode("utf-8")
+        self.request.sendall(b"FAIL" + b"%04x" % len(payload) + payload)
+
+    def _packet(self, packet_id: int, data: bytes) -> None:
+        self.request.sendall(struct.pack("<BI", packet_id, len(data)) + data)
+
+    def _run(self, command: str) -> tuple[bytes, bytes, int]:
+        self.server.owner.commands.append(command)
+        return self.server.owner.responder(command)
+
+    def handle(self) -> None:
+        try:
+            request = self._read_request()
+            if request == "host:version":
+                self.request.sendall(b"OKAY0004" + b"%04x" % 41)
+                return
+            if not request.startswith("host:transport:"):
+                self._fail(f"unsupported request {request}")
+                return
+            serial = request.split(":", 2)[2]
+            if serial not in self.server.owner.devices:
+                self._fail(f"device '{serial}' not found")
+                return
+            self.request.sendall(b"OKAY")
+
+            service = self._read_request()
+            if service.startswith("exec:"):
+                self.request.sendall(b"OKAY")
+                stdout, _, _ = self._run(service[len("exec:") :])
+                self.request.sendall(stdout)
+            elif service.startswith("shell,v2,raw:"):
+                self.request.sendall(b"OKAY")
+                command = service[len("shell,v2,raw:") :]
+                if command:
+                    stdout, stderr, code = self._run(command)
+                    self._packet(SHELL_ID_STDOUT, stdout)
+                    if stderr:
+                        self._packet(SHELL_ID_STDERR, stderr)
+                    self._packet(SHELL_ID_EXIT, bytes([code & 0xFF]))
+                else:
+                    self._interactive()
+            else:
+                self._fail(f"unsupported service {service}")
+        except ConnectionError:
+            pass
+
+    def _interactive(self) -> None:
+        """Execute the commands received as stdin packets.
+
+        Commands framed by `_ShellSession.run` are unwrapped and answered with their
+        end marker and exit status; other input runs line by line.
+        """
+        pending = b""
+        last_code = 0
+        while True:
+            packet_id, length = struct.unpack("<BI", self._recv_exact(5))
+            data = self._recv_exact(length) if length else b""
+            if packet_id == SHELL_ID_CLOSE_STDIN:
+                self._packet(SHELL_ID_EXIT, bytes([last_code & 0xFF]))
+                return
+            if packet_id != SHELL_ID_STDIN:
+                continue
+            pending += data
+            while True:
+                match = _FRAMED_COMMAND.match(pending)
+                if match:
+                    pending = pending[match.end() :]
+                    last_code = self._answer(match.group("command").decode("utf-8"))
+                    marker = match.group("marker").decode()
+                    self._packet(SHELL_ID_STDOUT, f"\n{marker}:{last_code}\n".encode())
+                elif pending.startswith(b"( ") or b"\n" not in pending:
+                    break  # the rest of the frame or line is still to come
+                else:
+                    line, pending = pending.split(b"\n", 1)
+                    last_code = self._answer(line.decode("utf-8"))
+
+    def _answer(self, command: str) -> int:
+        """Run `command`, send its output and return its exit status."""
+        stdout, stderr, code = self._run(command)
+        if stdout:
+            self._packet(SHELL_ID_STDOUT, stdout)
+        if stderr:
+            self._packet(SHELL_ID_STDERR, stderr)
+        return code
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    owner: "FakeAdbServer"
+
+
+class FakeAdbServer:
+    """Threaded fake adb server bound to localhost.
+
+    Args:
+        devices: serials reported as connected
+        responder: callable mapping a device shell command to (stdout, stderr, exit_code)
+        latency: artificial delay in seconds added to every device command
+        port: TCP port to bind, 0 picks a free port
+    """
+
+    def __init__(
+        self,
+        devices: tuple[str, ...] = ("emulator-5554",),
+        responder: Responder = default_responder,
+        latency: float = 0.0,
+        port: int = 0,
+    ):
+        self.devices = set(devices)
+        self.latency = latency
+        self.commands: list[str] = []
+        self._responder = responder
+        self._server = _ThreadingServer(("127.0.0.1", port), _Handler)
+        self._server.owner = self
+        self._thread: threading.Thread | None = None
+
+    def responder(self, command: str) -> tuple[bytes, bytes, int]:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._responder(command)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> "FakeAdbServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeAdbServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def benchmark(iterations: int = 200, device: str = "emulator-5554") -> dict[str, float]:
+    """Measure mean per-command latency of each transport against the fake server.
+
+    Returns:
+        dict mapping transport mode to mean latency in milliseconds
+    """
+    results: dict[str, float] = {}
+    with FakeAdbServer(devices=(device,)) as server:
+        transport = SocketAdbTransport(device, port=server.port)
+        start = time.perf_counter()
+        for i in range(iterations):
+            transport.shell(f"input tap {i} {i}")
+        results["socket_session"] = (time.perf_counter() - start) / iterations * 1000
+
+        start = time.perf_counter()
+        for i in range(iterations):
+            transport._run_oneshot(f"input tap {i} {i}")
+        results["socket_oneshot"] = (time.perf_counter() - start) / iterations * 1000
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            transport.exec_out("screencap -p")
+        results["socket_exec_out"] = (time.perf_counter() - start) / iterations * 1000
+        transport.close()
+
+        # the subprocess transport needs a real adb client pointed at the fake server;
+        # without one, a bare `sh -c true` fork is reported as its lower bound
+        if shutil.which("adb"):
+            previous_port = os.environ.get("ANDROID_ADB_SERVER_PORT")
+            os.environ["ANDROID_ADB_SERVER_PORT"] = str(server.port)
+            try:
+                fallback = SubprocessAdbTransport(device)
+                start = time.perf_counter()
+                for i in range(iterations):
+                    fallback.shell(f"input tap {i} {i}")
+                results["subprocess"] = (time.perf_counter() - start) / iterations * 1000
+            finally:
+                if previous_port is None:
+                    os.environ.pop("ANDROID_ADB_SERVER_PORT")
+                else:
+                    os.environ["ANDROID_ADB_SERVER_PORT"] = previous_port
+        else:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                subprocess.run("true", shell=True, env=os.environ.copy())
+            results["fork_lower_bound"] = (time.perf_counter() - start) / iterations * 1000
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ADB transports on a fake adb server")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    for mode, latency_ms in benchmark(args.iterations).items():
+        print(f"{mode:>16}: {latency_ms:.3f} ms/command")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Cached device health with a background heartbeat.
+
+`DeviceHealthMonitor` probes `AndroidController.check_health` on a daemon thread and
+keeps the latest result with its timestamp and latency. Request handlers read the
+cache and only probe synchronously when it is stale, unhealthy, or was invalidated
+after an adb call failed.
+"""
+
+import os
+import threading
+import time
+from typing import Any
+
+from loguru import logger
+
+from mobile_world.runtime.controller import AndroidController
+
+HEARTBEAT_INTERVAL = float(os.getenv("HEALTH_HEARTBEAT_INTERVAL", "5.0"))
+HEALTH_MAX_AGE = float(os.getenv("HEALTH_MAX_AGE", "15.0"))
+
+
+class DeviceHealthMonitor:
+    """Background heartbeat and health cache for one device.
+
+    Args:
+        controller: controller of the monitored device
+        interval: seconds between heartbeat probes
+        max_age: age in seconds after which a cached result is considered stale
+    """
+
+    def __init__(
+        self,
+        controller: AndroidController,
+        interval: float = HEARTBEAT_INTERVAL,
+        max_age: float = HEALTH_MAX_AGE,
+    ):
+        self.controller = controller
+        self.interval = interval
+        self.max_age = max_age
+        self.healthy: bool | None = None
+        self.last_check: float | None = None  # time.monotonic() of the last probe
+        self.last_latency: float | None = None
+        self._last_start: float | None = None  # time.monotonic() the last probe started
+        self.checks = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def device(self) -> str:
+        return self.controller.device
+
+    def start(self) -> "DeviceHealthMonitor":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"health-{self.device}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.probe()
+            self._stop.wait(self.interval)
+
+    def probe(self, try_times: int = 0) -> bool:
+        """Run a health check now and update the cache.
+
+        Probes do not overlap: a caller that waited for another caller's probe reuses its
+        result if that probe started after this call.
+        """
+        requested = time.monotonic()
+        with self._probe_lock:
+            with self._lock:
+                if self.last_check is not None and self._last_start >= requested:
+                    return self.healthy
+            start = time.monotonic()
+            healthy = self.controller.check_health(try_times=try_times)
+            end = time.monotonic()
+            with self._lock:
+                if self.healthy and not healthy:
+                    logger.warning(f"[HEALTH] Device {self.device} became unhealthy")
+                self.healthy = healthy
+                self.last_check = end
+                self.last_latency = end - start
+                self._last_start = start
+                self.checks += 1
+                if not healthy:
+                    self.failures += 1
+        return healthy
+
+    def age(self) -> float | None:
+        """Seconds since the last probe, None if never probed."""
+        with self._lock:
+            return None if self.last_check is None else time.monotonic() - self.last_check
+
+    def is_healthy(self, try_times: int = 3) -> bool:
+        """Return the cached state, probing synchronously if it is stale or unhealthy."""
+        age = self.age()
+        if self.healthy and age is not None and age <= self.max_age:
+            return True
+        return self.probe(try_times=try_times)
+
+    def invalidate(self) -> None:
+        """Force the next `is_healthy` call to probe, e.g. after an adb call failed."""
+        with self._lock:
+            self.last_check = None
+
+    def metrics(self) -> dict[str, Any]:
+        age = self.age()
+        with self._lock:
+            return {
+                "healthy": self.healthy,
+                "last_check_age_s": None if age is None else round(age, 3),
+                "probe_latency_ms": (
+                    None if self.last_latency is None else round(self.last_latency * 1000, 3)
+                ),
+                "checks": self.checks,
+                "failures": self.failures,
+            }
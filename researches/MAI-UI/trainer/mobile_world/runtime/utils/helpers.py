@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 from loguru import logger
 from pydantic import BaseModel
 
+from mobile_world.runtime.utils.root_sql import RootSqlError, root_sql_session
+
 
 class AdbResponse(BaseModel):
     """Response model for ADB command execution."""
@@ -172,20 +174,16 @@ def execute_adb(adb_command: str, output: bool = True, root_required=False) -> A
     )
 
 
-def execute_root_sql(db_path: str, sql_query: str) -> str:
+def execute_root_sql(db_path: str, sql_query: str, device: str | None = None) -> str | None:
     """
     Execute a SQL query that requires root access.
-    """
-
-    adb_commands = [
-        f"adb shell \"su 0 sqlite3 {db_path} '{sql_query}'\"",
-        f"adb shell \"su root sqlite3 {db_path} '{sql_query}'\"",
-        f'adb shell su 0 sqlite3 {db_path} "{sql_query}"',
-    ]
 
-    for adb_command in adb_commands:
-        result = execute_adb(adb_command, output=False)
-        if result.success and result.output and "error" not in result.output.lower():
-            return result.output
-
-    return None
+    Returns:
+        sqlite3's `|` separated output, or None if the query failed or returned nothing
+    """
+    try:
+        output = root_sql_session(device).execute_script(db_path, [sql_query], "list")
+    except RootSqlError as e:
+        logger.warning(f"Root SQL on {db_path} failed: {e}")
+        return None
+    return output.strip() or None
@@ -0,0 +1,213 @@
+"""Result cache and record/replay store for MCP tool calls.
+
+Agents call MCP tools during an episode and the `app_helpers.mcp` evaluators call
+the same tools with the same arguments again at scoring time. `MCPResultCache` keeps
+successful results keyed by (server, tool, canonicalized arguments) for `ttl`
+seconds, bounded to `max_entries` in LRU order.
+
+Only the read-only tools in `CACHEABLE_TOOLS` (the ones the evaluators query) are
+served from the cache. A call to any other tool may change the server's state, so it
+drops the cached results of that server and is always sent to the server.
+
+Modes (`MCP_CACHE_MODE`):
+    off:     no caching
+    memory:  TTL cache in memory (default)
+    record:  TTL cache, and every live result plus the tool lists are appended to
+             the JSONL file at `MCP_RECORD_PATH`
+    replay:  answer tool lists and calls from the recording only, without contacting
+             any server, so MCP tasks can be re-scored offline; calls that were not
+             recorded return an error result
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from loguru import logger
+
+MCP_CACHE_MODES = ("off", "memory", "record", "replay")
+MCP_CACHE_MODE = os.getenv("MCP_CACHE_MODE", "memory")
+MCP_CACHE_TTL = float(os.getenv("MCP_CACHE_TTL", "600"))
+MCP_CACHE_SIZE = int(os.getenv("MCP_CACHE_SIZE", "1024"))
+MCP_RECORD_PATH = os.getenv("MCP_RECORD_PATH", "mcp_recordings.jsonl")
+
+# Read-only tools whose results may be reused, as (server, server-local tool name)
+CACHEABLE_TOOLS: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("amap", "maps_around_search"),
+        ("amap", "maps_direction_bicycling"),
+        ("amap", "maps_direction_driving"),
+        ("amap", "maps_direction_walking"),
+        ("amap", "maps_distance"),
+        ("amap", "maps_weather"),
+        ("arXiv", "get_recent_ai_papers"),
+        ("arXiv", "search_arxiv"),
+        ("gitHub", "list_commits"),
+        ("gitHub", "list_issues"),
+        ("gitHub", "search_issues"),
+        ("gitHub", "search_repositories"),
+        ("gitHub", "search_users"),
+        ("stockstar", "miotech_esg_rating"),
+        ("stockstar", "stk_eval_filter_by_div_rate"),
+        ("stockstar", "stk_eval_filter_by_roe_3y"),
+    }
+)
+
+
+def cache_key(server: str, tool: str, arguments: dict[str, Any] | None) -> str:
+    """Canonical key of a call: argument order and whitespace do not matter."""
+    canonical_args = json.dumps(
+        arguments or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return f"{server}\x1f{tool}\x1f{canonical_args}"
+
+
+class MCPResultCache:
+    """TTL and size bounded cache of MCP tool results with optional record/replay.
+
+    Args:
+        mode: one of `MCP_CACHE_MODES`
+        ttl: seconds a live result is reused; recorded results do not expire
+        max_entries: maximum cached results, least recently used are evicted first
+        record_path: JSONL file written in record mode and read in replay mode
+        cacheable_tools: (server, tool) pairs served from the cache outside replay mode
+    """
+
+    def __init__(
+        self,
+        mode: str = MCP_CACHE_MODE,
+        ttl: float = MCP_CACHE_TTL,
+        max_entries: int = MCP_CACHE_SIZE,
+        record_path: str = MCP_RECORD_PATH,
+        cacheable_tools: frozenset[tuple[str, str]] = CACHEABLE_TOOLS,
+    ):
+        if mode not in MCP_CACHE_MODES:
+            raise ValueError(f"Unknown MCP cache mode {mode!r}, expected one of {MCP_CACHE_MODES}")
+        self.mode = mode
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.record_path = record_path
+        self.cacheable_tools = cacheable_tools
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._recorded: dict[str, Any] = {}
+        self._recorded_tools: dict[str, list[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if mode == "replay":
+            self._load_recording()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off" and (self.ttl > 0 or self.mode == "replay")
+
+    @property
+    def replay(self) -> bool:
+        return self.mode == "replay"
+
+    def _load_recording(self) -> None:
+        try:
+            with open(self.record_path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if record["kind"] == "tools":
+                        self._recorded_tools[record["server"]] = record["result"]
+                    else:
+                        key = cache_key(record["server"], record["tool"], record["arguments"])
+                        self._recorded[key] = record["result"]
+        except FileNotFoundError:
+            logger.warning(f"MCP recording {self.record_path} not found, replaying nothing")
+        logger.info(
+            f"Loaded {len(self._recorded)} recorded MCP calls and tool lists of "
+            f"{len(self._recorded_tools)} server(s) from {self.record_path}"
+        )
+
+    def _append_record(self, record: dict[str, Any]) -> None:
+        record["recorded_at"] = time.time()
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            with open(self.record_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def _evict_server(self, server: str) -> None:
+        prefix = f"{server}\x1f"
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def get(self, server: str, tool: str, arguments: dict[str, Any] | None) -> tuple[bool, Any]:
+        """Look up a call, made right before it is sent to the server.
+
+        A call to a tool outside `cacheable_tools` is never a hit and drops the cached
+        results of its server, since it may change what they would return.
+
+        Returns:
+            (hit, result); `result` is a copy the caller may modify
+        """
+        if not self.enabled:
+            return False, None
+        if not self.replay and (server, tool) not in self.cacheable_tools:
+            self._evict_server(server)
+            return False, None
+        key = cache_key(server, tool, arguments)
+        with self._lock:
+            if self.replay:
+                hit = key in self._recorded
+                result = self._recorded.get(key)
+            else:
+                entry = self._entries.get(key)
+                hit = entry is not None and time.monotonic() - entry[0] < self.ttl
+                if hit:
+                    self._entries.move_to_end(key)
+                    result = entry[1]
+                elif entry is not None:
+                    del self._entries[key]
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return (True, copy.deepcopy(result)) if hit else (False, None)
+
+    def put(self, server: str, tool: str, arguments: dict[str, Any] | None, result: Any) -> None:
+        """Store a successful live result."""
+        if self.mode == "record":
+            self._append_record(
+                {
+                    "kind": "call",
+                    "server": server,
+                    "tool": tool,
+                    "arguments": arguments or {},
+                    "result": result,
+                }
+            )
+        if not self.enabled or self.replay or (server, tool) not in self.cacheable_tools:
+            return
+        key = cache_key(server, tool, arguments)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def recorded_tools(self, server: str) -> list[dict[str, Any]] | None:
+        """Tool list of `server` from the recording (replay mode only)."""
+        return copy.deepcopy(self._recorded_tools.get(server))
+
+    def record_tools(self, server: str, tools: list[dict[str, Any]]) -> None:
+        if self.mode == "record":
+            self._append_record({"kind": "tools", "server": server, "result": tools})
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "entries": len(self._recorded) if self.replay else len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -436,6 +436,12 @@ class ScreenshotQuery(BaseModel):
     device: str
     prefix: str | None = None
     return_b64: bool = False
+    image_format: Literal["png", "rgba", "webp", "jpeg"] | None = None  # binary response
+    quality: int = 90
+    save: bool = False
+    stable: bool = False  # wait for the screen to settle before capture
+    stable_frames: int = 3
+    stable_timeout: float = 2.0
 
 
 class XMLQuery(BaseModel):
@@ -452,6 +458,24 @@ class StepRequest(BaseModel):
     action: JSONAction
 
 
+class StepAndObserveRequest(BaseModel):
+    """Request for executing one or more actions and returning the next screenshot."""
+
+    device: str
+    action: JSONAction | None = None
+    actions: list[JSONAction] | None = None  # executed in order, after `action`
+    image_format: Literal["png", "rgba", "webp", "jpeg"] = "png"
+    quality: int = 90
+    stable: bool = True
+    stable_frames: int = 3
+    stable_timeout: float = 2.0
+    stable_interval: float = 0.1
+    stable_min_wait: float = 0.0
+
+    def all_actions(self) -> list[JSONAction]:
+        return ([self.action] if self.action is not None else []) + (self.actions or [])
+
+
 class TaskOperationRequest(BaseModel):
     task_name: str
     req_device: str
@@ -483,6 +507,7 @@ class Observation(BaseModel):
     accessibility_tree: Any = None
     ask_user_response: str | None = None
     tool_call: Any | None = None
+    timings: dict[str, float] | None = None
 
 
 # Environment/Docker Models
@@ -526,6 +551,9 @@ class LaunchResult(BaseModel):
     success: bool = False
     ready: bool = False
     error_message: str | None = None
+    attempts: int = 0
+    launch_seconds: float | None = None  # `docker run` time of the last attempt
+    ready_seconds: float | None = None  # from `docker run` of the last attempt until healthy
 
 
 class PrerequisiteCheckResult(BaseModel):
@@ -0,0 +1,256 @@
+"""Bulk device provisioning for task initialization.
+
+Task setup used to push files one `adb push` at a time, insert seed rows with one
+sqlite3 call each and change settings one command at a time. A `ProvisionManifest`
+collects all of it and `provision` applies it in a few round trips:
+
+- files: one `sha256sum` over all destinations, then the changed files in a single
+  tar stream per destination root, extracted on the device through `adb exec-in`;
+  files whose content already matches are skipped
+- SQL rows: one transaction per database through the root sqlite3 session
+- settings: one `settings put` chain
+
+Media files can be announced to the media scanner in the same batch.
+"""
+
+import hashlib
+import io
+import os
+import posixpath
+import shlex
+import subprocess
+import tarfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from mobile_world.runtime.utils.helpers import execute_adb
+from mobile_world.runtime.utils.root_sql import root_sql_session
+
+PROVISION_TIMEOUT = 300.0
+
+
+@dataclass
+class FileItem:
+    """A local file to place at `remote` on the device."""
+
+    local: str | Path
+    remote: str
+    media_scan: bool = False
+
+
+@dataclass
+class SqlRows:
+    """Rows to insert into `table` of an app database (run as root)."""
+
+    db_path: str
+    table: str
+    rows: list[dict[str, Any]]
+
+
+@dataclass
+class Setting:
+    """An Android setting, like `settings put <namespace> <key> <value>`."""
+
+    namespace: str
+    key: str
+    value: str | int | float
+
+
+@dataclass
+class ProvisionManifest:
+    files: list[FileItem] = field(default_factory=list)
+    sql: list[SqlRows] = field(default_factory=list)
+    settings: list[Setting] = field(default_factory=list)
+
+
+@dataclass
+class ProvisionResult:
+    pushed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    rows_inserted: int = 0
+    settings_applied: int = 0
+    bytes_sent: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    def __bool__(self) -> bool:
+        return self.success
+
+
+def sql_literal(value: Any) -> str:
+    """SQL literal of a Python value, with strings quoted and escaped."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int | float):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def insert_statements(table: str, rows: list[dict[str, Any]]) -> list[str]:
+    return [
+        f"INSERT INTO {table} ({', '.join(row)}) "
+        f"VALUES ({', '.join(sql_literal(value) for value in row.values())})"
+        for row in rows
+    ]
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _adb(device: str | None, *args: str) -> list[str]:
+    return ["adb", *(["-s", device] if device else []), *args]
+
+
+def _remote_hashes(device: str | None, remotes: list[str]) -> dict[str, str]:
+    """sha256 of the destination files that exist on the device."""
+    command = "sha256sum " + " ".join(shlex.quote(r) for r in remotes) + " 2>/dev/null"
+    result = subprocess.run(
+        _adb(device, "shell", command), capture_output=True, text=True, timeout=PROVISION_TIMEOUT
+    )
+    hashes = {}
+    for line in result.stdout.splitlines():
+        digest, _, path = line.partition("  ")
+        if path:
+            hashes[path.strip()] = digest.strip()
+    return hashes
+
+
+def _transfer_groups(items: list[FileItem]) -> dict[str, list[FileItem]]:
+    """Files by the directory their tar stream is extracted in.
+
+    All files share one stream when they have a common directory below `/`; the
+    root itself is avoided since top-level entries like /sdcard are symlinks.
+    """
+    root = posixpath.commonpath([posixpath.dirname(item.remote) for item in items])
+    if root != "/":
+        return {root: items}
+    groups: dict[str, list[FileItem]] = defaultdict(list)
+    for item in items:
+        groups[posixpath.dirname(item.remote)].append(item)
+    return groups
+
+
+def _tar_stream(root: str, items: list[FileItem]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for item in items:
+            tar.add(str(item.local), arcname=posixpath.relpath(item.remote, root), recursive=False)
+    return buffer.getvalue()
+
+
+def _send_files(device: str | None, items: list[FileItem]) -> int:
+    """Extract the files on the device; returns the bytes sent."""
+    sent = 0
+    for root, group in _transfer_groups(items).items():
+        stream = _tar_stream(root, group)
+        command = f"mkdir -p {shlex.quote(root)} && tar -xof - -C {shlex.quote(root)}"
+        result = subprocess.run(
+            _adb(device, "exec-in", command),
+            input=stream,
+            capture_output=True,
+            timeout=PROVISION_TIMEOUT,
+        )
+        if result.returncode == 0:
+            sent += len(stream)
+            continue
+        logger.warning(
+            f"Batched transfer to {root} failed ({result.stderr.decode(errors='replace').strip()}), "
+            "pushing files one by one"
+        )
+        for item in group:
+            push = execute_adb(
+                f"adb {'-s ' + device + ' ' if device else ''}push "
+                f"{shlex.quote(str(item.local))} {shlex.quote(item.remote)}",
+                output=False,
+            )
+            if not push.success:
+                raise RuntimeError(f"Failed to push {item.local} -> {item.remote}: {push.error}")
+            sent += os.path.getsize(item.local)
+    return sent
+
+
+def _device_shell(device: str | None, command: str):
+    return execute_adb(
+        f"adb {'-s ' + device + ' ' if device else ''}shell {shlex.quote(command)}", output=False
+    )
+
+
+def provision(manifest: ProvisionManifest, device: str | None = None) -> ProvisionResult:
+    """Apply a manifest to the device in batched transfers.
+
+    Args:
+        manifest: files, SQL rows and settings to apply
+        device: adb serial, or None for the default device
+
+    Returns:
+        ProvisionResult; `error` is set if a step failed, later steps are not applied
+    """
+    start = time.monotonic()
+    result = ProvisionResult()
+    try:
+        if manifest.files:
+            remote_hashes = _remote_hashes(device, [item.remote for item in manifest.files])
+            changed = []
+            for item in manifest.files:
+                if remote_hashes.get(item.remote) == _sha256(Path(item.local)):
+                    result.skipped.append(item.remote)
+                else:
+                    changed.append(item)
+            if changed:
+                result.bytes_sent = _send_files(device, changed)
+                result.pushed = [item.remote for item in changed]
+
+            scans = [item.remote for item in manifest.files if item.media_scan]
+            if scans:
+                _device_shell(
+                    device,
+                    "; ".join(
+                        "am broadcast -a android.intent.action.MEDIA_SCANNER_SCAN_FILE "
+                        f"-d {shlex.quote('file://' + remote)} >/dev/null"
+                        for remote in scans
+                    ),
+                )
+
+        statements_by_db: dict[str, list[str]] = defaultdict(list)
+        for batch in manifest.sql:
+            statements_by_db[batch.db_path].extend(insert_statements(batch.table, batch.rows))
+        for db_path, statements in statements_by_db.items():
+            root_sql_session(device).execute(db_path, ["BEGIN", *statements, "COMMIT"])
+            result.rows_inserted += len(statements)
+
+        if manifest.settings:
+            command = " && ".join(
+                f"settings put {s.namespace} {shlex.quote(s.key)} {shlex.quote(str(s.value))}"
+                for s in manifest.settings
+            )
+            settings_result = _device_shell(device, command)
+            if not settings_result.success:
+                raise RuntimeError(f"Failed to apply settings: {settings_result.error}")
+            result.settings_applied = len(manifest.settings)
+    except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+        result.error = str(e)
+        logger.error(f"Provisioning failed: {e}")
+
+    result.seconds = time.monotonic() - start
+    logger.info(
+        f"Provisioned {len(result.pushed)} file(s) ({result.bytes_sent} bytes), skipped "
+        f"{len(result.skipped)} unchanged, {result.rows_inserted} row(s), "
+        f"{result.settings_applied} setting(s) in {result.seconds:.2f}s"
+    )
+    return result
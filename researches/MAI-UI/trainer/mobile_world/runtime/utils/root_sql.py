@@ -0,0 +1,229 @@
+"""Root sqlite3 access to app databases on the device.
+
+`execute_adb(..., root_required=True)` checks `whoami` and possibly runs `adb root`
+before every command, and `execute_root_sql` tries several `su` quoting forms in
+turn. `RootSqlSession` establishes root once per device and remembers how: adbd
+itself running as root, or the `su` form that worked. Later statements run
+directly with that form.
+
+The SQL script is piped to a single `sqlite3 -json` invocation on stdin, so
+statements need no shell quoting and several statements cost one adb round trip.
+Each statement's rows come back as a list of dicts. Large reads can instead pull a
+consistent copy of the database (`.backup` on the device) and query it locally.
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import uuid
+
+from loguru import logger
+
+# how a command is run as root: adbd already runs as root, or one of the su forms
+ROOT_FORMS = ("{cmd}", "su 0 {cmd}", "su root {cmd}", "su -c '{cmd}'")
+ROOT_SQL_TIMEOUT = 60.0
+DEVICE_TMP_DIR = "/data/local/tmp"
+
+_STATEMENT_MARKER = "--mobile-world-statement-end--"
+
+
+class RootSqlError(RuntimeError):
+    """Raised when root is unavailable or a SQL script fails."""
+
+
+class RootSqlSession:
+    """Root sqlite3 access to one device.
+
+    Args:
+        device: adb serial, or None for the default device
+        timeout: seconds an adb command may take
+    """
+
+    def __init__(self, device: str | None = None, timeout: float = ROOT_SQL_TIMEOUT):
+        self.device = device
+        self.timeout = timeout
+        self._root_form: str | None = None
+        self._lock = threading.Lock()
+
+    def _adb(self, *args: str) -> list[str]:
+        serial = ["-s", self.device] if self.device else []
+        return ["adb", *serial, *args]
+
+    def _run(
+        self, *args: str, stdin: str | None = None, text: bool = True
+    ) -> subprocess.CompletedProcess:
+        try:
+            return subprocess.run(
+                self._adb(*args),
+                input=stdin,
+                capture_output=True,
+                text=text,
+                timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired as e:
+            raise RootSqlError(f"adb {' '.join(args)} timed out after {self.timeout}s") from e
+
+    def _probe_root_form(self) -> str:
+        probe = self._run("shell", "id -u")
+        if probe.returncode == 0 and probe.stdout.strip() != "0":
+            self._run("root")
+            # adbd restarts after `adb root`
+            self._run("wait-for-device")
+        for form in ROOT_FORMS:
+            probe = self._run("shell", form.format(cmd="id -u"))
+            if probe.returncode == 0 and probe.stdout.strip() == "0":
+                logger.debug(f"Root on {self.device or 'default device'} via {form!r}")
+                return form
+        raise RootSqlError(f"Root access not available on {self.device or 'default device'}")
+
+    def root_form(self) -> str:
+        """The cached way to run a command as root, established on first use."""
+        with self._lock:
+            if self._root_form is None:
+                self._root_form = self._probe_root_form()
+            return self._root_form
+
+    def reset(self) -> None:
+        """Forget the root form, e.g. after the emulator restarted."""
+        with self._lock:
+            self._root_form = None
+
+    def shell(
+        self, command: str, stdin: str | None = None, text: bool = True
+    ) -> subprocess.CompletedProcess:
+        """Run `command` as root.
+
+        If it fails, root is probed again; the command is retried only if root is now
+        obtained differently (e.g. adbd lost root after an emulator restart), so
+        statements that already ran are not repeated.
+
+        Args:
+            command: device shell command
+            stdin: text piped to the command
+            text: False to return the raw stdout bytes (run with `exec-out`)
+
+        Returns:
+            the CompletedProcess of the last attempt
+        """
+        form = self.root_form()
+        result = self._run(
+            "shell" if text else "exec-out", form.format(cmd=command), stdin=stdin, text=text
+        )
+        if result.returncode != 0:
+            self.reset()
+            new_form = self.root_form()
+            if new_form != form:
+                logger.debug(f"Root is now obtained via {new_form!r}, retrying {command!r}")
+                result = self._run(
+                    "shell" if text else "exec-out",
+                    new_form.format(cmd=command),
+                    stdin=stdin,
+                    text=text,
+                )
+        return result
+
+    def execute_script(
+        self, db_path: str, statements: list[str], output_mode: str = "json"
+    ) -> list[list[dict]] | str:
+        """Run several statements in one sqlite3 invocation.
+
+        Args:
+            db_path: database path on the device
+            statements: SQL statements, run in order; execution stops at the first error
+            output_mode: "json" for parsed rows, or a sqlite3 output mode ("list",
+                "csv", ...) for the raw text output
+
+        Returns:
+            rows of each statement (empty for statements without results) in json
+            mode, otherwise the raw output
+
+        Raises:
+            RootSqlError: If root is unavailable or a statement fails
+        """
+        separator = f".print {_STATEMENT_MARKER}\n" if output_mode == "json" else ""
+        script = "".join(_script_line(statement) + separator for statement in statements)
+        result = self.shell(f"sqlite3 -bail -{output_mode} {db_path}", stdin=script)
+        error = result.stderr.strip()
+        if result.returncode != 0 or error.lower().startswith(("error", "parse error")):
+            raise RootSqlError(f"SQL on {db_path} failed: {error or result.stdout.strip()}")
+        if output_mode != "json":
+            return result.stdout
+        chunks = result.stdout.split(_STATEMENT_MARKER)[: len(statements)]
+        return [json.loads(chunk) if chunk.strip() else [] for chunk in chunks]
+
+    def query(self, db_path: str, sql: str, local: bool = False) -> list[dict]:
+        """Rows of one statement as dicts.
+
+        Args:
+            db_path: database path on the device
+            sql: SQL statement
+            local: pull a copy of the database and query it on the host instead
+        """
+        if local:
+            local_path = self.pull(db_path)
+            try:
+                return query_local(local_path, sql)
+            finally:
+                os.unlink(local_path)
+        return self.execute_script(db_path, [sql])[0]
+
+    def execute(self, db_path: str, sql: str | list[str]) -> None:
+        """Run statements that return no rows (INSERT, UPDATE, ...)."""
+        self.execute_script(db_path, [sql] if isinstance(sql, str) else sql)
+
+    def pull(self, db_path: str, local_path: str | None = None) -> str:
+        """Copy a consistent snapshot of a database to the host.
+
+        The copy is made with sqlite3's `.backup` on the device, so pending WAL
+        content is included.
+
+        Returns:
+            path of the local copy
+        """
+        device_copy = f"{DEVICE_TMP_DIR}/{uuid.uuid4().hex}.db"
+        try:
+            self.execute_script(db_path, [f".backup '{device_copy}'"], output_mode="list")
+            result = self.shell(f"cat {device_copy}", text=False)
+            if result.returncode != 0 or not result.stdout:
+                raise RootSqlError(f"Failed to read copy of {db_path}: {result.stderr!r}")
+        finally:
+            self.shell(f"rm -f {device_copy}")
+        if local_path is None:
+            fd, local_path = tempfile.mkstemp(suffix=".db")
+            os.close(fd)
+        with open(local_path, "wb") as f:
+            f.write(result.stdout)
+        return local_path
+
+
+def _script_line(statement: str) -> str:
+    statement = statement.strip()
+    # dot commands (".backup ...") take no terminating semicolon
+    if statement.startswith("."):
+        return statement + "\n"
+    return statement.rstrip(";") + ";\n"
+
+
+def query_local(local_path: str, sql: str) -> list[dict]:
+    """Rows of `sql` on a pulled database copy, as dicts."""
+    connection = sqlite3.connect(local_path)
+    try:
+        connection.row_factory = sqlite3.Row
+        return [dict(row) for row in connection.execute(sql)]
+    finally:
+        connection.close()
+
+
+_sessions: dict[str | None, RootSqlSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def root_sql_session(device: str | None = None) -> RootSqlSession:
+    """The shared root session of `device` (None for the default device)."""
+    with _sessions_lock:
+        if device not in _sessions:
+            _sessions[device] = RootSqlSession(device)
+        return _sessions[device]
@@ -0,0 +1,112 @@
+"""Encoding helpers for the binary `/screenshot` streaming mode.
+
+The server captures the screen into memory with `exec-out screencap` and returns
+the image bytes directly instead of a base64 JSON payload. `png` passes the
+device-encoded PNG through untouched; `rgba`, `webp` and `jpeg` capture the raw
+framebuffer (skipping the on-device PNG encode) and either ship the pixels as-is
+or re-encode them on the host.
+"""
+
+import struct
+from io import BytesIO
+from typing import Literal
+
+from PIL import Image
+
+ScreenshotFormat = Literal["png", "rgba", "webp", "jpeg"]
+
+SCREENSHOT_MEDIA_TYPES: dict[str, str] = {
+    "png": "image/png",
+    "rgba": "application/octet-stream",
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+}
+
+WIDTH_HEADER = "X-Screenshot-Width"
+HEIGHT_HEADER = "X-Screenshot-Height"
+
+# android.graphics.PixelFormat values reported in the raw screencap header
+_PIXEL_FORMAT_RAW_MODES = {1: "RGBA", 2: "RGBX", 5: "BGRA"}
+
+
+def needs_raw_capture(image_format: ScreenshotFormat) -> bool:
+    """Whether `image_format` is produced from the raw framebuffer rather than `screencap -p`."""
+    return image_format != "png"
+
+
+def parse_raw_screencap(data: bytes) -> Image.Image:
+    """Parse the output of `screencap` (without `-p`) into an RGBA image.
+
+    The header is width, height and pixel format as little-endian uint32, followed
+    by a dataspace field on Android 12+.
+    """
+    if len(data) < 12:
+        raise ValueError(f"raw screencap payload too short: {len(data)} bytes")
+    width, height, pixel_format = struct.unpack_from("<III", data)
+    header_size = len(data) - width * height * 4
+    if header_size not in (12, 16):
+        raise ValueError(
+            f"unexpected raw screencap size {len(data)} for {width}x{height} framebuffer"
+        )
+    raw_mode = _PIXEL_FORMAT_RAW_MODES.get(pixel_format)
+    if raw_mode is None:
+        raise ValueError(f"unsupported screencap pixel format: {pixel_format}")
+    return Image.frombuffer("RGBA", (width, height), data[header_size:], "raw", raw_mode, 0, 1)
+
+
+# Differing cells of the 32x32 screen signature still treated as a settled screen
+# (blinking cursors, clock ticks)
+STABLE_SIGNATURE_TOLERANCE = 4
+
+
+def screen_signature(data: bytes, raw: bool = True, size: int = 32) -> bytes:
+    """Low-resolution grayscale signature used to detect when the screen settles.
+
+    The frame is downscaled to `size`x`size` and quantized to 16 gray levels, so
+    encoder noise and sub-pixel differences do not count as changes.
+    """
+    image = parse_raw_screencap(data) if raw else Image.open(BytesIO(data))
+    thumbnail = image.convert("L").resize((size, size), Image.Resampling.BILINEAR)
+    return bytes(value >> 4 for value in thumbnail.tobytes())
+
+
+def encode_screenshot(
+    data: bytes, image_format: ScreenshotFormat, quality: int = 90
+) -> tuple[bytes, dict[str, str]]:
+    """Encode captured screenshot bytes for the binary `/screenshot` response.
+
+    Args:
+        data: `screencap -p` output for `png`, raw `screencap` output otherwise
+        image_format: target format
+        quality: WebP/JPEG quality
+
+    Returns:
+        (body, extra response headers)
+    """
+    if image_format == "png":
+        return data, {}
+
+    image = parse_raw_screencap(data)
+    headers = {WIDTH_HEADER: str(image.width), HEIGHT_HEADER: str(image.height)}
+    if image_format == "rgba":
+        return image.tobytes(), headers
+
+    buffer = BytesIO()
+    if image_format == "webp":
+        image.save(buffer, format="WEBP", quality=quality, method=0)
+    elif image_format == "jpeg":
+        image.convert("RGB").save(buffer, format="JPEG", quality=quality)
+    else:
+        raise ValueError(f"Unsupported screenshot format: {image_format}")
+    return buffer.getvalue(), headers
+
+
+def decode_screenshot(
+    content: bytes, image_format: ScreenshotFormat, headers: dict[str, str] | None = None
+) -> Image.Image:
+    """Decode a binary `/screenshot` response body into a PIL image."""
+    if image_format == "rgba":
+        headers = headers or {}
+        size = (int(headers[WIDTH_HEADER]), int(headers[HEIGHT_HEADER]))
+        return Image.frombytes("RGBA", size, content)
+    return Image.open(BytesIO(content))
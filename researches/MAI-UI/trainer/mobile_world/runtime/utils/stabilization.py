@@ -0,0 +1,86 @@
+"""Screen stabilization: poll frames until consecutive captures match.
+
+Replaces the fixed `step_wait_time` sleep after an action. A frame source is any
+callable; frames are compared through a `key` (e.g. a low-resolution signature of
+a raw `screencap`, see `screenshot.screen_signature`), and the wait ends as soon as
+`stable_frames` consecutive captures match, or when `timeout` elapses.
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class StabilizationResult(Generic[T]):
+    """Outcome of `wait_until_stable`.
+
+    Attributes:
+        frame: the last captured frame
+        waited: seconds spent waiting, including captures
+        frames: number of frames captured
+        stable: whether the screen settled before the timeout
+    """
+
+    frame: T
+    waited: float
+    frames: int
+    stable: bool
+
+
+def frames_match(previous: bytes, current: bytes, tolerance: int = 0) -> bool:
+    """Whether two frame keys differ in at most `tolerance` bytes."""
+    if tolerance <= 0 or len(previous) != len(current):
+        return previous == current
+    return sum(a != b for a, b in zip(previous, current)) <= tolerance
+
+
+def wait_until_stable(
+    capture: Callable[[], T],
+    timeout: float,
+    interval: float = 0.1,
+    stable_frames: int = 2,
+    min_wait: float = 0.0,
+    key: Callable[[T], bytes] | None = None,
+    tolerance: int = 0,
+) -> StabilizationResult[T]:
+    """Capture frames until `stable_frames` consecutive ones are identical.
+
+    Args:
+        capture: returns the current frame
+        timeout: maximum seconds to wait; the latest frame is returned when it elapses
+        interval: delay between captures
+        stable_frames: number of consecutive identical frames that count as settled
+        min_wait: delay before the first capture, so the action has time to start
+            its transition
+        key: maps a frame to the bytes compared between captures, defaults to the frame
+        tolerance: number of differing key bytes still counted as the same frame,
+            e.g. to ignore a blinking cursor
+
+    Returns:
+        StabilizationResult with the last frame and how long it took to settle
+    """
+    key = key or (lambda frame: frame)
+    start = time.perf_counter()
+    deadline = start + timeout
+    if min_wait > 0:
+        time.sleep(min(min_wait, timeout))
+
+    frame = capture()
+    frames = 1
+    last_key = key(frame)
+    streak = 1
+    while streak < stable_frames:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return StabilizationResult(frame, time.perf_counter() - start, frames, False)
+        time.sleep(min(interval, remaining))
+        frame = capture()
+        frames += 1
+        current_key = key(frame)
+        streak = streak + 1 if frames_match(last_key, current_key, tolerance) else 1
+        last_key = current_key
+    return StabilizationResult(frame, time.perf_counter() - start, frames, True)
@@ -0,0 +1,62 @@
+"""Round-trip tests of `SocketAdbTransport` against the in-process fake adb server.
+
+Usage:
+    python -m pytest mobile_world/runtime/utils/test_adb_transport.py
+"""
+
+import pytest
+
+from mobile_world.runtime.utils.adb_transport import SocketAdbTransport
+from mobile_world.runtime.utils.fake_adb_server import FakeAdbServer, default_responder
+
+DEVICE = "emulator-5554"
+
+
+@pytest.fixture
+def server():
+    with FakeAdbServer(devices=(DEVICE,)) as server:
+        yield server
+
+
+@pytest.fixture
+def transport(server):
+    transport = SocketAdbTransport(DEVICE, port=server.port)
+    yield transport
+    transport.close()
+
+
+def test_session_runs_the_unwrapped_command(server, transport):
+    response = transport.shell("getprop sys.boot_completed")
+    assert response.success
+    assert response.output == "1"
+    assert server.commands == ["getprop sys.boot_completed"]
+
+
+def test_session_returns_canned_output(transport):
+    response = transport.shell("wm size")
+    assert response.success
+    assert response.output == "Physical size: 1080x2400"
+
+
+def test_session_reports_exit_status(transport):
+    response = transport.shell("false", output=False)
+    assert not response.success
+    assert response.return_code != 0
+    # the session stays usable after a failing command
+    assert transport.shell("getprop sys.boot_completed").output == "1"
+
+
+def test_command_is_not_repeated_when_the_session_breaks_after_sending():
+    def drop_on_first_tap(command):
+        if command.startswith("input tap") and "input tap 1 1" not in server.commands[:-1]:
+            raise ConnectionError("device went away")
+        return default_responder(command)
+
+    with FakeAdbServer(devices=(DEVICE,), responder=drop_on_first_tap) as server:
+        transport = SocketAdbTransport(DEVICE, port=server.port)
+        response = transport.shell("input tap 1 1", output=False)
+        assert not response.success
+        assert server.commands == ["input tap 1 1"]
+        # the broken session was dropped, the next command opens a new one
+        assert transport.shell("getprop sys.boot_completed").output == "1"
+        transport.close()
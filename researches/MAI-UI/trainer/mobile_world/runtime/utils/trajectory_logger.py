@@ -1,5 +1,6 @@
 import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 
 from loguru import logger
@@ -28,9 +29,16 @@ def extract_drag_coordinates(action):
     return (start_x, start_y, end_x, end_y)
 
 
+def _open_for_marking(image) -> Image.Image:
+    """Return a drawable copy of an in-memory image, or open it from a path."""
+    if isinstance(image, Image.Image):
+        return image.copy()
+    return Image.open(image)
+
+
 # Function to draw points on an image
-def draw_clicks_on_image(image_path, output_path, click_coords):
-    image = Image.open(image_path)
+def draw_clicks_on_image(image, output_path, click_coords):
+    image = _open_for_marking(image)
     draw = ImageDraw.Draw(image)
 
     # Draw each click coordinate as a red circle
@@ -44,8 +52,8 @@ def draw_clicks_on_image(image_path, output_path, click_coords):
 
 
 # Function to draw a drag line on an image
-def draw_drag_on_image(image_path, output_path, drag_coords):
-    image = Image.open(image_path)
+def draw_drag_on_image(image, output_path, drag_coords):
+    image = _open_for_marking(image)
     draw = ImageDraw.Draw(image)
 
     (start_x, start_y, end_x, end_y) = drag_coords
@@ -70,17 +78,107 @@ def draw_drag_on_image(image_path, output_path, drag_coords):
 
 
 LOG_FILE_NAME = "traj.json"
+RECORDS_FILE_NAME = "traj.jsonl"
 SCORE_FILE_NAME = "result.txt"
+TASK_ID = "0"
+
+
+def _append_record(path: str, record: dict) -> None:
+    """Append one JSON line and fsync it, so a crash loses at most the current step."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_records(records_path: str) -> dict:
+    """Fold a `traj.jsonl` record stream into the `traj.json` layout.
+
+    A truncated last line (crash mid-write) is ignored.
+    """
+    log_data: dict = {}
+    with open(records_path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping truncated trajectory record in {records_path}")
+                continue
+            record_type = record.pop("type", None)
+            if record_type == "step":
+                task_id = record.pop("task_id", TASK_ID)
+                tools = record.pop("tools", None)
+                token_usage = record.pop("token_usage", None)
+                if task_id not in log_data:
+                    log_data[task_id] = {"tools": tools, "traj": []}
+                log_data[task_id]["traj"].append(record)
+                log_data[task_id]["token_usage"] = token_usage
+            elif record_type == "token_usage":
+                log_data["token_usage"] = record.get("token_usage")
+    return log_data
+
+
+def load_traj_data(task_dir: str) -> dict:
+    """Load trajectory data for a task folder.
+
+    Prefers the append-only `traj.jsonl` when it is newer than the compacted
+    `traj.json` (e.g. the episode is still running or crashed before compaction).
+    """
+    records_path = os.path.join(task_dir, RECORDS_FILE_NAME)
+    traj_path = os.path.join(task_dir, LOG_FILE_NAME)
+    if os.path.exists(records_path) and (
+        not os.path.exists(traj_path)
+        or os.path.getmtime(records_path) > os.path.getmtime(traj_path)
+    ):
+        return read_records(records_path)
+    if os.path.exists(traj_path):
+        with open(traj_path) as f:
+            return json.load(f)
+    return {}
+
+
+def compact_trajectory(task_dir: str) -> str:
+    """Rewrite `traj.json` from `traj.jsonl` atomically and return its path."""
+    records_path = os.path.join(task_dir, RECORDS_FILE_NAME)
+    traj_path = os.path.join(task_dir, LOG_FILE_NAME)
+    log_data = read_records(records_path) if os.path.exists(records_path) else {}
+    tmp_path = traj_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(log_data, f, ensure_ascii=False, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, traj_path)
+    return traj_path
 
 
 class TrajLogger:
-    def __init__(self, log_file_root: str, task_name: str):
+    """Per-task trajectory logger.
+
+    Steps are appended to `traj.jsonl` (one fsync-ed line per step) and compacted
+    into the `traj.json` layout read by the log viewer when the score is logged.
+
+    With `background=True`, record appends and screenshot/marker PNG encoding run
+    in order on a single writer thread so they stay off the agent's step loop;
+    `flush()` waits for pending writes and `close()` stops the writer.
+    """
+
+    def __init__(self, log_file_root: str, task_name: str, background: bool = False):
         self.log_file_dir = os.path.join(log_file_root, task_name)
         self.log_file_name = LOG_FILE_NAME
+        self.records_file_name = RECORDS_FILE_NAME
         self.score_file_name = SCORE_FILE_NAME
         self.screenshots_dir = "screenshots"
         self.marked_screenshots_dir = "marked_screenshots"
         self.tools = None
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="traj-writer")
+            if background
+            else None
+        )
+        self._pending: list[Future] = []
 
         if os.path.exists(self.log_file_dir) and os.path.exists(
             os.path.join(self.log_file_dir, self.screenshots_dir)
@@ -95,8 +193,45 @@ class TrajLogger:
         os.makedirs(self.log_file_dir, exist_ok=True)
         os.makedirs(os.path.join(self.log_file_dir, self.screenshots_dir), exist_ok=True)
         os.makedirs(os.path.join(self.log_file_dir, self.marked_screenshots_dir), exist_ok=True)
+        self._reset_files()
+
+    @property
+    def records_path(self) -> str:
+        return os.path.join(self.log_file_dir, self.records_file_name)
+
+    def _reset_files(self) -> None:
         with open(os.path.join(self.log_file_dir, self.log_file_name), "w") as f:
             json.dump({}, f)
+        open(self.records_path, "w").close()
+
+    def _submit(self, fn, *args) -> None:
+        if self._executor is None:
+            fn(*args)
+            return
+        self._pending = [future for future in self._pending if not future.done()]
+        future = self._executor.submit(fn, *args)
+        # failures are logged as soon as the write finishes, even if it is never flushed
+        future.add_done_callback(self._log_write_failure)
+        self._pending.append(future)
+
+    def _log_write_failure(self, future: Future) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        logger.opt(exception=future.exception()).error(
+            f"Background trajectory write failed in {self.log_file_dir}"
+        )
+
+    def flush(self) -> None:
+        """Wait for all queued background writes to finish; failures are logged."""
+        pending, self._pending = self._pending, []
+        wait(pending)
+
+    def close(self) -> None:
+        """Flush pending writes and stop the background writer."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def log_traj(
         self,
@@ -107,35 +242,34 @@ class TrajLogger:
         action: dict,
         obs: Observation,
         token_usage: dict[str, int] = None,
+        timings: dict[str, float] | None = None,
     ) -> None:
-        task_id = "0"
-
-        with open(os.path.join(self.log_file_dir, self.log_file_name)) as f:
-            log_data = json.load(f)
-
-        if task_id not in log_data:
-            log_data[task_id] = {"tools": self.tools, "traj": []}
-
-        log_data[task_id]["traj"].append(
-            {
-                "task_goal": task_goal,
-                "step": step,
-                "prediction": prediction,
-                "action": action,
-                "ask_user_response": obs.ask_user_response,
-                "tool_call": obs.tool_call,
-            }
-        )
-        log_data[task_id]["token_usage"] = token_usage
-
-        with open(os.path.join(self.log_file_dir, self.log_file_name), "w") as f:
-            json.dump(log_data, f, ensure_ascii=False, indent=4)
+        record = {
+            "type": "step",
+            "task_id": TASK_ID,
+            "tools": self.tools,
+            "task_goal": task_goal,
+            "step": step,
+            "prediction": prediction,
+            "action": action,
+            "ask_user_response": obs.ask_user_response,
+            "tool_call": obs.tool_call,
+            "token_usage": token_usage,
+        }
+        if timings is not None:
+            record["timings"] = timings
+        self._submit(self._write_step, task_name, step, record, obs.screenshot, action)
+
+    def _write_step(self, task_name: str, step: int, record: dict, screenshot, action: dict):
+        task_id = TASK_ID
+        _append_record(self.records_path, record)
 
         original_screenshot_path = os.path.join(
             self.log_file_dir, self.screenshots_dir, f"{task_name}-{task_id}-{step}.png"
         )
-        save_screenshot(obs.screenshot, original_screenshot_path)
+        save_screenshot(screenshot, original_screenshot_path)
 
+        # markers are drawn on the in-memory screenshot instead of re-reading the saved file
         action_type = action.get("action_type")
         if action_type in ["click", "double_tap", "long_press"]:
             click_coordinates = extract_click_coordinates(action)
@@ -144,9 +278,7 @@ class TrajLogger:
                 self.marked_screenshots_dir,
                 f"marked-{task_name}-{task_id}-{step}.png",
             )
-            draw_clicks_on_image(
-                original_screenshot_path, marked_screenshot_path, click_coordinates
-            )
+            draw_clicks_on_image(screenshot, marked_screenshot_path, click_coordinates)
         elif action_type == "drag":
             drag_coordinates = extract_drag_coordinates(action)
             marked_screenshot_path = os.path.join(
@@ -154,12 +286,13 @@ class TrajLogger:
                 self.marked_screenshots_dir,
                 f"marked-{task_name}-{task_id}-{step}.png",
             )
-            draw_drag_on_image(original_screenshot_path, marked_screenshot_path, drag_coordinates)
+            draw_drag_on_image(screenshot, marked_screenshot_path, drag_coordinates)
 
     def log_tools(self, tools: list[dict]):
         self.tools = tools
 
     def log_score(self, score: float, reason: str = "Unknown reason"):
+        self.compact()
         with open(os.path.join(self.log_file_dir, self.score_file_name), "w") as f:
             f.write(f"score: {score}\nreason: {reason}")
 
@@ -167,16 +300,18 @@ class TrajLogger:
         self.tools = None
 
     def log_token_usage(self, token_usage: dict[str, int]) -> None:
-        """Log token usage to traj.json."""
-        with open(os.path.join(self.log_file_dir, self.log_file_name)) as f:
-            log_data = json.load(f)
-
-        log_data["token_usage"] = token_usage
+        """Log token usage to the trajectory."""
+        self._submit(
+            _append_record, self.records_path, {"type": "token_usage", "token_usage": token_usage}
+        )
 
-        with open(os.path.join(self.log_file_dir, self.log_file_name), "w") as f:
-            json.dump(log_data, f, ensure_ascii=False, indent=4)
+    def compact(self) -> str:
+        """Write `traj.json` from the appended records."""
+        self.flush()
+        return compact_trajectory(self.log_file_dir)
 
     def reset_traj(self):
+        self.flush()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Backup screenshots dir
@@ -189,17 +324,19 @@ class TrajLogger:
         if os.path.exists(marked_path):
             os.rename(marked_path, f"{marked_path}_backup_{timestamp}")
 
-        # Backup traj.json
+        # Backup traj.json and traj.jsonl
         traj_path = os.path.join(self.log_file_dir, self.log_file_name)
         if os.path.exists(traj_path):
             backup_traj_path = os.path.join(self.log_file_dir, f"traj_backup_{timestamp}.json")
             os.rename(traj_path, backup_traj_path)
+        if os.path.exists(self.records_path):
+            backup_records_path = os.path.join(self.log_file_dir, f"traj_backup_{timestamp}.jsonl")
+            os.rename(self.records_path, backup_records_path)
 
-        # Recreate directories and empty traj.json
+        # Recreate directories and empty trajectory files
         os.makedirs(screenshots_path, exist_ok=True)
         os.makedirs(marked_path, exist_ok=True)
-        with open(traj_path, "w") as f:
-            json.dump({}, f)
+        self._reset_files()
 
         self.tools = None
         logger.info(f"Trajectory reset with backup timestamp: {timestamp}")
@@ -4,7 +4,10 @@ import abc
 import asyncio
 import os
 import time
+from collections.abc import Callable
+from dataclasses import replace
 from datetime import datetime
+from functools import partial
 from typing import Any
 
 from loguru import logger
@@ -15,19 +18,46 @@ from mobile_world.runtime.app_helpers.mall import (
     clear_config,
 )
 from mobile_world.runtime.app_helpers.system import (
+    invalidate_device_snapshot,
     time_sync_to_now,
 )
 from mobile_world.runtime.controller import AndroidController
+from mobile_world.runtime.utils.backend_lifecycle import lifecycle
+from mobile_world.tasks.evaluation import (
+    DEFAULT_EVAL_TIMEOUT,
+    POLL_INTERVAL,
+    Check,
+    CheckResult,
+    EvalReport,
+    combine,
+    outcome,
+    run_checks,
+    run_sync,
+    wait_until,
+)
+
+# apps backed by a compose stack: app name -> (lifecycle name, stop function)
+APP_BACKENDS = {
+    "Mastodon": (mastodon.BACKEND_NAME, mastodon.stop_mastodon_backend),
+    "Mattermost": (mattermost.BACKEND_NAME, mattermost.stop_mattermost_backend),
+}
+MALL_APP = "Taodian"  # its config and callback files are reset by initialize_task
 
 
 class BaseTask(abc.ABC):
     start_on_home_screen = True
+    # seconds a failing verification is retried for, while the agent's last change may
+    # still be landing in the app backend
+    settle_seconds: float = 0.0
+    eval_timeout: float = DEFAULT_EVAL_TIMEOUT
 
     def __init__(self, params: dict[str, Any] = None):
         if params is None:
             params = {}
         self.initialized = False
         self._params = params
+        self._check_results: list[CheckResult] = []
+        self._eval_device: str | None = None  # device of the running `evaluate`
         self.apps_require_time_sync = ["Chrome", "Maps", "MCP-arXiv"]
 
         # Determine the current date for tasks that require time sync.
@@ -106,6 +136,7 @@ class BaseTask(abc.ABC):
         """Initializes the task."""
         if self.initialized:
             logger.warning(f"{self.name} initialized before. Initializing again.")
+        invalidate_device_snapshot(controller.device)
 
         if self.snapshot_tag is not None:
             logger.debug(f"Loading snapshot: {self.snapshot_tag}")
@@ -116,7 +147,11 @@ class BaseTask(abc.ABC):
             # bug fix: it seems a few keystrokes are needed to force re-rendering the screen
             controller.app_switch()
             controller.home()
-            time.sleep(2)
+            try:
+                controller.wait_for_stable_screen(stable_frames=3, timeout=2.0, min_wait=0.3)
+            except Exception as e:
+                logger.warning(f"Screen stabilization failed, falling back to a fixed wait: {e}")
+                time.sleep(2)
 
         # some apps require time sync, e.g. Chrome, Maps, MCP-Amap
         if any(app in self.apps_require_time_sync for app in self.app_names):
@@ -127,8 +162,7 @@ class BaseTask(abc.ABC):
 
         ### app specific initialization, run before initialize_task_hook ###
         ### in case some tasks forget to implement proper tear_down() ###
-        mattermost.stop_mattermost_backend()
-        mastodon.stop_mastodon_backend()
+        self._stop_unused_backends()
         clear_config()
         clear_callback_files(controller.device)
 
@@ -146,9 +180,54 @@ class BaseTask(abc.ABC):
 
         controller.interaction_cache = ""
         controller.user_agent_chat_history = []
+        # the init hooks may have read providers before seeding them
+        invalidate_device_snapshot(controller.device)
         self.initialized = True
         return True
 
+    @property
+    def app_backends(self) -> set[str]:
+        """Lifecycle names of the app backends the agent may use during the task."""
+        return {APP_BACKENDS[app][0] for app in self.app_names if app in APP_BACKENDS}
+
+    @property
+    def requirements(self) -> dict[str, Any]:
+        """What `initialize_task` has to prepare for this task.
+
+        Tasks with equal requirements can run back to back on one environment and
+        share warm backends, see `core.scheduler`.
+        """
+        backends = set(self.app_backends)
+        if MALL_APP in self.app_names:
+            backends.add("mall")
+        return {
+            "snapshot_tag": self.snapshot_tag,
+            "backends": sorted(backends),
+            "time_sync": any(app in self.apps_require_time_sync for app in self.app_names),
+        }
+
+    def _stop_unused_backends(self) -> None:
+        """Stop the app backends this task does not use.
+
+        Backends the task uses are left to its `initialize_task_hook`, which starts or
+        resets them. Backends known to be stopped are skipped without probing docker.
+        """
+        for backend_name, stop_backend in APP_BACKENDS.values():
+            if backend_name not in self.app_backends and not lifecycle.is_stopped(backend_name):
+                stop_backend()
+
+    def wait_for_device(
+        self, controller: AndroidController, predicate: Callable[[], Any], timeout: float
+    ) -> Any:
+        """Poll `predicate` until it is truthy or `timeout` seconds have passed.
+
+        The device snapshot is dropped before each retry, so predicates reading it see
+        the current device state. Returns the last value of `predicate`.
+        """
+        return wait_until(
+            predicate, timeout, refresh=partial(invalidate_device_snapshot, controller.device)
+        )
+
     def _check_is_initialized(self) -> None:
         if not self.initialized:
             raise RuntimeError(
@@ -169,7 +248,7 @@ class BaseTask(abc.ABC):
             assert type(self).is_successful_async is not BaseTask.is_successful_async, (
                 "Subclasses must implement this method or is_successful_async method"
             )
-            return asyncio.run(self.is_successful_async(controller))
+            return run_sync(self.is_successful_async(controller))
         else:
             return self.is_successful(controller)
 
@@ -184,6 +263,72 @@ class BaseTask(abc.ABC):
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.is_successful, controller)
 
+    def run_checks(
+        self, checks: dict[str, Callable[[], Any]] | list[Check]
+    ) -> float | tuple[float, str]:
+        """Run independent verification steps concurrently, each with its own timeout.
+
+        Checks that settle without a `refresh` hook drop the device snapshot before
+        each retry when run from `evaluate`.
+
+        Args:
+            checks: `Check`s, or check functions by name with the default timeout
+
+        Returns:
+            the first failing check's score and reason in the given order, else 1.0
+        """
+        if isinstance(checks, dict):
+            checks = [Check(name, func) for name, func in checks.items()]
+        if self._eval_device is not None:
+            refresh = partial(invalidate_device_snapshot, self._eval_device)
+            checks = [
+                replace(check, refresh=refresh) if check.settle and check.refresh is None else check
+                for check in checks
+            ]
+        results = run_checks(checks)
+        self._check_results.extend(results)
+        return combine(results)
+
+    def evaluate(self, controller: AndroidController) -> EvalReport:
+        """Score the task with timing of the verifier and its checks.
+
+        A failing verification is repeated until `settle_seconds` have passed, and the
+        whole evaluation fails after `eval_timeout` seconds.
+        """
+        start = time.monotonic()
+        deadline = start + self.settle_seconds
+        attempts = 0
+        self._eval_device = controller.device
+        try:
+            while True:
+                attempts += 1
+                self._check_results = []
+                try:
+                    remaining = max(self.eval_timeout - (time.monotonic() - start), 0.0)
+                    score, reason = outcome(
+                        run_sync(self.is_successful_async(controller), timeout=remaining)
+                    )
+                except TimeoutError:
+                    score, reason = 0.0, f"Evaluation timed out after {self.eval_timeout}s"
+                    break
+                settle_remaining = deadline - time.monotonic()
+                if score >= 1.0 or settle_remaining <= 0:
+                    break
+                # the verifiers' device snapshot predates the change being waited for
+                invalidate_device_snapshot(controller.device)
+                time.sleep(min(POLL_INTERVAL, settle_remaining))
+        finally:
+            self._eval_device = None
+
+        report = EvalReport(
+            score, reason, time.monotonic() - start, attempts, list(self._check_results)
+        )
+        logger.info(
+            f"Evaluated {self.name}: score={score} in {report.seconds:.2f}s "
+            f"({attempts} attempt(s), {len(report.checks)} check(s))"
+        )
+        return report
+
     def tear_down(self, controller: AndroidController) -> None:  # pylint: disable=unused-argument
         """Tears down the task."""
         controller.interaction_cache = ""
@@ -211,7 +356,7 @@ class BaseTask(abc.ABC):
 
         wait_for_execution(controller)
 
-        score = self.is_successful(controller)
+        score = self.evaluate(controller).score
         print(f"Final Success Score: {score}")
 
         status = self.tear_down(controller)
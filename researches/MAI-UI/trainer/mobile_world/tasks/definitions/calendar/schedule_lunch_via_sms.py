@@ -1,12 +1,11 @@
 """Schedule lunch invitation from SMS to calendar task implementation."""
 
 import datetime
-import time
 
 from loguru import logger
 
 from mobile_world.runtime.app_helpers.fossify_calendar import get_calendar_events
-from mobile_world.runtime.app_helpers.system import check_sms_via_adb
+from mobile_world.runtime.app_helpers.system import check_sms_via_adb, count_received_sms
 from mobile_world.runtime.controller import AndroidController
 from mobile_world.tasks.base import BaseTask
 
@@ -38,13 +37,19 @@ class ScheduleLunchViaSmsTask(BaseTask):
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             logger.info(f"Injecting SMS from {self.sender_name} ({self.sender_phone})")
+            received = count_received_sms(controller, self.sender_phone)
             result = controller.simulate_sms(self.sender_phone, self.sms_content)
 
             if not result.success:
                 logger.error(f"Failed to inject SMS: {result.error}")
                 return False
 
-            time.sleep(1)
+            if not self.wait_for_device(
+                controller,
+                lambda: count_received_sms(controller, self.sender_phone) > received,
+                timeout=10,
+            ):
+                logger.warning("Injected SMS has not reached the inbox yet")
             logger.info("Successfully injected lunch invitation SMS")
 
             return True
@@ -1,10 +1,8 @@
 """Schedule coffee time invitation from SMS to calendar task implementation."""
 
-import time
-
 from loguru import logger
 
-from mobile_world.runtime.app_helpers.system import check_sms_via_adb
+from mobile_world.runtime.app_helpers.system import check_sms_via_adb, count_received_sms
 from mobile_world.runtime.controller import AndroidController
 from mobile_world.tasks.base import BaseTask
 
@@ -42,13 +40,19 @@ class ScheduleOneOneViaSmsAskUserTask(BaseTask):
                 f"If the GUI agent do not mention the name of the {self.contact_name}, you should refuse to answer."
             )
             logger.info(f"Injecting SMS from my boss ({self.sender_phone})")
+            received = count_received_sms(controller, self.sender_phone)
             result = controller.simulate_sms(self.sender_phone, self.sms_content)
 
             if not result.success:
                 logger.error(f"Failed to inject SMS: {result.error}")
                 return False
 
-            time.sleep(1)
+            if not self.wait_for_device(
+                controller,
+                lambda: count_received_sms(controller, self.sender_phone) > received,
+                timeout=10,
+            ):
+                logger.warning("Injected SMS has not reached the inbox yet")
 
             logger.info("Successfully injected one-on-one meeting invitation SMS")
 
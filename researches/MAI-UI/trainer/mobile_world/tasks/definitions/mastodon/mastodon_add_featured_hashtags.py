@@ -1,7 +1,5 @@
 """Add featured hashtags on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -20,6 +18,8 @@ class MastodonAddFeaturedHashtagsTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -36,7 +36,6 @@ class MastodonAddFeaturedHashtagsTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         featured_tags = mastodon.get_featured_tags_by_username(self.EXPECTED_USERNAME)
         if not featured_tags:
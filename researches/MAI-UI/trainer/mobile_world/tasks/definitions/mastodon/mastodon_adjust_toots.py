@@ -1,7 +1,5 @@
 """Adjust the toots on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -23,6 +21,8 @@ class MastodonAdjustTootsTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1  # wait for operations to complete
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -41,10 +41,16 @@ class MastodonAdjustTootsTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)  # wait for operations to complete
+
+        # bookmarks, favourites and latest toots of the user in one query
+        snapshot = mastodon.get_verification_snapshot(
+            self.EXPECTED_USERNAME, ["bookmarks", "favourites", "statuses"], limit=200
+        )
+        if snapshot is None:
+            return 0.0, f"Failed to query Mastodon state of user '{self.EXPECTED_USERNAME}'"
 
         # 1. Check that bookmarks are removed
-        bookmarks = mastodon.get_bookmarks_by_username(self.EXPECTED_USERNAME)
+        bookmarks = snapshot["bookmarks"]
         if bookmarks:
             bookmark_status_ids = {bookmark.get("status_id") for bookmark in bookmarks}
             # Check if any expected status ids are still in bookmarks
@@ -56,7 +62,7 @@ class MastodonAdjustTootsTask(BaseTask):
                 )
 
         # 2. Check that all expected status ids are added as favorites
-        favorites = mastodon.get_favorites_by_username(self.EXPECTED_USERNAME)
+        favorites = snapshot["favourites"]
         if not favorites:
             return 0.0, f"No favorites found for user '{self.EXPECTED_USERNAME}'"
 
@@ -76,9 +82,7 @@ class MastodonAdjustTootsTask(BaseTask):
         # 3. Check that all expected status ids are boosted (reblogged)
         # Get latest toots (at least as many as expected toots)
         num_expected = len(self.EXPECTED_FAVORITE_AND_BOOST_TOOTS)
-        toots = mastodon.get_latest_toots_by_username(
-            self.EXPECTED_USERNAME, limit=num_expected * 2
-        )
+        toots = snapshot["statuses"][: num_expected * 2]
         if not toots:
             return 0.0, f"No toots found for user '{self.EXPECTED_USERNAME}'"
 
@@ -1,7 +1,5 @@
 """Create multiple memos on Calendar from posts under #openTalk on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -38,6 +36,8 @@ class MastodonCalendarMultiMemosTask(BaseTask):
 
     app_names = {"Mastodon", "Calendar"}
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -100,7 +100,6 @@ class MastodonCalendarMultiMemosTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         memo_events = get_calendar_events()
 
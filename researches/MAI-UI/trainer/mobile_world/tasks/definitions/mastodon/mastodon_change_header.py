@@ -1,7 +1,6 @@
 """Change header image on Mastodon profile."""
 
 import os
-import time
 
 from loguru import logger
 
@@ -21,6 +20,8 @@ class MastodonChangeHeaderTask(BaseTask):
 
     app_names = {"Mastodon", "Gallery"}
 
+    settle_seconds = 2  # wait for the header image to be changed
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -38,7 +39,6 @@ class MastodonChangeHeaderTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(2)  # wait for the header image to be changed
 
         # Get header path & device image path
         account_id = mastodon.get_user_account_info(self.EXPECTED_USERNAME).get("account_id")
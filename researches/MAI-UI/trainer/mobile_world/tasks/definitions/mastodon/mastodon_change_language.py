@@ -1,7 +1,5 @@
 """Change language on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -21,6 +19,8 @@ class MastodonChangeLanguageTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1  # wait for the language to be changed
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -38,7 +38,6 @@ class MastodonChangeLanguageTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)  # wait for the language to be changed
 
         user_info = mastodon.get_user_info(self.EXPECTED_USERNAME)
         if not user_info:
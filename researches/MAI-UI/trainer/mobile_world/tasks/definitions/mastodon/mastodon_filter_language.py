@@ -1,7 +1,5 @@
 """Filter language on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -20,6 +18,8 @@ class MastodonFilterLanguageTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1  # wait for the language to be changed
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -36,7 +36,6 @@ class MastodonFilterLanguageTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)  # wait for the language to be changed
 
         user_info = mastodon.get_user_info(self.EXPECTED_USERNAME)
         if not user_info:
@@ -1,7 +1,5 @@
 """admin get server info (database size)"""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -20,6 +18,8 @@ class MastodonGetServerInfoTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -32,7 +32,6 @@ class MastodonGetServerInfoTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         owner_toot = mastodon.get_latest_toots_by_username(self.EXPECTED_USERNAME, limit=1)
         if not owner_toot:
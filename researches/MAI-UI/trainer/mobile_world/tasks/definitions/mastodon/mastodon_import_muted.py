@@ -1,6 +1,5 @@
 """Import muted users from Mastodon."""
 import os
-import time
 
 from loguru import logger
 
@@ -22,6 +21,8 @@ class MastodonImportMutedUsersTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1  # wait for the muted list to be imported
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         # push the image to the gallery
         file_path = os.path.join(self.ASSETS_PATH, self.EXPECTED_FILE_NAME)
@@ -45,7 +46,6 @@ class MastodonImportMutedUsersTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)  # wait for the muted list to be imported
 
         # Check muted users
         muted_users = mastodon.get_muted_users(self.EXPECTED_USERNAME)
@@ -1,7 +1,5 @@
 """Report a toxic post on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -26,6 +24,8 @@ class MastodonInviteTask(BaseTask):
 
     app_names = {"Mastodon", "Messages"}
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -50,7 +50,6 @@ class MastodonInviteTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         invites = mastodon.get_invite_info(self.EXPECTED_AUTO_FOLLOW_USERNAME)
         if not invites:
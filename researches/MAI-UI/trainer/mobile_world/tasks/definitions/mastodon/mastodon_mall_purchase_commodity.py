@@ -1,7 +1,5 @@
 """get purchase info from Mastodon and buy the commodity in the mall app."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mall, mastodon
@@ -25,6 +23,8 @@ class MastodonMallPurchaseCommodityTask(BaseTask):
 
     app_names = {"Mastodon", "Taodian"}
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -48,7 +48,6 @@ class MastodonMallPurchaseCommodityTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         try:
             callback_records = mall.get_recent_callback_content(1)
@@ -1,7 +1,5 @@
 """Manage hashtags on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -21,6 +19,8 @@ class MastodonManageHashtagsTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -37,7 +37,6 @@ class MastodonManageHashtagsTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         hashtags = mastodon.get_hashtags_by_username(self.EXPECTED_USERNAME)
         if not hashtags:
@@ -1,7 +1,5 @@
 """Manage multiple lists on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -40,6 +38,8 @@ class MastodonManageMultiListTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -63,7 +63,6 @@ class MastodonManageMultiListTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         lists = mastodon.get_lists_by_username(self.EXPECTED_USERNAME)
         if lists is None:
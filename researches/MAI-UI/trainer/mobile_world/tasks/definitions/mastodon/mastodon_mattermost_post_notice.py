@@ -1,7 +1,5 @@
 """Post a notice from mattermost to mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon, mattermost
@@ -24,6 +22,8 @@ class MastodonMattermostPostNoticeTask(BaseTask):
 
     app_names = {"Mastodon", "Mattermost"}
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> None:
         try:
             mastodon.start_mastodon_backend()
@@ -44,7 +44,6 @@ class MastodonMattermostPostNoticeTask(BaseTask):
 
         assert mastodon.is_mastodon_healthy()
         assert mattermost.is_mattermost_healthy()
-        time.sleep(1)
 
         toots = mastodon.get_latest_toots_by_username(self.EXPECTED_USERNAME, limit=1)
         if not toots:
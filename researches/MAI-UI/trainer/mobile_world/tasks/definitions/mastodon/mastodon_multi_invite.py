@@ -2,8 +2,6 @@
 Generate multiple invite links with different conditions.
 """
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -33,6 +31,8 @@ class MastodonMultiInviteTask(BaseTask):
 
     app_names = {"Mastodon", "Messages"}
 
+    settle_seconds = 1
+
     @property
     def snapshot_tag(self) -> str | None:
         return "init_state"
@@ -61,7 +61,6 @@ class MastodonMultiInviteTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         # Get the latest 2 invites
         invites = mastodon.get_invite_info(self.EXPECTED_AUTO_FOLLOW_USERNAME, limit=2)
@@ -1,7 +1,5 @@
 """Post a new content on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -21,6 +19,8 @@ class MastodonNewPostTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -33,7 +33,6 @@ class MastodonNewPostTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         toots = mastodon.get_latest_toots_by_username(self.EXPECTED_USERNAME, limit=1)
         if not toots:
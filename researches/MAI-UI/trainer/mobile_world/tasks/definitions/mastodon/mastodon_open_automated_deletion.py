@@ -1,7 +1,5 @@
 """Open automated post deletions setting on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -34,6 +32,8 @@ class MastodonOpenAutomatedDeletionTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -59,7 +59,6 @@ class MastodonOpenAutomatedDeletionTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         automated_post_deletions_setting = mastodon.get_automated_post_deletions_setting(
             self.EXPECTED_USERNAME
@@ -1,7 +1,5 @@
 """Pin specific toots on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -21,6 +19,8 @@ class MastodonPinTootsTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -33,7 +33,6 @@ class MastodonPinTootsTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         # Check if the toots are pinned
         pinned_toots = mastodon.get_pinned_toots_by_username(self.EXPECTED_USERNAME)
@@ -1,7 +1,5 @@
 """Remove a bookmark on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -21,6 +19,8 @@ class MastodonRemoveBookmarkTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -37,7 +37,6 @@ class MastodonRemoveBookmarkTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         # Check if the bookmark was removed
         bookmarks = mastodon.get_bookmarks_by_username(self.EXPECTED_USERNAME)
@@ -1,7 +1,5 @@
 """Reply to a mentioned toot on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -22,6 +20,8 @@ class MastodonReplyTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 2  # wait for the reply to be posted
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -39,7 +39,6 @@ class MastodonReplyTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(2)  # wait for the reply to be posted
 
         toots = mastodon.get_latest_toots_by_username(self.EXPECTED_USERNAME, limit=1)
         if not toots:
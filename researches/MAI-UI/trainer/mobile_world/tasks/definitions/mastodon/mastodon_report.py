@@ -1,7 +1,5 @@
 "Report harmful toot on Mastodon."
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -32,6 +30,8 @@ class MastodonReportTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 2  # wait for the report to be submitted
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -51,7 +51,6 @@ class MastodonReportTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(2)  # wait for the report to be submitted
 
         report_info = mastodon.get_report_info(self.EXPECTED_TOOT_ID)
         if not report_info:
@@ -1,7 +1,5 @@
 """Revise the photo alternation on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -24,6 +22,8 @@ class MastodonRevisePhotoAltTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1  # wait for the photo alt to be revised
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -41,7 +41,6 @@ class MastodonRevisePhotoAltTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)  # wait for the photo alt to be revised
 
         images = mastodon.get_images_by_status_id(self.EXPECTED_TOOT_ID)
         if not images:
@@ -1,7 +1,5 @@
 """Revise a poll on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -26,6 +24,8 @@ class MastodonRevisePollTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -43,7 +43,6 @@ class MastodonRevisePollTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         # Check if the poll revision meets all expected criteria
         toot = mastodon.get_toot_by_status_id(self.EXPECTED_TOOT_ID)
@@ -1,7 +1,6 @@
 """Save photos to gallery"""
 
 import os
-import time
 
 from loguru import logger
 
@@ -22,6 +21,8 @@ class MastodonSavePhotosTask(BaseTask):
 
     app_names = {"Mastodon", "Gallery"}
 
+    settle_seconds = 2  # wait for the photos to be saved
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -39,7 +40,6 @@ class MastodonSavePhotosTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(2)  # wait for the photos to be saved
 
         images = mastodon.get_images_by_status_id(self.EXPECTED_TOOT_ID)
         if not images:
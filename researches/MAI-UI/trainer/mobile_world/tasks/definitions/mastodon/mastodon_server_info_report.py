@@ -1,7 +1,6 @@
 """owner get server info report - count untackled reports and send email"""
 
 import re
-import time
 
 from loguru import logger
 
@@ -24,6 +23,8 @@ class MastodonServerInfoReportTask(BaseTask):
 
     app_names = {"Mastodon", "Mail"}
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -36,7 +37,6 @@ class MastodonServerInfoReportTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         # Get all reports from the database
         all_reports = mastodon.get_all_reports_info()
@@ -2,7 +2,6 @@
 
 import os
 import re
-import time
 
 from loguru import logger
 
@@ -24,6 +23,8 @@ class MastodonShareLocationTask(BaseTask):
 
     app_names = {"Mastodon", "Maps", "Gallery"}
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         # push the image to the gallery
         image_path = os.path.join(self.ASSETS_PATH, self.EXPECTED_IMAGE)
@@ -49,7 +50,6 @@ class MastodonShareLocationTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         toots = mastodon.get_latest_toots_by_username(self.EXPECTED_USERNAME, limit=1)
         if not toots:
@@ -1,7 +1,5 @@
 """unfollow a user on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -20,6 +18,8 @@ class MastodonUnfollowTask(BaseTask):
         "Mastodon",
     }
 
+    settle_seconds = 1  # wait for the following list to be updated
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -32,7 +32,6 @@ class MastodonUnfollowTask(BaseTask):
         self._check_is_initialized()
 
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)  # wait for the following list to be updated
 
         following_users = mastodon.get_following_users(self.EXPECTED_USERNAME)
         if not following_users:
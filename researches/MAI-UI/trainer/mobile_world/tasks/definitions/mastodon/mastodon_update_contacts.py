@@ -1,7 +1,5 @@
 """Update contacts on Mastodon."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mastodon
@@ -27,6 +25,8 @@ class MastodonUpdateContactsTask(BaseTask):
 
     app_names = {"Mastodon", "Contacts"}
 
+    settle_seconds = 1
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         try:
             mastodon.start_mastodon_backend()
@@ -46,7 +46,6 @@ class MastodonUpdateContactsTask(BaseTask):
 
         # Ensure Mastodon backend is running
         assert mastodon.is_mastodon_healthy()
-        time.sleep(1)
 
         contacts = get_contacts_via_adb(controller, name=self.EXPECTED_CONTACTS)
         if not contacts:
@@ -1,9 +1,9 @@
 """Compare apartment distances and send SMS with result."""
 
-import time
+from loguru import logger
 
 from mobile_world.runtime.app_helpers import mcp as mcp_helper
-from mobile_world.runtime.app_helpers.system import check_sms_via_adb
+from mobile_world.runtime.app_helpers.system import check_sms_via_adb, count_received_sms
 from mobile_world.runtime.controller import AndroidController
 from mobile_world.tasks.base import BaseTask
 
@@ -17,6 +17,7 @@ class CompareApartmentsDistanceSmsTask(BaseTask):
     )
     task_tags = {"agent-mcp", "lang-cn"}
 
+    AGENT_PHONE = "15858101234"
     RECIPIENT_PHONE = "14058298746"
     COMPANY_LOCATION = "120.140446,30.280180"
     APARTMENT1_LOCATION = "120.097675,30.287514"
@@ -28,15 +29,21 @@ class CompareApartmentsDistanceSmsTask(BaseTask):
     app_names = {"MCP-Amap", "Messages"}
 
     def initialize_task_hook(self, controller: AndroidController) -> bool:
+        received = count_received_sms(controller, self.AGENT_PHONE)
         controller.simulate_sms(
-            sender="15858101234",
+            sender=self.AGENT_PHONE,
             message=self.SMS_1,
         )
         controller.simulate_sms(
-            sender="15858101234",
+            sender=self.AGENT_PHONE,
             message=self.SMS_2,
         )
-        time.sleep(2)
+        if not self.wait_for_device(
+            controller,
+            lambda: count_received_sms(controller, self.AGENT_PHONE) >= received + 2,
+            timeout=10,
+        ):
+            logger.warning("Injected SMS have not reached the inbox yet")
         return True
 
     async def is_successful_async(self, controller: AndroidController) -> float | tuple[float, str]:
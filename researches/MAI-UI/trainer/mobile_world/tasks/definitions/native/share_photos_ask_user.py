@@ -1,12 +1,14 @@
 """Share photos task implementation - find flowers pictures and send via email."""
 
-import time
+from functools import partial
 from pathlib import Path
 
 from loguru import logger
 
 from mobile_world.runtime.app_helpers import mail
+from mobile_world.runtime.app_helpers.system import are_images_indexed
 from mobile_world.runtime.controller import AndroidController
+from mobile_world.runtime.utils.provisioning import FileItem, ProvisionManifest
 from mobile_world.tasks.base import BaseTask
 
 
@@ -65,43 +67,31 @@ class SharePhotosAskUserTask(BaseTask):
             logger.error(f"Required images missing from assets: {missing}")
             return False
 
-        # Store list of remote paths for cleanup
-        self._remote_image_paths = []
-
-        # Push all images to device
-        for local_image_path in image_files:
-            image_filename = local_image_path.name
-
-            # Define remote path on device (in Pictures directory so Gallery can find it)
-            remote_path = f"/sdcard/Pictures/{image_filename}"
-
-            logger.info(f"Pushing image: {image_filename} to {remote_path}")
-
-            # Push the image to device
-            result = controller.push_file(str(local_image_path), remote_path)
-
-            if not result.success:
-                logger.error(f"Failed to push image {image_filename} to device: {result.error}")
-                continue
-
-            # Store the remote path for later cleanup
-            self._remote_image_paths.append(remote_path)
-
-            # Wait a moment for file to be written
-            time.sleep(0.5)
-
-            # Trigger media scanner to make the image visible in Gallery
-            logger.info(f"Triggering media scan for {image_filename}")
-            controller.refresh_media_scan(remote_path)
-
-        if not self._remote_image_paths:
-            logger.error("Failed to push any images to device")
+        # Push all images to device in one batch, in Pictures directory so Gallery can
+        # find them, and trigger the media scanner for each
+        remote_paths = [f"/sdcard/Pictures/{image.name}" for image in image_files]
+        result = controller.provision(
+            ProvisionManifest(
+                files=[
+                    FileItem(image, remote, media_scan=True)
+                    for image, remote in zip(image_files, remote_paths)
+                ]
+            )
+        )
+        if not result.success:
+            logger.error(f"Failed to push images to device: {result.error}")
             return False
 
+        # Store list of remote paths for cleanup
+        self._remote_image_paths = remote_paths
+
         logger.info(f"Successfully pushed {len(self._remote_image_paths)} images to device")
 
-        # Wait for media scan to complete
-        time.sleep(2)
+        # Wait until the media scan has indexed the images, so Gallery lists them
+        if not self.wait_for_device(
+            controller, partial(are_images_indexed, controller, remote_paths), timeout=10
+        ):
+            logger.warning("Media scan has not indexed all pushed images, continuing")
 
         return True
 
@@ -1,6 +1,6 @@
 """Check depart time task implementation."""
 
-import time
+from loguru import logger
 
 from mobile_world.runtime.app_helpers.mail import get_sent_email_info
 from mobile_world.runtime.app_helpers.system import get_sms_list_via_adb
@@ -26,15 +26,26 @@ class SMSManagement(BaseTask):
     app_names = {"Messages", "Mail"}
 
     def initialize_task_hook(self, controller: AndroidController) -> bool:
-        time.sleep(3)
+        # wait until the messages of the snapshot are readable from the SMS provider
+        expected = self.key_numbers_to_delete + self.key_numbers_not_to_delete
+        if not self.wait_for_device(
+            controller,
+            lambda: set(expected) <= set(self._sms_addresses(controller)),
+            timeout=10,
+        ):
+            logger.warning("Not all expected SMS messages are in the inbox, continuing")
         return True
 
+    @staticmethod
+    def _sms_addresses(controller: AndroidController) -> list[str]:
+        sms_list = get_sms_list_via_adb(controller)
+        return [s.split("address=")[1].split(",")[0] for s in sms_list]
+
     def is_successful(self, controller: AndroidController) -> float | tuple[float, str]:
         """Check if the task was completed successfully."""
         self._check_is_initialized()
 
-        sms_list = get_sms_list_via_adb(controller)
-        addresses = [s.split("address=")[1].split(",")[0] for s in sms_list]
+        addresses = self._sms_addresses(controller)
         for key_number in self.key_numbers_to_delete:
             if key_number in addresses:
                 return 0.0, "Spam message found!"
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from loguru import logger
 
+from mobile_world.runtime.app_helpers.system import are_images_indexed
 from mobile_world.runtime.controller import AndroidController
 from mobile_world.runtime.utils.helpers import execute_adb
 from mobile_world.tasks.base import BaseTask
@@ -20,6 +21,8 @@ class ChangeWallpaperTask(BaseTask):
 
     app_names = {"Gallery", "Settings"}
 
+    settle_seconds = 2  # changes may take a moment to be persisted
+
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         """Initialize task - push all wallpaper images from assets to device and record initial wallpaper state."""
         # Get path to assets directory
@@ -70,9 +73,6 @@ class ChangeWallpaperTask(BaseTask):
                 self._target_image_path = remote_path
                 logger.info(f"Target image: {self.target_image_name}")
 
-            # Wait a moment for file to be written
-            time.sleep(0.5)
-
             # Trigger media scanner to make the image visible in Gallery
             logger.info(f"Triggering media scan for {image_filename}")
             controller.refresh_media_scan(remote_path)
@@ -87,8 +87,12 @@ class ChangeWallpaperTask(BaseTask):
 
         logger.info(f"Successfully pushed {len(self._remote_image_paths)} images to device")
 
-        # Wait for media scan to complete
-        time.sleep(2)
+        if not self.wait_for_device(
+            controller,
+            lambda: are_images_indexed(controller, self._remote_image_paths),
+            timeout=10,
+        ):
+            logger.warning("Media scan has not indexed all pushed images yet")
 
         # Record initial wallpaper state (before user changes it)
         logger.info("\nRecording initial wallpaper state...")
@@ -153,9 +157,6 @@ class ChangeWallpaperTask(BaseTask):
         """Check if wallpaper has been changed."""
         self._check_is_initialized()
 
-        # Wait a moment to ensure any changes are persisted
-        time.sleep(2)
-
         # Compare with initial state
         if not hasattr(self, "_initial_wallpaper_state"):
             logger.error("Initial wallpaper state not recorded")
@@ -1,12 +1,11 @@
 """Close flight mode task implementation."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers.system import get_flight_mode_status, set_flight_mode
 from mobile_world.runtime.controller import AndroidController
 from mobile_world.tasks.base import BaseTask
+from mobile_world.tasks.evaluation import wait_until
 
 
 class CloseFlightModeTask(BaseTask):
@@ -34,10 +33,9 @@ class CloseFlightModeTask(BaseTask):
 
             # Try to enable using original method
             set_flight_mode(controller, True)
-            time.sleep(1)
 
             # Check if successfully enabled, if not use backup method
-            if not get_flight_mode_status(controller):
+            if not wait_until(lambda: get_flight_mode_status(controller), timeout=5):
                 logger.info("Failed to enable flight mode")
                 return False
             else:
@@ -1,12 +1,11 @@
 """Open flight mode task implementation."""
 
-import time
-
 from loguru import logger
 
 from mobile_world.runtime.app_helpers.system import get_flight_mode_status, set_flight_mode
 from mobile_world.runtime.controller import AndroidController
 from mobile_world.tasks.base import BaseTask
+from mobile_world.tasks.evaluation import wait_until
 
 
 class OpenFlightModeTask(BaseTask):
@@ -34,10 +33,9 @@ class OpenFlightModeTask(BaseTask):
 
             # Try to disable using original method
             set_flight_mode(controller, False)
-            time.sleep(1)
 
             # Check if successfully disabled
-            if get_flight_mode_status(controller):
+            if not wait_until(lambda: not get_flight_mode_status(controller), timeout=5):
                 logger.info("Failed to disable flight mode")
                 return False
             else:
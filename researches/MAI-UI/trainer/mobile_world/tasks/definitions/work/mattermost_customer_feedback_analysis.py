@@ -1,6 +1,5 @@
 """Customer feedback analysis task - aggregate feedback and schedule review."""
 
-import time
 from datetime import datetime, timedelta
 
 from mobile_world.runtime.app_helpers import mattermost
@@ -51,7 +50,6 @@ class MattermostCustomerFeedbackAnalysisTask(BaseTask):
 
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         mattermost.start_mattermost_backend()
-        time.sleep(5)
 
         cli = mattermost.MattermostCLI()
         cli.login(USERS["sofia"], DEFAULT_PASSWORD)
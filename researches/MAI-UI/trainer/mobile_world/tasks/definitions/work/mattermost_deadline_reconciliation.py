@@ -1,12 +1,12 @@
 """Cross-platform deadline reconciliation task - verify deadlines mentioned in chat have calendar events."""
 
-import time
 from datetime import datetime, timedelta
 
 from mobile_world.runtime.app_helpers import mattermost
 from mobile_world.runtime.app_helpers.fossify_calendar import (
+    calendar_event_row,
     get_calendar_events,
-    insert_calendar_event,
+    insert_calendar_events,
 )
 from mobile_world.runtime.app_helpers.mail import get_sent_email_info
 from mobile_world.runtime.app_helpers.system import time_sync_to_now
@@ -83,7 +83,6 @@ class MattermostDeadlineReconciliationTask(BaseTask):
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         # Start mattermost backend
         mattermost.start_mattermost_backend()
-        time.sleep(5)
 
         dates = self._dates
 
@@ -159,13 +158,17 @@ class MattermostDeadlineReconciliationTask(BaseTask):
             {"title": "Team Building Event", "date": dates["calendar_untracked"]},
         ]
 
-        for event in calendar_events:
-            insert_calendar_event(
-                title=event["title"],
-                start_time=f"{event['date']} 09:00:00",
-                end_time=f"{event['date']} 10:00:00",
-                description="Project event",
-            )
+        insert_calendar_events(
+            [
+                calendar_event_row(
+                    title=event["title"],
+                    start_time=f"{event['date']} 09:00:00",
+                    end_time=f"{event['date']} 10:00:00",
+                    description="Project event",
+                )
+                for event in calendar_events
+            ]
+        )
 
         # Enable auto time sync for browser
         if not time_sync_to_now():
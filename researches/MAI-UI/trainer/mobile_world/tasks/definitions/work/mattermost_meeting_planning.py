@@ -1,13 +1,13 @@
 """Calendar-aware meeting planning task with route constraints via Mattermost coordination."""
 
 import re
-import time
 from datetime import datetime, timedelta
 
 from mobile_world.runtime.app_helpers import mattermost
 from mobile_world.runtime.app_helpers.fossify_calendar import (
+    calendar_event_row,
     get_calendar_events,
-    insert_calendar_event,
+    insert_calendar_events,
 )
 from mobile_world.runtime.app_helpers.system import time_sync_to_now
 from mobile_world.runtime.controller import AndroidController
@@ -84,7 +84,6 @@ class MattermostMeetingPlanningTask(BaseTask):
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         # Start mattermost backend
         mattermost.start_mattermost_backend()
-        time.sleep(5)
 
         dates = self._dates
 
@@ -145,28 +144,30 @@ class MattermostMeetingPlanningTask(BaseTask):
         )
 
         # Create Harry's calendar events (the user's own calendar) with dynamic dates
-        # Monday: 9-11 meeting
-        insert_calendar_event(
-            title="Weekly Sync",
-            start_time=f"{dates['monday']} 13:00:00",
-            end_time=f"{dates['monday']} 18:00:00",
-            description="Regular team sync",
-        )
-
-        # Tuesday: 15-17 meeting
-        insert_calendar_event(
-            title="Product Review",
-            start_time=f"{dates['tuesday']} 15:00:00",
-            end_time=f"{dates['tuesday']} 17:00:00",
-            description="Q4 product review",
-        )
-
-        # Thursday: 9-12 meeting
-        insert_calendar_event(
-            title="Architecture Discussion",
-            start_time=f"{dates['thursday']} 09:00:00",
-            end_time=f"{dates['thursday']} 12:00:00",
-            description="System architecture review",
+        insert_calendar_events(
+            [
+                # Monday: 9-11 meeting
+                calendar_event_row(
+                    title="Weekly Sync",
+                    start_time=f"{dates['monday']} 13:00:00",
+                    end_time=f"{dates['monday']} 18:00:00",
+                    description="Regular team sync",
+                ),
+                # Tuesday: 15-17 meeting
+                calendar_event_row(
+                    title="Product Review",
+                    start_time=f"{dates['tuesday']} 15:00:00",
+                    end_time=f"{dates['tuesday']} 17:00:00",
+                    description="Q4 product review",
+                ),
+                # Thursday: 9-12 meeting
+                calendar_event_row(
+                    title="Architecture Discussion",
+                    start_time=f"{dates['thursday']} 09:00:00",
+                    end_time=f"{dates['thursday']} 12:00:00",
+                    description="System architecture review",
+                ),
+            ]
         )
 
         # Enable auto time sync for browser/MCP
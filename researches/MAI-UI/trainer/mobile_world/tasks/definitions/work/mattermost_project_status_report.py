@@ -1,13 +1,13 @@
 """Cross-platform project status aggregation - collect updates from multiple channels and generate risk-assessed report."""
 
 import re
-import time
 from datetime import datetime, timedelta
 
 from mobile_world.runtime.app_helpers import mattermost
 from mobile_world.runtime.app_helpers.fossify_calendar import (
+    calendar_event_row,
     get_calendar_events,
-    insert_calendar_event,
+    insert_calendar_events,
 )
 from mobile_world.runtime.app_helpers.mail import get_sent_email_info
 from mobile_world.runtime.app_helpers.system import time_sync_to_now
@@ -70,7 +70,6 @@ class MattermostProjectStatusReportTask(BaseTask):
 
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         mattermost.start_mattermost_backend()
-        time.sleep(5)
 
         dates = self._dates
         cli = mattermost.MattermostCLI()
@@ -158,17 +157,21 @@ class MattermostProjectStatusReportTask(BaseTask):
         )
 
         # Create calendar milestones for on-track items only
-        insert_calendar_event(
-            title="Authentication Module Complete",
-            start_time=f"{dates['milestone_1']} 09:00:00",
-            end_time=f"{dates['milestone_1']} 10:00:00",
-            description="Backend authentication milestone",
-        )
-        insert_calendar_event(
-            title="API Gateway Launch",
-            start_time=f"{dates['milestone_1']} 14:00:00",
-            end_time=f"{dates['milestone_1']} 15:00:00",
-            description="Gateway setup completion",
+        insert_calendar_events(
+            [
+                calendar_event_row(
+                    title="Authentication Module Complete",
+                    start_time=f"{dates['milestone_1']} 09:00:00",
+                    end_time=f"{dates['milestone_1']} 10:00:00",
+                    description="Backend authentication milestone",
+                ),
+                calendar_event_row(
+                    title="API Gateway Launch",
+                    start_time=f"{dates['milestone_1']} 14:00:00",
+                    end_time=f"{dates['milestone_1']} 15:00:00",
+                    description="Gateway setup completion",
+                ),
+            ]
         )
 
         if not time_sync_to_now():
@@ -1,7 +1,5 @@
 """Mattermost email task implementation - send contract via email and create calendar event."""
 
-import time
-
 from mobile_world.runtime.app_helpers import mattermost
 from mobile_world.runtime.app_helpers.system import enable_auto_time_sync
 from mobile_world.runtime.controller import AndroidController
@@ -19,7 +17,6 @@ class MattermostReadingGroupTask(BaseTask):
 
     def initialize_task_hook(self, controller: AndroidController) -> None:
         mattermost.start_mattermost_backend()
-        time.sleep(5)
         cli = mattermost.MattermostCLI()
         cli.login(mattermost.SAM_ACCOUNT["username"], mattermost.SAM_ACCOUNT["password"])
         cli.create_channel(
@@ -1,13 +1,13 @@
 """Cross-platform resource conflict resolution - identify and resolve scheduling conflicts across requests."""
 
 import re
-import time
 from datetime import datetime, timedelta
 
 from mobile_world.runtime.app_helpers import mattermost
 from mobile_world.runtime.app_helpers.fossify_calendar import (
+    calendar_event_row,
     get_calendar_events,
-    insert_calendar_event,
+    insert_calendar_events,
 )
 from mobile_world.runtime.app_helpers.mail import get_sent_email_info
 from mobile_world.runtime.app_helpers.mattermost import DEFAULT_PASSWORD, USERS
@@ -65,7 +65,6 @@ class MattermostResourceConflictResolutionTask(BaseTask):
 
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         mattermost.start_mattermost_backend()
-        time.sleep(5)
 
         dates = self._dates
         cli = mattermost.MattermostCLI()
@@ -167,18 +166,21 @@ class MattermostResourceConflictResolutionTask(BaseTask):
             ),
         )
 
-        insert_calendar_event(
-            title="Team Standup - Conf Room A",
-            start_time=f"{dates['wednesday']} 10:00:00",
-            end_time=f"{dates['wednesday']} 11:00:00",
-            description="Daily standup meeting",
-        )
-
-        insert_calendar_event(
-            title="Projector - Morning Presentation",
-            start_time=f"{dates['thursday']} 08:00:00",
-            end_time=f"{dates['thursday']} 08:30:00",
-            description="Quick presentation",
+        insert_calendar_events(
+            [
+                calendar_event_row(
+                    title="Team Standup - Conf Room A",
+                    start_time=f"{dates['wednesday']} 10:00:00",
+                    end_time=f"{dates['wednesday']} 11:00:00",
+                    description="Daily standup meeting",
+                ),
+                calendar_event_row(
+                    title="Projector - Morning Presentation",
+                    start_time=f"{dates['thursday']} 08:00:00",
+                    end_time=f"{dates['thursday']} 08:30:00",
+                    description="Quick presentation",
+                ),
+            ]
         )
 
         if not time_sync_to_now():
@@ -1,7 +1,6 @@
 """Technical debt triage task - parse complexity metrics and prioritize refactoring work."""
 
 import re
-import time
 
 from mobile_world.runtime.app_helpers import mattermost
 from mobile_world.runtime.app_helpers.mattermost import DEFAULT_PASSWORD, USERS
@@ -106,7 +105,6 @@ class MattermostTechnicalDebtTriageTask(BaseTask):
 
     def initialize_task_hook(self, controller: AndroidController) -> bool:
         mattermost.start_mattermost_backend()
-        time.sleep(5)
 
         cli = mattermost.MattermostCLI()
         cli.login(USERS["alex"], DEFAULT_PASSWORD)
@@ -272,7 +270,17 @@ class MattermostTechnicalDebtTriageTask(BaseTask):
         self._check_is_initialized()
         assert mattermost.is_mattermost_healthy()
 
-        # Check 1: SMS sent to Sarah with correct content (module name + score)
+        # the SMS, contact and channel checks read independent sources and run concurrently
+        return self.run_checks(
+            {
+                "sms_to_sarah": lambda: self._check_sms(controller),
+                "new_contact": lambda: self._check_contact(controller),
+                "summary_table": self._check_summary,
+            }
+        )
+
+    def _check_sms(self, controller: AndroidController) -> float | tuple[float, str]:
+        """Check 1: SMS sent to Sarah with correct content (module name + score)."""
         score_int = str(int(self._highest_score))
         score_str = str(self._highest_score)
 
@@ -302,8 +310,10 @@ class MattermostTechnicalDebtTriageTask(BaseTask):
                 0.0,
                 f"SMS to Sarah missing complexity score ({self._highest_score})",
             )
+        return 1.0
 
-        # Check 2: New contact created
+    def _check_contact(self, controller: AndroidController) -> float | tuple[float, str]:
+        """Check 2: New contact created."""
         contacts = get_contacts_via_adb(controller, name=self.NEW_CONTACT_NAME)
         if not contacts:
             return 0.0, f"Contact '{self.NEW_CONTACT_NAME}' not created"
@@ -323,8 +333,10 @@ class MattermostTechnicalDebtTriageTask(BaseTask):
                 f"Contact not created correctly (phone: {self.NEW_CONTACT_PHONE}, "
                 f"company: {self.NEW_CONTACT_COMPANY})",
             )
+        return 1.0
 
-        # Check 3: Summary posted in channel with markdown table AND correct sort order
+    def _check_summary(self) -> float | tuple[float, str]:
+        """Check 3: Summary posted in channel with markdown table AND correct sort order."""
         channel_info = mattermost.get_channel_info(channel_name=self.CHANNEL_NAME)
         if not channel_info:
             return 0.0, f"Channel '{self.CHANNEL_NAME}' not found"
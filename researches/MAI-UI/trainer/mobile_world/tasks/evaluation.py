@@ -0,0 +1,242 @@
+"""Evaluation engine for task verifiers.
+
+Verifiers run on one shared background event loop instead of a fresh `asyncio.run`
+per call; sync verifiers run in its worker threads. `run_checks` runs a verifier's
+independent checks concurrently, each with its own timeout, and `wait_until` polls
+a predicate for a bounded time where verifiers used to sleep a fixed delay. Every
+check's outcome and latency is recorded as a `CheckResult` for the eval response.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_CHECK_TIMEOUT = 60.0
+DEFAULT_EVAL_TIMEOUT = 240.0  # below the client's /task/eval request timeout
+DEFAULT_MAX_CONCURRENT_CHECKS = 8
+POLL_INTERVAL = 0.5
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _eval_loop() -> asyncio.AbstractEventLoop:
+    """The event loop thread verifiers run on, started on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="task-eval-loop", daemon=True).start()
+        return _loop
+
+
+def run_sync(coro: Awaitable, timeout: float | None = None) -> Any:
+    """Run a coroutine on the evaluation loop and wait for its result.
+
+    Raises:
+        TimeoutError: If it did not finish within `timeout` seconds
+    """
+    loop = _eval_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError("run_sync cannot be called from a coroutine on the evaluation loop")
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def outcome(value: Any) -> tuple[float, str | None]:
+    """Score and reason of a verifier or check return value.
+
+    `(score, reason)` tuples and numbers are scores; anything else passes if truthy.
+    """
+    if isinstance(value, tuple):
+        return float(value[0]), value[1] if len(value) > 1 else None
+    if isinstance(value, bool) or value is None:
+        return float(bool(value)), None
+    if isinstance(value, int | float):
+        return float(value), None
+    return float(bool(value)), None
+
+
+@dataclass
+class Check:
+    """An independent verification step.
+
+    Args:
+        name: name reported in the eval response
+        func: sync or async callable without arguments; returns a score, a
+            `(score, reason)` tuple or a truthy value on success
+        timeout: seconds after which the check fails
+        settle: seconds a failing check is retried for, while the change it checks
+            for may still be landing
+        refresh: called before each retry to drop state cached by the previous
+            attempt, e.g. the device snapshot
+    """
+
+    name: str
+    func: Callable[[], Any]
+    timeout: float = DEFAULT_CHECK_TIMEOUT
+    settle: float = 0.0
+    refresh: Callable[[], Any] | None = None
+
+
+@dataclass
+class CheckResult:
+    name: str
+    score: float
+    reason: str | None = None
+    seconds: float = 0.0
+    attempts: int = 1
+    timed_out: bool = False
+    error: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return self.score >= 1.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "seconds": round(self.seconds, 3)}
+
+
+@dataclass
+class EvalReport:
+    """Result of `BaseTask.evaluate`."""
+
+    score: float
+    reason: str | None = None
+    seconds: float = 0.0
+    attempts: int = 1
+    checks: list[CheckResult] = field(default_factory=list)
+
+    def to_response(self) -> dict:
+        content = {
+            "score": self.score,
+            "eval_seconds": round(self.seconds, 3),
+            "attempts": self.attempts,
+            "checks": [check.to_dict() for check in self.checks],
+        }
+        if self.reason is not None:
+            content["reason"] = self.reason
+        return content
+
+
+async def _call(func: Callable[[], Any]) -> Any:
+    if inspect.iscoroutinefunction(func):
+        return await func()
+    result = await asyncio.to_thread(func)
+    return await result if inspect.isawaitable(result) else result
+
+
+async def wait_until_async(
+    predicate: Callable[[], Any],
+    timeout: float,
+    interval: float = POLL_INTERVAL,
+    refresh: Callable[[], Any] | None = None,
+) -> tuple[Any, int]:
+    """Evaluate `predicate` until it is truthy or `timeout` seconds have passed.
+
+    The predicate is evaluated at least once, and once more at the deadline.
+    `refresh`, if given, is called before every re-evaluation so the predicate does
+    not read state cached by the previous one.
+
+    Returns:
+        the last value and the number of evaluations
+    """
+    deadline = time.monotonic() + timeout
+    attempts = 0
+    while True:
+        attempts += 1
+        value = await _call(predicate)
+        remaining = deadline - time.monotonic()
+        if outcome(value)[0] >= 1.0 or remaining <= 0:
+            return value, attempts
+        await asyncio.sleep(min(interval, remaining))
+        if refresh is not None:
+            await _call(refresh)
+
+
+def wait_until(
+    predicate: Callable[[], Any],
+    timeout: float,
+    interval: float = POLL_INTERVAL,
+    refresh: Callable[[], Any] | None = None,
+) -> Any:
+    """Sync `wait_until_async` for use inside verifiers and hooks; returns the last value."""
+    deadline = time.monotonic() + timeout
+    while True:
+        value = predicate()
+        remaining = deadline - time.monotonic()
+        if outcome(value)[0] >= 1.0 or remaining <= 0:
+            return value
+        time.sleep(min(interval, remaining))
+        if refresh is not None:
+            refresh()
+
+
+async def _run_check(check: Check, semaphore: asyncio.Semaphore) -> CheckResult:
+    async with semaphore:
+        start = time.monotonic()
+        attempts = 0
+        try:
+            value, attempts = await asyncio.wait_for(
+                wait_until_async(check.func, check.settle, refresh=check.refresh),
+                timeout=check.timeout,
+            )
+            score, reason = outcome(value)
+            result = CheckResult(check.name, score, reason, attempts=attempts)
+        except TimeoutError:
+            result = CheckResult(
+                check.name,
+                0.0,
+                f"Check '{check.name}' timed out after {check.timeout}s",
+                attempts=max(attempts, 1),
+                timed_out=True,
+            )
+        except Exception as e:
+            logger.exception(f"Check '{check.name}' failed")
+            result = CheckResult(
+                check.name, 0.0, f"Check '{check.name}' raised: {e}", error=repr(e)
+            )
+        result.seconds = time.monotonic() - start
+        logger.debug(
+            f"Check '{check.name}': score={result.score} in {result.seconds:.2f}s "
+            f"({result.attempts} attempt(s))"
+        )
+        return result
+
+
+async def run_checks_async(
+    checks: list[Check], max_concurrency: int = DEFAULT_MAX_CONCURRENT_CHECKS
+) -> list[CheckResult]:
+    """Run checks concurrently; results are in the order of `checks`."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    return list(await asyncio.gather(*(_run_check(check, semaphore) for check in checks)))
+
+
+def run_checks(
+    checks: list[Check], max_concurrency: int = DEFAULT_MAX_CONCURRENT_CHECKS
+) -> list[CheckResult]:
+    """Sync `run_checks_async`, usable from sync verifiers."""
+    return run_sync(run_checks_async(checks, max_concurrency))
+
+
+def combine(results: list[CheckResult]) -> float | tuple[float, str]:
+    """Verifier outcome of checks that must all pass: the first failure in order, else 1.0."""
+    for result in results:
+        if not result.passed:
+            return result.score, result.reason or f"Check '{result.name}' failed"
+    return 1.0
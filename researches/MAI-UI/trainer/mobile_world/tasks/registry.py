@@ -1,34 +1,118 @@
+import hashlib
 import importlib.util
 import inspect
+import json
 import os
+import threading
 from pathlib import Path
 
 from loguru import logger
 
 import mobile_world
 
+# Bump when the manifest entry format or the derivation of its fields changes
+MANIFEST_VERSION = 2
+MANIFEST_PATH_ENV = "MOBILE_WORLD_TASK_MANIFEST"
+MANIFEST_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"), "mobile_world")
+
 
 class TaskRegistry:
+    """Registry of the task classes in a task definitions directory.
+
+    Listing tasks and reading their metadata (tags, apps, goal, snapshot tag,
+    requirements) is answered from a manifest cached on disk, without importing the
+    task modules. A task module is imported the first time one of its tasks is
+    requested with `get_task`.
+
+    The manifest records the mtime and size of every task file; files that changed,
+    were added or removed since are re-scanned on construction. A change to any other
+    module of the `mobile_world` package (e.g. `tasks/base.py`, which derives the
+    requirements, or an app helper a task imports) rebuilds the whole manifest.
+    """
+
     _scan_logged: set[str] = set()
 
-    def __init__(self, task_set_path: str | None = None):
+    def __init__(self, task_set_path: str | None = None, manifest_path: str | None = None):
         """
-        Initialize TaskRegistry and automatically scan for tasks.
+        Initialize TaskRegistry from the manifest, re-scanning changed task files.
 
         Args:
             task_set_path: Path to the directory containing task files.
                           If None, uses the installed mobile_world package path.
+            manifest_path: Path of the manifest cache file. If None, uses
+                          $MOBILE_WORLD_TASK_MANIFEST or a file in ~/.cache/mobile_world.
         """
-        self.tasks: dict[str, object] = {}
+        self._tasks: dict[str, object] = {}
+        self._loaded_files: set[Path] = set()
+        self._failed_files: set[Path] = set()  # files with a task that failed to instantiate
+        self._lock = threading.RLock()
         if task_set_path is None:
             package_path = Path(mobile_world.__file__).parent
             self.task_set_path = str(package_path / "tasks" / "definitions")
         else:
             self.task_set_path = task_set_path
-        self._scan_and_register_tasks()
+        self.manifest_path = Path(manifest_path or self._default_manifest_path())
+        self._entries: dict[str, dict] = {}
+        self._sync_manifest()
+
+    def _default_manifest_path(self) -> Path:
+        if os.environ.get(MANIFEST_PATH_ENV):
+            return Path(os.environ[MANIFEST_PATH_ENV])
+        digest = hashlib.sha1(os.path.abspath(self.task_set_path).encode()).hexdigest()[:12]
+        return MANIFEST_CACHE_DIR / f"task_manifest-{digest}.json"
+
+    def _task_files(self) -> list[Path]:
+        return [
+            file_path
+            for file_path in Path(self.task_set_path).rglob("*.py")
+            if file_path.name != "__init__.py"
+        ]
+
+    def _package_stamp(self) -> str:
+        """Digest of the mtime and size of the package modules outside the task files."""
+        package_path = Path(os.path.abspath(mobile_world.__file__)).parent
+        task_set_path = Path(os.path.abspath(self.task_set_path))
+        digest = hashlib.sha1()
+        for file_path in sorted(package_path.rglob("*.py")):
+            if file_path.is_relative_to(task_set_path):
+                continue
+            stat = file_path.stat()
+            digest.update(
+                f"{file_path.relative_to(package_path)}:{stat.st_mtime}:{stat.st_size}\n".encode()
+            )
+        return digest.hexdigest()
+
+    def _read_manifest(self, base_stamp: str) -> dict[str, dict]:
+        """File records of the cached manifest, or {} if missing or outdated."""
+        try:
+            manifest = json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if (
+            manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("task_set_path") != os.path.abspath(self.task_set_path)
+            or manifest.get("base_stamp") != base_stamp
+        ):
+            return {}
+        return manifest.get("files", {})
+
+    def _write_manifest(self, files: dict[str, dict], base_stamp: str) -> None:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "task_set_path": os.path.abspath(self.task_set_path),
+            "base_stamp": base_stamp,
+            "files": files,
+        }
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(manifest, indent=1))
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Could not write task manifest {self.manifest_path}: {e}")
 
-    def _scan_and_register_tasks(self):
-        """Recursively scan the task_set directory and register all tasks."""
+    def _sync_manifest(self):
+        """Load the manifest and re-scan the task files that changed since it was written."""
         should_log = self.task_set_path not in TaskRegistry._scan_logged
         if should_log:
             TaskRegistry._scan_logged.add(self.task_set_path)
@@ -38,55 +122,116 @@ class TaskRegistry:
             logger.warning(f"Task directory not found: {self.task_set_path}")
             return
 
-        task_files = list(Path(self.task_set_path).rglob("*.py"))
+        base_stamp = self._package_stamp()
+        cached_files = self._read_manifest(base_stamp)
 
-        for file_path in task_files:
-            if file_path.name == "__init__.py":
-                continue
+        files: dict[str, dict] = {}
+        rescanned = 0
+        for file_path in self._task_files():
+            relative_path = str(file_path.relative_to(self.task_set_path))
+            stat = file_path.stat()
+            record = cached_files.get(relative_path)
+            if (
+                record is None
+                or record.get("failed")
+                or [record["mtime"], record["size"]] != [stat.st_mtime, stat.st_size]
+            ):
+                tasks = self._load_tasks_from_file(file_path)
+                record = {
+                    "mtime": stat.st_mtime,
+                    "size": stat.st_size,
+                    # files that failed to import or instantiate are scanned again next time
+                    "failed": tasks is None or file_path in self._failed_files,
+                    "tasks": [self._task_entry(task, relative_path) for task in tasks or []],
+                }
+                rescanned += 1
+            files[relative_path] = record
 
-            self._load_tasks_from_file(file_path)
+        for record in files.values():
+            for entry in record["tasks"]:
+                if entry["name"] in self._entries:
+                    logger.warning(
+                        f"Task '{entry['name']}' already registered. Overwriting with "
+                        f"instance from {entry['file']}"
+                    )
+                self._entries[entry["name"]] = entry
+
+        if rescanned or files.keys() != cached_files.keys():
+            self._write_manifest(files, base_stamp)
 
         if should_log:
-            logger.info(f"Task registration complete. Total tasks registered: {len(self.tasks)}")
-            logger.info(f"Registered tasks: {list(self.tasks.keys())}")
+            logger.info(
+                f"Task registration complete. Total tasks registered: {len(self._entries)} "
+                f"({rescanned} of {len(files)} files scanned, rest from {self.manifest_path})"
+            )
+            logger.info(f"Registered tasks: {list(self._entries.keys())}")
+
+    @staticmethod
+    def _task_entry(task, relative_path: str) -> dict:
+        """Manifest entry of a task instance."""
+        goal_attr = inspect.getattr_static(type(task), "goal", None)
+        # goals computed at runtime (properties, set in __init__) are read from the task
+        static_goal = isinstance(goal_attr, str) and "goal" not in vars(task)
+        return {
+            "name": task.name,
+            "tags": sorted(task.task_tags) if task.task_tags else [],
+            "apps": sorted(task.app_names) if task.app_names else [],
+            "goal": task.goal if static_goal else None,
+            "snapshot_tag": task.snapshot_tag,
+            "complexity": getattr(task, "complexity", None),
+            "requirements": task.requirements,
+            "file": relative_path,
+        }
 
-    def _load_tasks_from_file(self, file_path: Path):
+    def _load_tasks_from_file(self, file_path: Path) -> list | None:
         """
-        Load and register tasks from a single Python file.
+        Import a task file and register its tasks.
 
         Args:
             file_path: Path to the Python file
+
+        Returns:
+            The task instances defined in the file, None if it could not be imported
         """
-        try:
-            module_name = str(file_path.with_suffix("")).replace(os.sep, ".")
+        with self._lock:
+            if file_path in self._loaded_files:
+                return [t for t in self._tasks.values() if t.__module__ == _module_name(file_path)]
+            self._loaded_files.add(file_path)
+            try:
+                module_name = _module_name(file_path)
 
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            if spec is None or spec.loader is None:
-                logger.warning(f"Could not load spec for file: {file_path}")
-                return
+                spec = importlib.util.spec_from_file_location(module_name, file_path)
+                if spec is None or spec.loader is None:
+                    logger.warning(f"Could not load spec for file: {file_path}")
+                    return None
 
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
 
-            self._register_tasks_from_module(module, file_path)
+                return self._register_tasks_from_module(module, file_path)
 
-        except Exception as e:
-            logger.error(f"Error loading tasks from {file_path}: {e}", exc_info=True)
+            except Exception as e:
+                logger.error(f"Error loading tasks from {file_path}: {e}", exc_info=True)
+                return None
 
-    def _register_tasks_from_module(self, module, file_path: Path):
+    def _register_tasks_from_module(self, module, file_path: Path) -> list:
         """
         Register all BaseTask subclasses from a module.
 
         Args:
             module: The loaded Python module
             file_path: Path to the source file (for logging)
+
+        Returns:
+            The registered task instances
         """
         try:
             from mobile_world.tasks.base import BaseTask
         except ImportError:
             logger.error("Could not import BaseTask. Please ensure it exists.")
-            return
+            return []
 
+        registered = []
         for name, obj in inspect.getmembers(module, inspect.isclass):
             if (
                 issubclass(obj, BaseTask)
@@ -95,24 +240,27 @@ class TaskRegistry:
             ):
                 try:
                     task_instance = obj()
-                    task_name = obj.__name__
-
-                    if task_name in self.tasks:
-                        logger.warning(
-                            f"Task '{task_name}' already registered. Overwriting with instance from {file_path}"
-                        )
-
-                    self.tasks[task_name] = task_instance
+                    self._tasks[obj.__name__] = task_instance
+                    registered.append(task_instance)
 
                 except Exception as e:
+                    self._failed_files.add(file_path)
                     logger.error(
                         f"Error instantiating task '{name}' from {file_path}: {e}",
                         exc_info=True,
                     )
+        return registered
+
+    @property
+    def tasks(self) -> dict[str, object]:
+        """All task instances by name; imports every task module."""
+        for task_name in self._entries:
+            self.get_task(task_name)
+        return {name: self._tasks[name] for name in self._entries if name in self._tasks}
 
     def get_task(self, task_name: str):
         """
-        Retrieve a task by name.
+        Retrieve a task by name, importing its module on first use.
 
         Args:
             task_name: Name of the task class
@@ -123,18 +271,53 @@ class TaskRegistry:
         Raises:
             KeyError: If task is not found
         """
-        if task_name not in self.tasks:
+        if task_name not in self._tasks and task_name in self._entries:
+            file_path = Path(self.task_set_path) / self._entries[task_name]["file"]
+            self._load_tasks_from_file(file_path)
+
+        if task_name not in self._tasks:
             logger.error(
-                f"Task '{task_name}' not found. Available tasks: {list(self.tasks.keys())}"
+                f"Task '{task_name}' not found. Available tasks: {list(self._entries.keys())}"
             )
             raise KeyError(f"Task '{task_name}' not found in registry")
 
-        return self.tasks[task_name]
+        return self._tasks[task_name]
+
+    def get_metadata(self, task_name: str) -> dict:
+        """
+        Manifest entry of a task, without importing it.
+
+        Args:
+            task_name: Name of the task class
+
+        Returns:
+            dict with name, tags, apps, goal (None if computed at runtime),
+            snapshot_tag, complexity, requirements and file
+
+        Raises:
+            KeyError: If task is not found
+        """
+        if task_name not in self._entries:
+            raise KeyError(f"Task '{task_name}' not found in registry")
+        return dict(self._entries[task_name])
+
+    def list_metadata(self) -> list[dict]:
+        """Manifest entries of all registered tasks."""
+        return [dict(entry) for entry in self._entries.values()]
+
+    def get_goal(self, task_name: str) -> str:
+        """Goal of a task; only imports the task if its goal is computed at runtime."""
+        goal = self.get_metadata(task_name)["goal"]
+        return goal if goal is not None else self.get_task(task_name).goal
 
     def list_tasks(self) -> list:
         """Return a list of all registered task names."""
-        return list(self.tasks.keys())
+        return list(self._entries.keys())
 
     def has_task(self, task_name: str) -> bool:
         """Check if a task is registered."""
-        return task_name in self.tasks
+        return task_name in self._entries
+
+
+def _module_name(file_path: Path) -> str:
+    return str(file_path.with_suffix("")).replace(os.sep, ".")